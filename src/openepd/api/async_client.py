@@ -0,0 +1,149 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+__all__ = ("OpenEpdApiClientAsync",)
+
+from requests.auth import AuthBase
+
+from openepd.api.average_dataset.generic_estimate_async_api import AsyncGenericEstimateApi
+from openepd.api.average_dataset.industry_epd_async_api import AsyncIndustryEpdApi
+from openepd.api.base_async_client import AsyncHttpClient, AsyncRetryHandler
+from openepd.api.base_sync_client import ErrorHandler, TokenAuth
+from openepd.api.cache import HttpCache
+from openepd.api.category.async_api import AsyncCategoryApi
+from openepd.api.common import AdaptiveRateController
+from openepd.api.epd.async_api import AsyncEpdApi
+from openepd.api.org.async_api import AsyncOrgApi
+from openepd.api.pcr.async_api import AsyncPcrApi
+from openepd.api.plant.async_api import AsyncPlantApi
+from openepd.api.standard.async_api import AsyncStandardApi
+
+
+class OpenEpdApiClientAsync:
+    """
+    Asynchronous API client for OpenEPD.
+
+    Method groups mirror the ones of `OpenEpdApiClientSync`, but the methods are coroutines. Many requests could be
+    in flight at once, e.g. gathered with `asyncio.gather`, they share the connection pool and the throttling of the
+    client. The client should be closed when no longer needed, or used as an async context manager:
+
+        async with OpenEpdApiClientAsync("https://openepd.buildingtransparency.org/api", "<token>") as client:
+            epd = await client.epds.get_by_openxpd_uuid("ec3b9j5t")
+    """
+
+    def __init__(self, base_url: str, auth_token: str | None, **kwargs) -> None:
+        """
+        Construct an API client.
+
+        :param base_url: base URL of the API
+        :param auth_token: authentication token
+        :param kwargs: additional arguments to pass to the HTTP client. See AsyncHttpClient constructor for details.
+        """
+        super().__init__()
+        auth: AuthBase | None = TokenAuth(auth_token) if auth_token is not None else None
+        self._http_client = AsyncHttpClient(base_url, auth=auth, **kwargs)
+        # Method groups are created upfront, so that all threads use the same instances and share their state
+        self.__epd_api = AsyncEpdApi(self._http_client)
+        self.__pcr_api = AsyncPcrApi(self._http_client)
+        self.__org_api = AsyncOrgApi(self._http_client)
+        self.__plant_api = AsyncPlantApi(self._http_client)
+        self.__standard_api = AsyncStandardApi(self._http_client)
+        self.__category_api = AsyncCategoryApi(self._http_client)
+        self.__generic_estimate_api = AsyncGenericEstimateApi(self._http_client)
+        self.__industry_epd_api = AsyncIndustryEpdApi(self._http_client)
+
+    async def __aenter__(self) -> "OpenEpdApiClientAsync":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close idle connections of the client."""
+        await self._http_client.close()
+
+    @property
+    def http_cache(self) -> HttpCache | None:
+        """Cache of the responses if enabled with `cache` argument, e.g. to get the statistics."""
+        return self._http_client.cache
+
+    @property
+    def rate_controller(self) -> AdaptiveRateController | None:
+        """Controller of the adaptive rate if enabled with `adaptive_rate` argument, e.g. to get the current limits."""
+        return self._http_client.rate_controller
+
+    @property
+    def epds(self) -> AsyncEpdApi:
+        """Get the EPD API."""
+        return self.__epd_api
+
+    @property
+    def pcrs(self) -> AsyncPcrApi:
+        """Get the PCR API."""
+        return self.__pcr_api
+
+    @property
+    def orgs(self) -> AsyncOrgApi:
+        """Get the Org API."""
+        return self.__org_api
+
+    @property
+    def plants(self) -> AsyncPlantApi:
+        """Get the Plant API."""
+        return self.__plant_api
+
+    @property
+    def standards(self) -> AsyncStandardApi:
+        """Get the Standard API."""
+        return self.__standard_api
+
+    @property
+    def categories(self) -> AsyncCategoryApi:
+        """Get the Category API."""
+        return self.__category_api
+
+    @property
+    def industry_epds(self) -> AsyncIndustryEpdApi:
+        """Get the Category API."""
+        return self.__industry_epd_api
+
+    @property
+    def generic_estimates(self) -> AsyncGenericEstimateApi:
+        """Get the GE API."""
+        return self.__generic_estimate_api
+
+    def set_error_handler(self, http_status_code: int, error_handler: ErrorHandler | None) -> None:
+        """
+        Register a custom error handler for a specific HTTP status code.
+
+        If ``error_handler`` is not ``None``, it will be registered for the given status code. If ``None`` is provided,
+        the method does nothing and does not remove any existing handler.
+
+        :param http_status_code: HTTP status code for which to register the error handler.
+        :param error_handler: Callable to handle the error, or ``None`` to skip registration.
+        """
+        self._http_client.register_error_handler(http_status_code, error_handler)
+
+    def set_retry_handler(self, http_status_code: int, retry_handler: AsyncRetryHandler | None) -> None:
+        """
+        Register a custom retry handler for a specific HTTP status code.
+
+        The handler is a coroutine function which receives a coroutine function repeating the request, and returns
+        the new response or ``None`` to keep the original one. ``None`` handler is ignored.
+
+        :param http_status_code: HTTP status code for which to register the retry handler.
+        :param retry_handler: Coroutine function to retry the request, or ``None`` to skip registration.
+        """
+        self._http_client.register_retry_handler(http_status_code, retry_handler)
@@ -13,15 +13,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from collections.abc import Iterable
 from typing import Literal, TypeAlias, overload
 import warnings
 
 from requests import Response
 
 from openepd.api.base_sync_client import BaseApiMethodGroup
-from openepd.api.common import StreamingListResponse, paging_meta_from_v1_api
+from openepd.api.common import BatchGetResult, StreamingListResponse, paging_meta_from_v1_api
 from openepd.api.dto.common import BaseMeta, OpenEpdApiResponse
 from openepd.api.dto.meta import PagingMetaMixin
+from openepd.api.metrics import instrument_method_group
 from openepd.api.utils import encode_path_param, remove_none_id_fields
 from openepd.model.generic_estimate import (
     GenericEstimate,
@@ -31,6 +33,7 @@ from openepd.model.generic_estimate import (
 )
 
 
+@instrument_method_group
 class GenericEstimateApi(BaseApiMethodGroup):
     """API methods for Generic Estimates."""
 
@@ -54,6 +57,19 @@ class GenericEstimateApi(BaseApiMethodGroup):
             return GenericEstimate.parse_obj(response.json()), response
         return GenericEstimate.parse_obj(response.json())
 
+    def get_many(self, uuids: Iterable[str], concurrency: int = 8) -> dict[str, BatchGetResult[GenericEstimate]]:
+        """
+        Get Generic Estimates by OpenEPD UUIDs.
+
+        UUIDs are fetched concurrently within the throttling limits of the client. Duplicates are fetched once, and
+        the objects being fetched by concurrent callers are not requested again.
+
+        :param uuids: OpenEPD UUIDs
+        :param concurrency: maximal number of requests in flight
+        :return: mapping of UUID to the result, holding either the object or the error, e.g. `ObjectNotFound`
+        """
+        return self._get_many(uuids, self.get_by_uuid, concurrency)
+
     @overload
     def get_by_openxpd_uuid(self, uuid: str, with_response: Literal[True]) -> tuple[GenericEstimate, Response]: ...
 
@@ -208,11 +224,15 @@ class GenericEstimateApi(BaseApiMethodGroup):
             return data, response
         return data
 
-    def list(self, page_size: int | None = None) -> StreamingListResponse[GenericEstimatePreview]:
+    def list(
+        self, page_size: int | None = None, prefetch_pages: int = 0, concurrency: int = 1
+    ) -> StreamingListResponse[GenericEstimatePreview]:
         """
         List GenericEstimates.
 
         :param page_size: page size, None for default
+        :param prefetch_pages: number of pages fetched in background during iteration, see `StreamingListResponse`
+        :param concurrency: number of pages fetched concurrently during iteration, see `StreamingListResponse`
         :return: streaming list of GEs
         """
 
@@ -222,7 +242,9 @@ class GenericEstimateApi(BaseApiMethodGroup):
                 payload=data_list, meta=GenericEstimateSearchMeta(paging=paging_meta_from_v1_api(response))
             )
 
-        return StreamingListResponse[GenericEstimatePreview](_get_page, page_size=page_size)
+        return StreamingListResponse[GenericEstimatePreview](
+            _get_page, page_size=page_size, prefetch_pages=prefetch_pages, concurrency=concurrency
+        )
 
 
 class GenericEstimateSearchMeta(PagingMetaMixin, BaseMeta):
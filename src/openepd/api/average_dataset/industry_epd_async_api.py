@@ -0,0 +1,182 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# NB! This is a generated code. Do not edit it manually. Please see tools/openepd/codegen/generate_async_api.py
+
+
+from collections.abc import Iterable
+from typing import Literal, overload
+
+from requests import Response
+
+from openepd.api.average_dataset.industry_epd_sync_api import IndustryEpdListResponse, IndustryEpdSearchMeta
+from openepd.api.base_async_client import AsyncBaseApiMethodGroup
+from openepd.api.common import AsyncStreamingListResponse, BatchGetResult, paging_meta_from_v1_api
+from openepd.api.metrics import instrument_method_group
+from openepd.api.utils import encode_path_param
+from openepd.model.industry_epd import IndustryEpd, IndustryEpdPreview, IndustryEpdRef
+
+
+@instrument_method_group
+class AsyncIndustryEpdApi(AsyncBaseApiMethodGroup):
+    """Asynchronous API methods for Industry EPD."""
+
+    @overload
+    async def get_by_openxpd_uuid(self, uuid: str, with_response: Literal[True]) -> tuple[IndustryEpd, Response]: ...
+
+    @overload
+    async def get_by_openxpd_uuid(self, uuid: str, with_response: Literal[False] = False) -> IndustryEpd: ...
+
+    async def get_by_openxpd_uuid(
+        self, uuid: str, with_response: bool = False
+    ) -> IndustryEpd | tuple[IndustryEpd, Response]:
+        """
+        Get Industry EPD by OpenEPD UUID.
+
+        :param uuid: OpenEPD UUID
+        :param with_response: whether to return just object or with response
+        :return: IEPD or IEPD with response depending on param with_response
+        :raise ObjectNotFound: if Industry EPD is not found
+        """
+        response = await self._client.do_request("get", f"/industry_epds/{uuid}")
+        if with_response:
+            return IndustryEpd.parse_obj(response.json()), response
+        return IndustryEpd.parse_obj(response.json())
+
+    async def get_many(self, uuids: Iterable[str], concurrency: int = 8) -> dict[str, BatchGetResult[IndustryEpd]]:
+        """
+        Get Industry EPDs by OpenEPD UUIDs.
+
+        UUIDs are fetched concurrently within the throttling limits of the client. Duplicates are fetched once, and
+        the objects being fetched by concurrent callers are not requested again.
+
+        :param uuids: OpenEPD UUIDs
+        :param concurrency: maximal number of requests in flight
+        :return: mapping of UUID to the result, holding either the object or the error, e.g. `ObjectNotFound`
+        """
+        return await self._get_many(uuids, self.get_by_openxpd_uuid, concurrency)
+
+    @overload
+    async def create(self, iepd: IndustryEpd, with_response: Literal[True]) -> tuple[IndustryEpdRef, Response]: ...
+
+    @overload
+    async def create(self, iepd: IndustryEpd, with_response: Literal[False] = False) -> IndustryEpdRef: ...
+
+    async def create(
+        self, iepd: IndustryEpd, with_response: bool = False
+    ) -> IndustryEpdRef | tuple[IndustryEpdRef, Response]:
+        """
+        Create an Industry EPD.
+
+        :param iepd: Industry EPD
+        :param with_response: return the response object together with the EPD
+        :return: Industry EPD or Industry EPD with HTTP Response object depending on parameter
+        """
+        response = await self._client.do_request(
+            "post",
+            "/industry_epds",
+            json=iepd.to_serializable(exclude_unset=True, exclude_defaults=True, by_alias=True),
+        )
+        content = response.json()
+        if with_response:
+            return IndustryEpdRef.parse_obj(content), response
+        return IndustryEpdRef.parse_obj(content)
+
+    @overload
+    async def edit(self, iepd: IndustryEpd, with_response: Literal[True]) -> tuple[IndustryEpdRef, Response]: ...
+
+    @overload
+    async def edit(self, iepd: IndustryEpd, with_response: Literal[False] = False) -> IndustryEpdRef: ...
+
+    async def edit(
+        self, iepd: IndustryEpd, with_response: bool = False
+    ) -> IndustryEpdRef | tuple[IndustryEpdRef, Response]:
+        """
+        Edit an Industr EPD.
+
+        :param iepd: IndustryEpd
+        :param with_response: return the response object together with the IEPD
+        :return: IEPD or IEPD with HTTP Response object depending on parameter
+        """
+        iepd_id = iepd.id
+        if not iepd_id:
+            msg = "The ID must be set to edit a IndustryEpd."
+            raise ValueError(msg)
+
+        response = await self._client.do_request(
+            "put",
+            f"/industry_epds/{encode_path_param(iepd_id)}",
+            json=iepd.to_serializable(exclude_unset=True, exclude_defaults=True, by_alias=True),
+        )
+        content = response.json()
+        if with_response:
+            return IndustryEpdRef.parse_obj(content), response
+        return IndustryEpdRef.parse_obj(content)
+
+    @overload
+    async def list_raw(
+        self, page_num: int, page_size: int, with_response: Literal[False] = False
+    ) -> list[IndustryEpdPreview]: ...
+
+    @overload
+    async def list_raw(
+        self, page_num: int, page_size: int, with_response: Literal[True]
+    ) -> tuple[list[IndustryEpdPreview], Response]: ...
+
+    async def list_raw(
+        self, page_num: int = 1, page_size: int = 10, with_response: bool = False
+    ) -> list[IndustryEpdPreview] | tuple[list[IndustryEpdPreview], Response]:
+        """
+        List industry epds.
+
+        :param page_num: page number
+        :param page_size: page size
+        :param with_response: whether to return just object or with response
+        :return: list of IEPDs or list of IEPDs with response depending on param with_response
+        """
+        response = await self._client.do_request(
+            "get",
+            "/industry_epds",
+            params=dict(
+                page_number=page_num,
+                page_size=page_size,
+            ),
+        )
+        data = [IndustryEpdPreview.parse_obj(o) for o in response.json()]
+        if with_response:
+            return data, response
+        return data
+
+    def list(
+        self, page_size: int | None = None, prefetch_pages: int = 0, concurrency: int = 1
+    ) -> AsyncStreamingListResponse[IndustryEpdPreview]:
+        """
+        List IndustryEpds.
+
+        :param page_size: page size, None for default
+        :param prefetch_pages: number of pages fetched in background during iteration, see `AsyncStreamingListResponse`
+        :param concurrency: number of pages fetched concurrently during iteration, see `AsyncStreamingListResponse`
+        :return: streaming list of IEPDs
+        """
+
+        async def _get_page(p_num: int, p_size: int) -> IndustryEpdListResponse:
+            data_list, response = await self.list_raw(page_num=p_num, page_size=p_size, with_response=True)
+            return IndustryEpdListResponse(
+                payload=data_list, meta=IndustryEpdSearchMeta(paging=paging_meta_from_v1_api(response))
+            )
+
+        return AsyncStreamingListResponse[IndustryEpdPreview](
+            _get_page, page_size=page_size, prefetch_pages=prefetch_pages, concurrency=concurrency
+        )
@@ -13,18 +13,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from collections.abc import Iterable
 from typing import Literal, TypeAlias, overload
 
 from requests import Response
 
 from openepd.api.base_sync_client import BaseApiMethodGroup
-from openepd.api.common import StreamingListResponse, paging_meta_from_v1_api
+from openepd.api.common import BatchGetResult, StreamingListResponse, paging_meta_from_v1_api
 from openepd.api.dto.common import BaseMeta, OpenEpdApiResponse
 from openepd.api.dto.meta import PagingMetaMixin
+from openepd.api.metrics import instrument_method_group
 from openepd.api.utils import encode_path_param
 from openepd.model.industry_epd import IndustryEpd, IndustryEpdPreview, IndustryEpdRef
 
 
+@instrument_method_group
 class IndustryEpdApi(BaseApiMethodGroup):
     """API methods for Industry EPD."""
 
@@ -48,6 +51,19 @@ class IndustryEpdApi(BaseApiMethodGroup):
             return IndustryEpd.parse_obj(response.json()), response
         return IndustryEpd.parse_obj(response.json())
 
+    def get_many(self, uuids: Iterable[str], concurrency: int = 8) -> dict[str, BatchGetResult[IndustryEpd]]:
+        """
+        Get Industry EPDs by OpenEPD UUIDs.
+
+        UUIDs are fetched concurrently within the throttling limits of the client. Duplicates are fetched once, and
+        the objects being fetched by concurrent callers are not requested again.
+
+        :param uuids: OpenEPD UUIDs
+        :param concurrency: maximal number of requests in flight
+        :return: mapping of UUID to the result, holding either the object or the error, e.g. `ObjectNotFound`
+        """
+        return self._get_many(uuids, self.get_by_openxpd_uuid, concurrency)
+
     @overload
     def create(self, iepd: IndustryEpd, with_response: Literal[True]) -> tuple[IndustryEpdRef, Response]: ...
 
@@ -137,11 +153,15 @@ class IndustryEpdApi(BaseApiMethodGroup):
             return data, response
         return data
 
-    def list(self, page_size: int | None = None) -> StreamingListResponse[IndustryEpdPreview]:
+    def list(
+        self, page_size: int | None = None, prefetch_pages: int = 0, concurrency: int = 1
+    ) -> StreamingListResponse[IndustryEpdPreview]:
         """
         List IndustryEpds.
 
         :param page_size: page size, None for default
+        :param prefetch_pages: number of pages fetched in background during iteration, see `StreamingListResponse`
+        :param concurrency: number of pages fetched concurrently during iteration, see `StreamingListResponse`
         :return: streaming list of IEPDs
         """
 
@@ -151,7 +171,9 @@ class IndustryEpdApi(BaseApiMethodGroup):
                 payload=data_list, meta=IndustryEpdSearchMeta(paging=paging_meta_from_v1_api(response))
             )
 
-        return StreamingListResponse[IndustryEpdPreview](_get_page, page_size=page_size)
+        return StreamingListResponse[IndustryEpdPreview](
+            _get_page, page_size=page_size, prefetch_pages=prefetch_pages, concurrency=concurrency
+        )
 
 
 class IndustryEpdSearchMeta(PagingMetaMixin, BaseMeta):
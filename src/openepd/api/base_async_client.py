@@ -0,0 +1,607 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+__all__ = (
+    "AsyncBaseApiMethodGroup",
+    "AsyncDoRequest",
+    "AsyncHttpClient",
+    "AsyncRetryHandler",
+)
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+import datetime
+from functools import partial, wraps
+import logging
+from os import PathLike
+import random
+import ssl
+import time
+from typing import Final, TypeVar
+
+import httpx
+import requests
+from requests import PreparedRequest, Response, Timeout
+from requests import codes as requests_codes
+from requests.auth import AuthBase
+from requests.structures import CaseInsensitiveDict
+from requests.utils import default_user_agent, get_encoding_from_headers
+
+from openepd.api.base_sync_client import DefaultOpenApiErrorHandlers, ErrorHandler
+from openepd.api.cache import CachedResponse, HttpCache, get_cache_key
+from openepd.api.common import (
+    AdaptiveRateController,
+    AsyncSingleFlight,
+    AsyncThrottler,
+    BatchGetResult,
+    get_retry_after_seconds,
+    no_trailing_slash,
+)
+from openepd.api.metrics import (
+    MetricsSink,
+    RequestTrace,
+    current_request_trace,
+    report_request,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+AsyncDoRequest = Callable[[], Awaitable[Response]]
+AsyncRetryHandler = Callable[[AsyncDoRequest], Awaitable[Response | None]]
+
+# Methods which could be repeated without changing the result, same as the default of urllib3 retries
+_IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"})
+
+
+class AsyncHttpClient:
+    """
+    Asynchronous HTTP client to communicate with OpenEPD servers via HTTP.
+
+    It is an asyncio counterpart of `SyncHttpClient` with the same throttling, retries and error handling. Requests
+    are sent by httpx library (``api_client_async`` extra), but prepared by requests library, so the same
+    authentication classes could be used, and the results are regular `requests.Response` objects with the content
+    already read. Connections are kept alive and pooled, the number of requests in flight is limited by
+    `max_connections`. Like requests, the client follows redirects and takes the proxies and CA bundle from the
+    environment unless they are given explicitly.
+
+    If the server closes a kept-alive connection while the request is being sent, idempotent requests (e.g. GET or
+    PUT) are repeated right away. Other errors are handled as any other connection error, like in `SyncHttpClient`.
+
+    The client must be used within a single event loop.
+    """
+
+    DEFAULT_RETRY_INTERVAL_SEC = 10
+    DEFAULT_TIMEOUT_SEC = (15, 2 * 60)
+    DEFAULT_MAX_CONNECTIONS = 100
+
+    def __init__(
+        self,
+        base_url: str,
+        throttle_retry_timeout: float | int | datetime.timedelta = 300,
+        requests_per_sec: float = 10,
+        retry_count: int = 3,
+        user_agent: str | None = None,
+        timeout_sec: float | tuple[float, float] | None = None,
+        auth: AuthBase | None = None,
+        requests_burst: int | None = None,
+        throttle_state_file: PathLike | str | None = None,
+        max_connections: int | None = None,
+        adaptive_rate: bool | AdaptiveRateController = False,
+        cache: HttpCache | None = None,
+        metrics: MetricsSink | None = None,
+        verify: bool | str | ssl.SSLContext = True,
+        proxy: str | None = None,
+    ):
+        """
+        Construct AsyncHttpClient.
+
+        :param base_url: common part that all request URLs start with
+        :param throttle_retry_timeout: how long to wait before retrying throttled request.
+                                       Either number of seconds or timedelta
+        :param requests_per_sec: requests per second
+        :param retry_count: count of retries to perform in case of connection error or timeout.
+        :param user_agent: user agent to pass along with a request,
+            if `None` then the default one of requests library is passed
+        :param timeout_sec: how long to wait for the server to send data before giving up,
+            as a seconds (just a single float), or a (connect timeout, read timeout) tuple.
+        :param auth: authentication to apply to the requests
+        :param requests_burst: number of requests that could be sent at once without throttling,
+            one second worth of requests by default
+        :param throttle_state_file: path to the file to share the throttling state with other processes on the host,
+            so that they keep to the common rate limit. POSIX only.
+        :param max_connections: maximum number of simultaneously open connections, which is also the maximum number
+            of requests in flight. Further requests wait for a free connection.
+        :param adaptive_rate: if enabled, the rate and the number of requests in flight are adjusted to the capacity
+            of the server, starting from `requests_per_sec`. Either `True` for the default settings, or the controller
+            to use, see `AdaptiveRateController`. `max_connections` is still the upper limit of requests in flight.
+        :param cache: cache of responses to GET requests, revalidated with conditional requests, see `HttpCache`
+        :param metrics: sink to report the metrics of requests and method group calls to, see `openepd.api.metrics`
+        :param verify: whether to verify the TLS certificates of servers, or the path to the CA bundle file to verify
+            them with, or the SSL context to use
+        :param proxy: URL of the proxy to send the requests through, by default the proxies are taken from the
+            environment (``HTTPS_PROXY`` etc.)
+        """
+        self._base_url: str = no_trailing_slash(base_url)
+        self._throttler = AsyncThrottler(
+            rate_per_sec=requests_per_sec, burst=requests_burst, state_file=throttle_state_file
+        )
+        self._rate_controller: AdaptiveRateController | None = (
+            adaptive_rate
+            if isinstance(adaptive_rate, AdaptiveRateController)
+            else AdaptiveRateController(initial_rate=requests_per_sec)
+            if adaptive_rate
+            else None
+        )
+        if self._rate_controller is not None:
+            self._throttler.rate = self._rate_controller.rate
+        self._cache: HttpCache | None = cache
+        self._metrics: MetricsSink | None = metrics
+        self._throttle_retry_timeout: float = (
+            float(throttle_retry_timeout)
+            if isinstance(throttle_retry_timeout, float | int)
+            else throttle_retry_timeout.total_seconds()
+        )
+        self.user_agent = user_agent
+        self.timeout = timeout_sec or self.DEFAULT_TIMEOUT_SEC
+        self._auth: AuthBase | None = auth
+        self._retry_count: int = retry_count
+        self._max_connections: int = max_connections or self.DEFAULT_MAX_CONNECTIONS
+        self._verify: bool | ssl.SSLContext = (
+            ssl.create_default_context(cafile=verify) if isinstance(verify, str) else verify
+        )
+        self._proxy: str | None = proxy
+        self._http: httpx.AsyncClient | None = None
+        self._closing: set[asyncio.Task] = set()
+
+        self._http_retry_handlers: dict[int, AsyncRetryHandler] = {}
+        self._http_error_handlers: dict[int, ErrorHandler] = {}
+
+        self.register_error_handler(400, DefaultOpenApiErrorHandlers.handle_bad_request)
+        self.register_error_handler(401, DefaultOpenApiErrorHandlers.handle_unauthorized)
+        self.register_error_handler(403, DefaultOpenApiErrorHandlers.handle_access_denied)
+        self.register_error_handler(404, DefaultOpenApiErrorHandlers.handle_not_found)
+        self.register_error_handler(500, DefaultOpenApiErrorHandlers.handle_server_error)
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def rate_controller(self) -> AdaptiveRateController | None:
+        """Controller of the adaptive rate, see `AdaptiveRateController.get_stats` for the current limits."""
+        return self._rate_controller
+
+    @property
+    def metrics(self) -> MetricsSink | None:
+        """Sink of the metrics, if enabled."""
+        return self._metrics
+
+    @property
+    def cache(self) -> HttpCache | None:
+        """Cache of the responses, see `HttpCache.get_stats` for the statistics."""
+        return self._cache
+
+    @property
+    def base_url(self) -> str:
+        """Return base URL for all requests."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, new_value: str):
+        """Set base URL for all requests."""
+        self._base_url = no_trailing_slash(new_value)
+
+    @property
+    def default_headers(self) -> dict[str, str]:
+        """Default headers for requests. Implement if required."""
+        headers = {}
+        if self.user_agent:
+            headers["user-agent"] = self.user_agent
+        return headers
+
+    def reset_session(self) -> None:
+        """Reset current session, the next requests are sent over new connections, the idle ones are closed."""
+        http, self._http = self._http, None
+        if http is None:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(http.aclose())
+        except RuntimeError:
+            # No event loop to close the connections in, they are closed once collected
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def close(self) -> None:
+        """Close all connections. The client could still be used afterward, new connections will be opened."""
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
+
+    async def read_bytes_from_url(self, url: str, method: str = "get", **kwargs) -> bytes:
+        """
+        Perform query to the given endpoint and returns response body as bytes.
+
+        The request will be performed in the context of API client, default error handling will be applied.
+
+        :param url: url pointing the target endpoint
+        :param method: optional HTTP method
+        :param kwargs: any other arguments supported by do_request. See `AsyncHttpClient.do_request`.
+        :return: response content as bytes
+        """
+        r = await self.do_request(method, url, **kwargs)
+        return r.content
+
+    def register_retry_handler(self, http_error: int, retry_handler: AsyncRetryHandler | None) -> None:
+        """
+        Register retry handler for the given HTTP error code.
+
+        This allows to override default error handling for the given HTTP error code from the subclass.
+        """
+        if retry_handler is not None:
+            self._http_retry_handlers[http_error] = retry_handler
+
+    def delete_retry_handler(self, http_error: int) -> None:
+        """
+        Delete retry handler for the given HTTP error code.
+
+        See register_retry_handler for more details.
+        """
+        if http_error in self._http_retry_handlers:
+            del self._http_retry_handlers[http_error]
+
+    def register_error_handler(self, http_error: int, error_handler: ErrorHandler | None) -> None:
+        """
+        Register error handler for the given HTTP error code.
+
+        Error handlers are the same as for `SyncHttpClient`, they receive the response with the content already read.
+        """
+        if error_handler is not None:
+            self._http_error_handlers[http_error] = error_handler
+
+    def _delete_error_handler(self, http_error: int) -> None:
+        """
+        Delete error handler for the given HTTP error code.
+
+        See register_error_handler for more details.
+        """
+        if http_error in self._http_error_handlers:
+            del self._http_error_handlers[http_error]
+
+    async def _run_throttled_request(self, method: str, url: str, request: PreparedRequest) -> Response:
+        left_time = self._throttle_retry_timeout
+        trace = current_request_trace.get()
+        while True:
+            waiting_since = time.perf_counter()
+            async with self._throttler.throttle():
+                if self._rate_controller is None:
+                    resp = await self.__send_traced(request, waiting_since)
+                else:
+                    async with self._rate_controller.async_slot():
+                        resp = await self.__send_traced(request, waiting_since)
+                    self.__adapt_rate(resp)
+                if resp.status_code == requests_codes.too_many_requests:
+                    timeout = get_retry_after_seconds(resp.headers.get("Retry-After"), self.DEFAULT_RETRY_INTERVAL_SEC)
+                    if timeout > left_time:
+                        return resp
+                    logger.info("`%s %s` has been throttled for %s second(s)", method, url, timeout)
+                    if trace is not None:
+                        trace.throttled += 1
+                        trace.throttle_time += timeout
+                    await asyncio.sleep(timeout)
+                    left_time -= timeout
+                    if left_time > 0:
+                        continue
+                return resp
+
+    async def __send_traced(self, request: PreparedRequest, waiting_since: float) -> Response:
+        trace = current_request_trace.get()
+        if trace is None:
+            return await self._send(request)
+        sent_at = time.perf_counter()
+        trace.throttle_time += sent_at - waiting_since
+        trace.attempts += 1
+        resp = await self._send(request)
+        trace.on_response(resp, time.perf_counter() - sent_at)
+        return resp
+
+    def __adapt_rate(self, resp: Response) -> None:
+        if self._rate_controller is None:
+            return
+        self._rate_controller.on_response(resp.status_code)
+        self._throttler.rate = self._rate_controller.rate
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after is not None and resp.status_code in (
+            requests_codes.too_many_requests,
+            requests_codes.service_unavailable,
+        ):
+            # All requests sharing the throttler hold off, not just the one which got the response
+            self._throttler.pause(get_retry_after_seconds(retry_after, self.DEFAULT_RETRY_INTERVAL_SEC))
+
+    async def do_request(
+        self,
+        method: str,
+        endpoint: str,
+        params=None,
+        data=None,
+        json=None,
+        files=None,
+        headers=None,
+        auth: AuthBase | None = None,
+        raise_for_status: bool = True,
+    ) -> Response:
+        """
+        Perform request to the given endpoint.
+
+        Arguments have the same meaning as for `SyncHttpClient.do_request`.
+        """
+        request_args = (method, endpoint, params, data, json, files, headers, auth, raise_for_status)
+        if self._metrics is None:
+            return await self.__do_request(*request_args)
+        trace = RequestTrace()
+        token = current_request_trace.set(trace)
+        error: Exception | None = None
+        try:
+            return await self.__do_request(*request_args)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            current_request_trace.reset(token)
+            report_request(self._metrics, trace.finish(method, endpoint, error))
+
+    async def __do_request(
+        self,
+        method: str,
+        endpoint: str,
+        params,
+        data,
+        json,
+        files,
+        headers,
+        auth: AuthBase | None,
+        raise_for_status: bool,
+    ) -> Response:
+        headers = headers or self.default_headers
+
+        await self._on_before_do_request()
+
+        url = self._get_url_for_request(endpoint)
+        request = requests.Request(
+            method.upper(),
+            url,
+            params=params,
+            data=data,
+            json=json,
+            files=files,
+            headers=headers,
+            auth=auth or self._auth,
+        ).prepare()
+        cache_key: str | None = None
+        cached: CachedResponse | None = None
+        if self._cache is not None and request.method == "GET":
+            cache_key = get_cache_key(request)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                request.headers.update(cached.get_conditional_headers())
+
+        do_request = self._handle_service_unavailable(
+            method,
+            url,
+            self._retry_count,
+            partial(self._run_throttled_request, method, url, request),
+            self._rate_controller,
+        )
+
+        response = await do_request()
+        if self._cache is not None and cache_key is not None:
+            if cached is not None and response.status_code == requests_codes.not_modified:
+                trace = current_request_trace.get()
+                if trace is not None:
+                    trace.cache_hit = True
+            response = self._cache.process_response(cache_key, response, cached)
+
+        if response.ok:
+            return response
+
+        retry_handler = self._http_retry_handlers.get(response.status_code, None)
+        if retry_handler:
+            result = await retry_handler(do_request)
+            response = result or response
+
+        error_handler = self._http_error_handlers.get(response.status_code, None)
+        if error_handler:
+            response = error_handler(response, raise_for_status)  # type: ignore[assignment]
+
+        if response.ok or not raise_for_status:
+            return response
+
+        response.raise_for_status()
+        # This can't be handled by static checker because of the dynamic nature of the raise_for_status method
+        msg = "This line should never be reached"
+        raise RuntimeError(msg)
+
+    def _get_url_for_request(self, path_or_url: str) -> str:
+        """
+        Generate url for given input.
+
+        If absolute path is given it will be returned as is, otherwise the base url will be prepended.
+        :param path_or_url: Either absolute url or base path.
+        :return: absolute url
+        """
+        return self._base_url + path_or_url if not path_or_url.startswith("http") else path_or_url
+
+    async def _on_before_do_request(self):
+        """
+        Perform any actions before request is sent.
+
+        This is a hook that will be called before `do_request`. Can be overridden to check / refresh access tokens.
+        """
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the httpx client, creating it if needed."""
+        if self._http is None:
+            connect_timeout, read_timeout = self.timeout if isinstance(self.timeout, tuple) else (self.timeout,) * 2
+            self._http = httpx.AsyncClient(
+                # Requests wait for a free connection as long as needed, the limit is the number of requests in flight
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout, pool=None),
+                limits=httpx.Limits(
+                    max_connections=self._max_connections, max_keepalive_connections=self._max_connections
+                ),
+                headers={"User-Agent": default_user_agent()},
+                verify=self._verify,
+                proxy=self._proxy,
+                follow_redirects=True,
+            )
+        return self._http
+
+    async def _send(self, request: PreparedRequest) -> Response:
+        """Send the prepared request and read the whole response."""
+        method = request.method or "GET"
+        body = self.__get_request_body(request)
+        retried = False
+        while True:
+            try:
+                raw = await self._get_http().request(method, request.url or "", content=body, headers=request.headers)
+                break
+            except httpx.RemoteProtocolError as e:
+                # The server might close a kept-alive connection at any moment, the request is repeated once right away
+                # then, unless repeating it might change the result
+                if not retried and method in _IDEMPOTENT_METHODS:
+                    retried = True
+                    continue
+                raise requests.exceptions.ConnectionError(str(e) or "Connection error", request=request) from e
+            except httpx.TimeoutException as e:
+                raise Timeout(str(e) or "Request timed out", request=request) from e
+            except httpx.TooManyRedirects as e:
+                raise requests.exceptions.TooManyRedirects(str(e), request=request) from e
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(str(e) or "Connection error", request=request) from e
+
+        response = Response()
+        response.status_code = raw.status_code
+        response.reason = raw.reason_phrase
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response._content = raw.content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(raw.url)
+        response.request = request
+        response.elapsed = raw.elapsed
+        return response
+
+    @staticmethod
+    def __get_request_body(request: PreparedRequest) -> bytes | None:
+        body = request.body
+        if body is None:
+            return None
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif hasattr(body, "read"):
+            body = body.read()
+        if not isinstance(body, bytes):
+            body = b"".join(body)
+        request.headers["Content-Length"] = str(len(body))
+        request.headers.pop("Transfer-Encoding", None)
+        return body
+
+    @staticmethod
+    def _handle_service_unavailable(
+        method: str,
+        url: str,
+        retry_count: int,
+        func: Callable[..., Awaitable[Response]],
+        rate_controller: AdaptiveRateController | None = None,
+    ) -> AsyncDoRequest:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            attempts = retry_count
+            response = None
+            exception = None
+            while attempts > 0:
+                exception = None
+                try:
+                    response = await func(*args, **kwargs)
+                except (requests.exceptions.ConnectionError, ConnectionError, Timeout) as e:
+                    exception = e
+
+                if exception or response.status_code == requests_codes.service_unavailable:
+                    if exception is None and rate_controller is not None:
+                        # The limits are already cut by the controller and the retry waits for the throttler, it is
+                        # sent once the cooldown is over, so that another unavailability cuts the limits further
+                        secs: float = rate_controller.cooldown_sec
+                    else:
+                        secs = random.randint(60, 60 * 5)  # noqa: S311
+                    logger.warning(
+                        "%s %s is unavailable. Attempts left: %s. Waiting %s seconds...", method, url, attempts, secs
+                    )
+
+                    # wait and request again
+                    trace = current_request_trace.get()
+                    if trace is not None:
+                        trace.backoff_time += secs
+                    await asyncio.sleep(secs)
+                    attempts -= 1
+                else:
+                    break
+            if exception:
+                raise exception
+            return response
+
+        return wrapper
+
+
+class AsyncBaseApiMethodGroup:
+    """Base class for asynchronous API method groups."""
+
+    def __init__(self, client: AsyncHttpClient) -> None:
+        """
+        Construct a method group.
+
+        :param client: HTTP client to use for requests
+        """
+        super().__init__()
+        self._client = client
+        self._singleflight = AsyncSingleFlight()
+
+    async def _get_many(
+        self, uuids: Iterable[str], fetch: Callable[[str], Awaitable[T]], concurrency: int, variant: Hashable = None
+    ) -> dict[str, BatchGetResult[T]]:
+        """
+        Get objects by their identifiers concurrently, see `BaseApiMethodGroup._get_many`.
+
+        :param uuids: identifiers of the objects
+        :param fetch: coroutine function getting a single object
+        :param concurrency: maximal number of requests in flight
+        :param variant: additional key of the request, e.g. requested fields, requests with different variants are not
+            coalesced
+        :return: results in the order of the first occurrence of the identifiers
+        """
+        unique_uuids = list(dict.fromkeys(uuids))
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def _get(uuid: str) -> BatchGetResult[T]:
+            async with limit:
+                try:
+                    return BatchGetResult(await self._singleflight.do((uuid, variant), partial(fetch, uuid)), None)
+                # Errors are reported per identifier and don't fail the whole batch
+                except Exception as e:  # noqa: BLE001
+                    return BatchGetResult(None, e)
+
+        results = await asyncio.gather(*(_get(x) for x in unique_uuids))
+        return dict(zip(unique_uuids, results, strict=True))
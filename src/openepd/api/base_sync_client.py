@@ -24,30 +24,51 @@ __all__ = (
     "TokenAuth",
 )
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 from functools import partial, wraps
 from io import IOBase
 import logging
+from os import PathLike
 import random
 import shutil
+import threading
 import time
-from typing import IO, Any, BinaryIO, Final, NamedTuple
+from typing import IO, Any, BinaryIO, Final, NamedTuple, TypeVar
+import weakref
 
 import requests
 from requests import PreparedRequest, Response, Session, Timeout
 from requests import codes as requests_codes
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.structures import CaseInsensitiveDict
 
 from openepd.__version__ import VERSION
 from openepd.api import errors
-from openepd.api.common import Throttler, no_trailing_slash
+from openepd.api.cache import CachedResponse, HttpCache, get_cache_key
+from openepd.api.common import (
+    AdaptiveRateController,
+    BatchGetResult,
+    SingleFlight,
+    Throttler,
+    get_retry_after_seconds,
+    no_trailing_slash,
+)
+from openepd.api.metrics import (
+    MetricsSink,
+    RequestTrace,
+    current_request_trace,
+    report_request,
+)
 
 logger = logging.getLogger(__name__)
 
 USER_AGENT_DEFAULT: Final[str] = f"OpenEPD API Client/{VERSION}"
 
+T = TypeVar("T")
+
 DoRequest = Callable[[], Response]
 RetryHandler = Callable[[DoRequest], Response | None]
 ErrorHandler = Callable[[Response, bool], Response | None]
@@ -155,6 +176,8 @@ class SyncHttpClient:
     HTTP_DATE_TIME_FORMAT = "%a, %d %b %Y %H:%M:%S %Z"
     DEFAULT_RETRY_INTERVAL_SEC = 10
     DEFAULT_TIMEOUT_SEC = (15, 2 * 60)
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
 
     def __init__(
         self,
@@ -165,6 +188,15 @@ class SyncHttpClient:
         user_agent: str | None = None,
         timeout_sec: float | tuple[float, float] | None = None,
         auth: AuthBase | None = None,
+        requests_burst: int | None = None,
+        throttle_state_file: PathLike | str | None = None,
+        adaptive_rate: bool | AdaptiveRateController = False,
+        cache: HttpCache | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        session_per_thread: bool = False,
+        metrics: MetricsSink | None = None,
     ):
         """
         Construct BaseApiClient.
@@ -178,9 +210,37 @@ class SyncHttpClient:
         :param timeout_sec: how long to wait for the server to send data before giving up,
             as a seconds (just a single float), or a (connect timeout, read timeout) tuple.
         :param retry_count: count of retries to perform in case of connection error or timeout.
+        :param requests_burst: number of requests that could be sent at once without throttling,
+            one second worth of requests by default
+        :param throttle_state_file: path to the file to share the throttling state with other processes on the host,
+            so that they keep to the common rate limit. POSIX only.
+        :param adaptive_rate: if enabled, the rate and the number of requests in flight are adjusted to the capacity
+            of the server, starting from `requests_per_sec`. Either `True` for the default settings, or the controller
+            to use, see `AdaptiveRateController`.
+        :param cache: cache of responses to GET requests, revalidated with conditional requests, see `HttpCache`
+        :param pool_connections: number of hosts to keep connection pools for
+        :param pool_maxsize: maximal number of connections kept alive per host, should be not less than the number of
+            threads using the client, otherwise extra connections are opened and discarded after each request
+        :param pool_block: if True, threads wait for a free connection when the pool is exhausted instead of opening
+            extra ones
+        :param session_per_thread: if True, each thread uses its own session (and connection pool), otherwise all
+            threads share a single session. Per-thread sessions suit long-lived threads, since connections of a
+            thread are not reused by other threads.
+        :param metrics: sink to report the metrics of requests and method group calls to, see `openepd.api.metrics`
         """
         self._base_url: str = no_trailing_slash(base_url)
-        self._throttler = Throttler(rate_per_sec=requests_per_sec)
+        self._throttler = Throttler(rate_per_sec=requests_per_sec, burst=requests_burst, state_file=throttle_state_file)
+        self._rate_controller: AdaptiveRateController | None = (
+            adaptive_rate
+            if isinstance(adaptive_rate, AdaptiveRateController)
+            else AdaptiveRateController(initial_rate=requests_per_sec)
+            if adaptive_rate
+            else None
+        )
+        if self._rate_controller is not None:
+            self._throttler.rate = self._rate_controller.rate
+        self._cache: HttpCache | None = cache
+        self._metrics: MetricsSink | None = metrics
         self._throttle_retry_timeout: float = (
             float(throttle_retry_timeout)
             if isinstance(throttle_retry_timeout, float | int)
@@ -188,7 +248,14 @@ class SyncHttpClient:
         )
         self.user_agent = user_agent
         self.timeout = timeout_sec or self.DEFAULT_TIMEOUT_SEC
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._session_per_thread = session_per_thread
+        self._session_lock = threading.Lock()
         self._session: Session | None = None
+        self._thread_sessions = threading.local()
+        self._all_sessions: weakref.WeakSet[Session] = weakref.WeakSet()
         self._auth: AuthBase | None = auth
         self._retry_count: int = retry_count
 
@@ -201,6 +268,26 @@ class SyncHttpClient:
         self.register_error_handler(404, DefaultOpenApiErrorHandlers.handle_not_found)
         self.register_error_handler(500, DefaultOpenApiErrorHandlers.handle_server_error)
 
+    @property
+    def rate_controller(self) -> AdaptiveRateController | None:
+        """Controller of the adaptive rate, see `AdaptiveRateController.get_stats` for the current limits."""
+        return self._rate_controller
+
+    @property
+    def metrics(self) -> MetricsSink | None:
+        """Sink of the metrics, if enabled."""
+        return self._metrics
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Maximal number of connections kept alive per host."""
+        return self._pool_maxsize
+
+    @property
+    def cache(self) -> HttpCache | None:
+        """Cache of the responses, see `HttpCache.get_stats` for the statistics."""
+        return self._cache
+
     @property
     def base_url(self) -> str:
         """Return base URL for all requests."""
@@ -221,7 +308,19 @@ class SyncHttpClient:
 
     def reset_session(self) -> None:
         """Reset current session (if any). This will clear all cookies and other session data."""
-        self._session = None
+        with self._session_lock:
+            self._session = None
+            self._thread_sessions = threading.local()
+
+    def close(self) -> None:
+        """Close the connections of all sessions. The client could still be used afterward, new sessions are created."""
+        with self._session_lock:
+            sessions = list(self._all_sessions)
+            self._all_sessions.clear()
+            self._session = None
+            self._thread_sessions = threading.local()
+        for session in sessions:
+            session.close()
 
     def read_bytes_from_url(self, url: str, method: str = "get", **kwargs) -> bytes:
         """
@@ -321,9 +420,16 @@ class SyncHttpClient:
         left_time = self._throttle_retry_timeout
         # override current session to do request to some other server from the same API client
         session = session or self._current_session
+        trace = current_request_trace.get()
         while True:
+            waiting_since = time.perf_counter()
             with self._throttler.throttle():
-                resp = session.request(method, url, **request_kwargs)
+                if self._rate_controller is None:
+                    resp = self.__send(session, method, url, request_kwargs, waiting_since)
+                else:
+                    with self._rate_controller.slot():
+                        resp = self.__send(session, method, url, request_kwargs, waiting_since)
+                    self.__adapt_rate(resp)
                 if resp.status_code == requests_codes.too_many_requests:
                     timeout = self._get_timeout_from_retry_after_header(
                         resp.headers.get("Retry-After"), self.DEFAULT_RETRY_INTERVAL_SEC
@@ -331,12 +437,42 @@ class SyncHttpClient:
                     if timeout > left_time:
                         return resp
                     logger.info("`%s %s` has been throttled for %s second(s)", method, url, timeout)
+                    if trace is not None:
+                        trace.throttled += 1
+                        trace.throttle_time += timeout
                     time.sleep(timeout)
                     left_time -= timeout
                     if left_time > 0:
                         continue
                 return resp
 
+    @staticmethod
+    def __send(
+        session: Session, method: str, url: str, request_kwargs: dict[str, Any], waiting_since: float
+    ) -> Response:
+        trace = current_request_trace.get()
+        if trace is None:
+            return session.request(method, url, **request_kwargs)
+        sent_at = time.perf_counter()
+        trace.throttle_time += sent_at - waiting_since
+        trace.attempts += 1
+        resp = session.request(method, url, **request_kwargs)
+        trace.on_response(resp, time.perf_counter() - sent_at, streamed=bool(request_kwargs.get("stream")))
+        return resp
+
+    def __adapt_rate(self, resp: Response) -> None:
+        if self._rate_controller is None:
+            return
+        self._rate_controller.on_response(resp.status_code)
+        self._throttler.rate = self._rate_controller.rate
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after is not None and resp.status_code in (
+            requests_codes.too_many_requests,
+            requests_codes.service_unavailable,
+        ):
+            # All requests sharing the throttler hold off, not just the one which got the response
+            self._throttler.pause(get_retry_after_seconds(retry_after, self.DEFAULT_RETRY_INTERVAL_SEC))
+
     def do_request(
         self,
         method: str,
@@ -356,6 +492,35 @@ class SyncHttpClient:
 
         See https://requests.readthedocs.io/en/master/api/#requests.request for more details on kwargs.
         """
+        request_args = (method, endpoint, params, data, json, files, headers, session, auth, raise_for_status)
+        if self._metrics is None:
+            return self.__do_request(*request_args, **kwargs)
+        trace = RequestTrace()
+        token = current_request_trace.set(trace)
+        error: Exception | None = None
+        try:
+            return self.__do_request(*request_args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            current_request_trace.reset(token)
+            report_request(self._metrics, trace.finish(method, endpoint, error))
+
+    def __do_request(
+        self,
+        method: str,
+        endpoint: str,
+        params,
+        data,
+        json,
+        files,
+        headers,
+        session: Session | None,
+        auth: AuthBase | None,
+        raise_for_status: bool,
+        **kwargs,
+    ) -> Response:
         headers = headers or self.default_headers
 
         self._on_before_do_request()
@@ -372,15 +537,32 @@ class SyncHttpClient:
             auth=auth or self._auth,
         )
         request_kwargs.update(kwargs)
+        cache_key: str | None = None
+        cached: CachedResponse | None = None
+        # Streamed responses are not read by the client, so they can't be cached
+        if self._cache is not None and method.upper() == "GET" and not kwargs.get("stream"):
+            cache_key = get_cache_key(
+                requests.Request("GET", url, params=params, headers=headers, auth=auth or self._auth).prepare()
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                request_kwargs["headers"] = {**headers, **cached.get_conditional_headers()}
 
         do_request = self._handle_service_unavailable(
             method,
             url,
             self._retry_count,
             partial(self._run_throttled_request, method, url, request_kwargs, session=session),
+            self._rate_controller,
         )
 
         response = do_request()
+        if self._cache is not None and cache_key is not None:
+            if cached is not None and response.status_code == requests_codes.not_modified:
+                trace = current_request_trace.get()
+                if trace is not None:
+                    trace.cache_hit = True
+            response = self._cache.process_response(cache_key, response, cached)
 
         if response.ok:
             return response
@@ -414,9 +596,29 @@ class SyncHttpClient:
 
     @property
     def _current_session(self) -> Session:
-        if self._session is None:
-            self._session = Session()
-        return self._session
+        if self._session_per_thread:
+            thread_sessions = self._thread_sessions
+            session = getattr(thread_sessions, "session", None)
+            if session is None:
+                session = thread_sessions.session = self._create_session()
+                with self._session_lock:
+                    self._all_sessions.add(session)
+            return session
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+                self._all_sessions.add(self._session)
+            return self._session
+
+    def _create_session(self) -> Session:
+        """Create a new session with the connection pool settings of the client."""
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize, pool_block=self._pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _on_before_do_request(self):
         """
@@ -424,24 +626,14 @@ class SyncHttpClient:
 
         This is a hook that will be called before `do_request`. Can be overridden to check / refresh access tokens.
         """
-        pass
 
     def _get_timeout_from_retry_after_header(self, retry_after: str | None, default: float = 10.0) -> float:
-        if retry_after is None:
-            return default
-        try:
-            return float(retry_after)
-        except ValueError:
-            # This means the value is not at number of seconds but a date, so we parse it
-            try:
-                date_in_future = datetime.datetime.strptime(retry_after.strip(), self.HTTP_DATE_TIME_FORMAT)
-                return (date_in_future - datetime.datetime.utcnow()).total_seconds()
-            except ValueError:
-                logger.warning("Invalid Retry-After header: %s", retry_after)
-                return default
+        return get_retry_after_seconds(retry_after, default)
 
     @staticmethod
-    def _handle_service_unavailable(method: str, url: str, retry_count: int, func: Callable):
+    def _handle_service_unavailable(
+        method: str, url: str, retry_count: int, func: Callable, rate_controller: AdaptiveRateController | None = None
+    ):
         @wraps(func)
         def wrapper(*args, **kwargs):
             attempts = retry_count
@@ -455,12 +647,20 @@ class SyncHttpClient:
                     exception = e
 
                 if exception or response.status_code == requests_codes.service_unavailable:
-                    secs = random.randint(60, 60 * 5)  # noqa: S311
+                    if exception is None and rate_controller is not None:
+                        # The limits are already cut by the controller and the retry waits for the throttler, it is
+                        # sent once the cooldown is over, so that another unavailability cuts the limits further
+                        secs: float = rate_controller.cooldown_sec
+                    else:
+                        secs = random.randint(60, 60 * 5)  # noqa: S311
                     logger.warning(
                         "%s %s is unavailable. Attempts left: %s. Waiting %s seconds...", method, url, attempts, secs
                     )
 
-                    # wait random number of seconds and request again
+                    # wait and request again
+                    trace = current_request_trace.get()
+                    if trace is not None:
+                        trace.backoff_time += secs
                     time.sleep(secs)
                     attempts -= 1
                 else:
@@ -549,3 +749,54 @@ class BaseApiMethodGroup:
         """
         super().__init__()
         self._client = client
+        self._singleflight = SingleFlight()
+
+    def _get_many(
+        self, uuids: Iterable[str], fetch: Callable[[str], T], concurrency: int, variant: Hashable = None
+    ) -> dict[str, BatchGetResult[T]]:
+        """
+        Get objects by their identifiers concurrently, implementation of `get_many` methods.
+
+        Duplicate identifiers are fetched once. Requests for the objects already being fetched by other threads are
+        not repeated, the result of the request in flight is used. The requests are throttled by the client as usual.
+        Worker threads use the session of the client and its connection pool, so there are not more workers than
+        `SyncHttpClient.pool_maxsize`, otherwise extra connections would be opened and discarded after each request.
+
+        :param uuids: identifiers of the objects
+        :param fetch: function getting a single object
+        :param concurrency: maximal number of requests in flight, limited by the connection pool size of the client
+        :param variant: additional key of the request, e.g. requested fields, requests with different variants are not
+            coalesced
+        :return: results in the order of the first occurrence of the identifiers
+        """
+        unique_uuids = list(dict.fromkeys(uuids))
+
+        def _get(uuid: str) -> BatchGetResult[T]:
+            try:
+                return BatchGetResult(self._singleflight.do((uuid, variant), partial(fetch, uuid)), None)
+            # Errors are reported per identifier and don't fail the whole batch
+            except Exception as e:  # noqa: BLE001
+                return BatchGetResult(None, e)
+
+        if concurrency <= 1 or len(unique_uuids) <= 1:
+            return {x: _get(x) for x in unique_uuids}
+
+        results: dict[str, BatchGetResult[T]] = {}
+        uuids_iter = iter(unique_uuids)
+        uuids_lock = threading.Lock()
+
+        def _work() -> None:
+            # Every worker takes the next identifier once done with the previous one, so at most `concurrency`
+            # requests are in flight and the connections of the pool are reused
+            while True:
+                with uuids_lock:
+                    uuid = next(uuids_iter, None)
+                if uuid is None:
+                    return
+                results[uuid] = _get(uuid)
+
+        workers = min(concurrency, len(unique_uuids), self._client.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(_work) for _ in range(workers)]:
+                future.result()
+        return {x: results[x] for x in unique_uuids}
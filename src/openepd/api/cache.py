@@ -0,0 +1,292 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Cache of HTTP responses revalidated with conditional requests.
+
+Responses to GET requests having a validator (``ETag`` or ``Last-Modified`` header) are stored in the cache. When the
+same resource is requested again, the request carries ``If-None-Match`` / ``If-Modified-Since`` headers, and the
+server responds with ``304 Not Modified`` without the payload if the resource hasn't changed. The client then returns
+the cached payload as if it was received, so the callers don't need to know about the cache.
+
+The cache is enabled by passing it to the HTTP client:
+
+    client = OpenEpdApiClientSync(base_url, token, cache=DiskLruHttpCache("~/.cache/openepd.sqlite"))
+"""
+
+import abc
+import hashlib
+import json
+from os import PathLike
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from requests import PreparedRequest, Response
+from requests import codes as requests_codes
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+__all__ = (
+    "CachedResponse",
+    "DiskLruHttpCache",
+    "HttpCache",
+    "HttpCacheStats",
+    "get_cache_key",
+)
+
+# Headers describing the transfer rather than the cached payload, which is stored decoded
+_TRANSFER_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"))
+
+
+class CachedResponse(NamedTuple):
+    """Response stored in the cache."""
+
+    url: str
+    """URL of the response."""
+    headers: dict[str, str]
+    """Headers of the response, except the ones describing the transfer."""
+    content: bytes
+    """Decoded body of the response."""
+
+    def get_conditional_headers(self) -> dict[str, str]:
+        """Get the headers of a request to revalidate the response."""
+        headers = CaseInsensitiveDict(self.headers)
+        result: dict[str, str] = {}
+        if "ETag" in headers:
+            result["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            result["If-Modified-Since"] = headers["Last-Modified"]
+        return result
+
+
+class HttpCacheStats(NamedTuple):
+    """Statistics of the cache usage."""
+
+    hits: int
+    """Number of requests answered with 304 Not Modified, the payload was taken from the cache."""
+    misses: int
+    """Number of requests which received the full payload."""
+    stores: int
+    """Number of responses stored in the cache."""
+    evictions: int
+    """Number of responses evicted from the cache to keep it within the size limit."""
+    bytes_saved: int
+    """Total size of payloads taken from the cache instead of receiving them."""
+    bytes_received: int
+    """Total size of payloads received for the requests the cache was consulted for."""
+
+
+def get_cache_key(request: PreparedRequest) -> str:
+    """
+    Get the cache key of the request.
+
+    Responses depend on the user, so the authorization header is the part of the key along with the URL.
+    """
+    digest = hashlib.sha256()
+    digest.update((request.url or "").encode("utf-8"))
+    digest.update(b"\n")
+    digest.update(request.headers.get("Authorization", "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+class HttpCache(abc.ABC):
+    """
+    Base class for caches of HTTP responses.
+
+    Implementations define the storage (`get`, `put`, `clear`), the revalidation logic and the statistics are common.
+    Implementations must be thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__stores = 0
+        self.__evictions = 0
+        self.__bytes_saved = 0
+        self.__bytes_received = 0
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Get the cached response, or None if there is no such."""
+
+    @abc.abstractmethod
+    def put(self, key: str, response: CachedResponse) -> None:
+        """Store the response in the cache, replacing the existing one."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all the responses from the cache."""
+
+    def get_stats(self) -> HttpCacheStats:
+        """Get the statistics of the cache usage since it was created."""
+        with self.__lock:
+            return HttpCacheStats(
+                hits=self.__hits,
+                misses=self.__misses,
+                stores=self.__stores,
+                evictions=self.__evictions,
+                bytes_saved=self.__bytes_saved,
+                bytes_received=self.__bytes_received,
+            )
+
+    def process_response(self, key: str, response: Response, cached: CachedResponse | None) -> Response:
+        """
+        Process the response to the request which was sent with the conditional headers of the cached response.
+
+        :param key: cache key of the request
+        :param response: the received response
+        :param cached: the cached response the request was revalidating, if any
+        :return: the response with the cached payload if the server confirmed it is not modified, otherwise the
+            received response, which is stored in the cache if it has a validator
+        """
+        if response.status_code == requests_codes.not_modified and cached is not None:
+            with self.__lock:
+                self.__hits += 1
+                self.__bytes_saved += len(cached.content)
+            return self.__response_from_cache(cached, response)
+
+        if response.status_code != requests_codes.ok:
+            return response
+        content = response.content
+        with self.__lock:
+            self.__misses += 1
+            self.__bytes_received += len(content)
+        if (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ) and "no-store" not in response.headers.get("Cache-Control", ""):
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _TRANSFER_HEADERS}
+            self.put(key, CachedResponse(url=response.url, headers=headers, content=content))
+            with self.__lock:
+                self.__stores += 1
+        return response
+
+    def _record_evictions(self, count: int) -> None:
+        """Update statistics with the number of evicted responses, should be called by implementations."""
+        with self.__lock:
+            self.__evictions += count
+
+    @staticmethod
+    def __response_from_cache(cached: CachedResponse, not_modified: Response) -> Response:
+        response = Response()
+        response.status_code = requests_codes.ok
+        response.reason = "OK"
+        response.url = cached.url
+        # 304 response carries the up-to-date metadata of the resource
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response.headers.update((k, v) for k, v in not_modified.headers.items() if k.lower() not in _TRANSFER_HEADERS)
+        response._content = cached.content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        return response
+
+
+class DiskLruHttpCache(HttpCache):
+    """
+    Cache of HTTP responses stored in an SQLite database, limited in size.
+
+    Least recently used responses are evicted when the total size of the cached payloads exceeds the limit. The
+    database could be shared by several processes, e.g. jobs running on the same host.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, path: PathLike | str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Open the cache, creating the database if needed.
+
+        :param path: path to the database file
+        :param max_size: maximal total size of the cached payloads, in bytes
+        """
+        super().__init__()
+        if max_size <= 0:
+            msg = "Max size must be positive"
+            raise ValueError(msg)
+        self.max_size = max_size
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT NOT NULL, headers TEXT NOT NULL, content BLOB NOT NULL, "
+            "size INTEGER NOT NULL, used REAL NOT NULL)"
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used, size)")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get the cached response, or None if there is no such."""
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT url, headers, content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.__connection.execute("UPDATE responses SET used = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(url=row[0], headers=json.loads(row[1]), content=row[2])
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        """Store the response in the cache, evicting the least recently used ones if the cache is full."""
+        size = len(response.content)
+        if size > self.max_size:
+            return
+        with self.__lock:
+            connection = self.__connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, response.url, json.dumps(response.headers), response.content, size, time.time()),
+                )
+                evicted = self.__evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        if evicted:
+            self._record_evictions(evicted)
+
+    def clear(self) -> None:
+        """Remove all the responses from the cache."""
+        with self.__lock:
+            self.__connection.execute("DELETE FROM responses")
+
+    def get_size(self) -> int:
+        """Get the total size of the cached payloads."""
+        with self.__lock:
+            return self.__connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __evict(self, connection: sqlite3.Connection) -> int:
+        excess = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0] - self.max_size
+        if excess <= 0:
+            return 0
+        keys: list[str] = []
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY used"):
+            keys.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM responses WHERE key = ?", ((x,) for x in keys))
+        return len(keys)
@@ -0,0 +1,45 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# NB! This is a generated code. Do not edit it manually. Please see tools/openepd/codegen/generate_async_api.py
+
+
+from openepd.api.base_async_client import AsyncBaseApiMethodGroup
+from openepd.api.category.dto import CategoryTreeResponse
+from openepd.api.metrics import instrument_method_group
+from openepd.model.category import Category
+
+
+@instrument_method_group
+class AsyncCategoryApi(AsyncBaseApiMethodGroup):
+    """Asynchronous API methods for reading categories."""
+
+    async def get_tree_raw(self) -> CategoryTreeResponse:
+        """
+        Get categories tree.
+
+        :return: categories tree wrapped in OpenEpdApiResponse
+        """
+        response = await self._client.do_request("get", "/v2/categories/tree")
+        return CategoryTreeResponse.parse_raw(response.content)
+
+    async def get_tree(self) -> Category:
+        """
+        Get categories tree.
+
+        :return: categories tree
+        """
+        response = await self.get_tree_raw()
+        return response.payload
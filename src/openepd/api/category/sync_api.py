@@ -15,9 +15,11 @@
 #
 from openepd.api.base_sync_client import BaseApiMethodGroup
 from openepd.api.category.dto import CategoryTreeResponse
+from openepd.api.metrics import instrument_method_group
 from openepd.model.category import Category
 
 
+@instrument_method_group
 class CategoryApi(BaseApiMethodGroup):
     """API methods for reading categories."""
 
@@ -13,60 +13,425 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
-from collections.abc import Callable, Iterable, Iterator
-from contextlib import contextmanager
-from datetime import datetime, timedelta
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from functools import partial
+import logging
+import os
+from os import PathLike
+from pathlib import Path
+import struct
 import threading
-from time import sleep
-from typing import Generic, cast
+import time
+from typing import Generic, NamedTuple, TypeVar, cast
+import weakref
 
 from requests import Response
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 from openepd.api.dto.common import DEFAULT_PAGE_SIZE, MetaCollectionDto, OpenEpdApiResponse
 from openepd.api.dto.meta import PagingMeta, PagingMetaMixin
 from openepd.model.base import TOpenEpdObject
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HTTP_DATE_TIME_FORMAT = "%a, %d %b %Y %H:%M:%S %Z"
+
+# Theoretical arrival time of the next call as Unix timestamp
+_SHARED_STATE = struct.Struct("<d")
+
+
+def _gcra(tat: float, now: float, interval: float, tolerance: float) -> tuple[float, float]:
+    """
+    Reserve a slot with Generic Cell Rate Algorithm.
+
+    :param tat: theoretical arrival time of the next call
+    :param now: current time
+    :param interval: interval between calls at the sustained rate
+    :param tolerance: how much earlier than its theoretical arrival time a call could be made (burst)
+    :return: seconds to wait before the call, and the new theoretical arrival time
+    """
+    tat = max(tat, now)
+    return max(0.0, tat - tolerance - now), tat + interval
+
 
 class Throttler:
-    """Throttle calls to a function to a certain rate."""
+    """
+    Throttle calls to a function to a certain rate.
+
+    The limit is enforced with Generic Cell Rate Algorithm, which is equivalent to a token bucket: calls are spread
+    evenly at the given rate, while up to `burst` calls could be made at once after an idle period. Each call reserves
+    its slot under a lock and waits for it outside, so concurrent threads neither exceed the rate nor over-sleep.
+
+    The state could be shared by all processes on the host through a state file locked with `fcntl.flock`, which is
+    available on POSIX systems only. The processes sharing the file should use the same rate.
+    """
 
-    def __init__(self, rate_per_sec: float) -> None:
+    def __init__(self, rate_per_sec: float, burst: int | None = None, state_file: PathLike | str | None = None) -> None:
         """
         Construct a throttler.
 
         :param rate_per_sec: number of calls to throttle per second
+        :param burst: number of calls that could be made at once, one second worth of calls by default
+        :param state_file: path to the file to share the state with other processes, the state is kept in memory if
+            None. The file is created if it doesn't exist.
         """
         super().__init__()
+        if state_file is not None and fcntl is None:
+            msg = "Shared throttling state is not supported on this platform"
+            raise ValueError(msg)
 
-        self.rate: float = rate_per_sec
+        self.__rate: float = 0
+        self.__burst: int | None = None
+        self.rate = rate_per_sec
+        self.burst = burst
 
-        self.__count_lock = threading.Lock()
-        self.__time_lock = threading.Lock()
+        self.__lock = threading.Lock()
+        self.__tat = 0.0
+        self.__state_file: Path | None = Path(state_file) if state_file is not None else None
 
-        self.__count = 0
-        self.__start = datetime.now()
-        self.__time_limit = timedelta(seconds=1)
+    @property
+    def rate(self) -> float:
+        """Number of calls per second."""
+        return self.__rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        if value <= 0:
+            msg = "Rate must be positive"
+            raise ValueError(msg)
+        self.__rate = value
+
+    @property
+    def burst(self) -> int:
+        """Number of calls that could be made at once."""
+        return self.__burst if self.__burst is not None else max(1, int(self.__rate))
+
+    @burst.setter
+    def burst(self, value: int | None) -> None:
+        if value is not None and value < 1:
+            msg = "Burst must be positive"
+            raise ValueError(msg)
+        self.__burst = value
+
+    def reserve(self) -> float:
+        """
+        Reserve a slot for a call without waiting.
+
+        :return: number of seconds to wait before the call
+        """
+        interval = 1.0 / self.__rate
+        tolerance = interval * (self.burst - 1)
+        return self.__update(lambda tat, now: _gcra(tat, now, interval, tolerance))
+
+    def pause(self, seconds: float) -> None:
+        """
+        Postpone all the following calls by the given number of seconds from now.
+
+        This is useful when the server asks to retry later, so that all threads sharing the throttler back off
+        instead of hitting the limit again.
+        """
+        tolerance = (self.burst - 1) / self.__rate
+        self.__update(lambda tat, now: (0.0, max(tat, now + seconds + tolerance)))
+
+    def __update(self, func: Callable[[float, float], tuple[float, float]]) -> float:
+        """Update the theoretical arrival time with the function of it and the current time, return the wait time."""
+        with self.__lock:
+            if self.__state_file is not None:
+                return self.__update_shared(self.__state_file, func)
+            wait, self.__tat = func(self.__tat, time.monotonic())
+            return wait
+
+    @staticmethod
+    def __update_shared(state_file: Path, func: Callable[[float, float], tuple[float, float]]) -> float:
+        fd = os.open(state_file, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            data = os.pread(fd, _SHARED_STATE.size, 0)
+            tat = _SHARED_STATE.unpack(data)[0] if len(data) == _SHARED_STATE.size else 0.0
+            # Monotonic clocks of different processes are not comparable, wall clock is used instead
+            wait, tat = func(tat, time.time())
+            os.pwrite(fd, _SHARED_STATE.pack(tat), 0)
+            return wait
+        finally:
+            # Closing the file releases the lock
+            os.close(fd)
 
     @contextmanager
     def throttle(self):
         """Create context manager which throttles inside the context."""
-        with self.__count_lock:
-            count = self.__count
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+        yield
+
+
+class AsyncThrottler:
+    """
+    Throttle coroutines to a certain rate, an asyncio counterpart of `Throttler`.
+
+    The calls exceeding the rate wait without blocking the event loop. The state file, if given, is locked for a short
+    time while reserving a slot.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int | None = None, state_file: PathLike | str | None = None) -> None:
+        """
+        Construct a throttler.
+
+        :param rate_per_sec: number of calls to throttle per second
+        :param burst: number of calls that could be made at once, one second worth of calls by default
+        :param state_file: path to the file to share the state with other processes, see `Throttler`
+        """
+        super().__init__()
+        self.__throttler = Throttler(rate_per_sec, burst, state_file)
+
+    @property
+    def rate(self) -> float:
+        """Number of calls per second."""
+        return self.__throttler.rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        self.__throttler.rate = value
+
+    @property
+    def burst(self) -> int:
+        """Number of calls that could be made at once."""
+        return self.__throttler.burst
+
+    @burst.setter
+    def burst(self, value: int | None) -> None:
+        self.__throttler.burst = value
+
+    def reserve(self) -> float:
+        """
+        Reserve a slot for a call without waiting.
+
+        :return: number of seconds to wait before the call
+        """
+        return self.__throttler.reserve()
 
-        with self.__time_lock:
-            diff = datetime.now() - self.__start
-            if diff < self.__time_limit and count >= self.rate:
-                seconds = (self.__time_limit - diff).total_seconds()
-                sleep(seconds)
-                self.__start = datetime.now()
-                self.__count = count - self.rate
+    def pause(self, seconds: float) -> None:
+        """Postpone all the following calls by the given number of seconds from now, see `Throttler.pause`."""
+        self.__throttler.pause(seconds)
 
-        with self.__count_lock:
-            self.__count += 1
+    @asynccontextmanager
+    async def throttle(self) -> AsyncIterator[None]:
+        """Create async context manager which throttles inside the context."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
 
         yield
 
 
+class AdaptiveRateStats(NamedTuple):
+    """Snapshot of the state of `AdaptiveRateController`."""
+
+    rate: float
+    """Current rate limit, requests per second."""
+    concurrency: int
+    """Current limit of requests in flight."""
+    in_flight: int
+    """Number of requests in flight."""
+    responses: int
+    """Total number of responses received."""
+    throttled: int
+    """Number of 429 Too Many Requests responses."""
+    unavailable: int
+    """Number of 503 Service Unavailable responses."""
+    increases: int
+    """Number of times the limits were raised."""
+    decreases: int
+    """Number of times the limits were cut."""
+
+
+class AdaptiveRateController:
+    """
+    Find the capacity of the server with AIMD (additive increase, multiplicative decrease) of request limits.
+
+    While responses succeed, the rate is raised by `rate_step` and concurrency by one about once per second, i.e.
+    after the number of successful responses equal to the current rate. Throttling (429) and unavailability (503)
+    responses cut both limits by `decrease_factor`. Limits are cut at most once per `cooldown_sec`, since the requests
+    already in flight are likely to be throttled as well. Clients retry unavailable responses after `cooldown_sec`
+    at the cut rate, instead of the fixed wait of the non-adaptive mode.
+
+    The controller is used by HTTP clients in the adaptive mode: the rate is applied to the throttler of the client,
+    and the requests are sent within `slot` (or `async_slot`), limiting the number of requests in flight. A controller
+    could be shared by threads and by coroutines of several event loops.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 10,
+        min_rate: float = 0.5,
+        max_rate: float = 1000,
+        rate_step: float = 1,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        decrease_factor: float = 0.5,
+        cooldown_sec: float = 1.0,
+    ) -> None:
+        """
+        Construct the controller.
+
+        :param initial_rate: starting rate limit, requests per second
+        :param min_rate: the rate is never cut below this value
+        :param max_rate: the rate is never raised above this value
+        :param rate_step: how much the rate is raised at once
+        :param initial_concurrency: starting limit of requests in flight
+        :param min_concurrency: concurrency is never cut below this value
+        :param max_concurrency: concurrency is never raised above this value
+        :param decrease_factor: multiplier applied to the limits when the server is overloaded, between 0 and 1
+        :param cooldown_sec: minimal time between two cuts of the limits
+        """
+        super().__init__()
+        if not 0 < decrease_factor < 1:
+            msg = "Decrease factor must be between 0 and 1"
+            raise ValueError(msg)
+        if not 0 < min_rate <= max_rate or not 0 < min_concurrency <= max_concurrency:
+            msg = "Minimal limits must be positive and not greater than maximal ones"
+            raise ValueError(msg)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_step = rate_step
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.cooldown_sec = cooldown_sec
+
+        self.__condition = threading.Condition()
+        # Coroutines waiting for a slot are woken by the event of their loop, set within that loop
+        self.__slot_released: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.__rate = min(max(initial_rate, min_rate), max_rate)
+        self.__concurrency = min(max(initial_concurrency, min_concurrency), max_concurrency)
+        self.__in_flight = 0
+        self.__successes = 0
+        self.__last_decrease = float("-inf")
+        self.__responses = 0
+        self.__throttled = 0
+        self.__unavailable = 0
+        self.__increases = 0
+        self.__decreases = 0
+
+    @property
+    def rate(self) -> float:
+        """Current rate limit, requests per second."""
+        return self.__rate
+
+    @property
+    def concurrency(self) -> int:
+        """Current limit of requests in flight."""
+        return self.__concurrency
+
+    def get_stats(self) -> AdaptiveRateStats:
+        """Get the current limits and counters."""
+        with self.__condition:
+            return AdaptiveRateStats(
+                rate=self.__rate,
+                concurrency=self.__concurrency,
+                in_flight=self.__in_flight,
+                responses=self.__responses,
+                throttled=self.__throttled,
+                unavailable=self.__unavailable,
+                increases=self.__increases,
+                decreases=self.__decreases,
+            )
+
+    def on_response(self, status_code: int) -> None:
+        """
+        Adjust the limits according to the response status.
+
+        :param status_code: HTTP status code of the response
+        """
+        with self.__condition:
+            self.__responses += 1
+            if status_code in (429, 503):
+                if status_code == 429:
+                    self.__throttled += 1
+                else:
+                    self.__unavailable += 1
+                now = time.monotonic()
+                if now - self.__last_decrease >= self.cooldown_sec:
+                    self.__last_decrease = now
+                    self.__successes = 0
+                    self.__decreases += 1
+                    self.__rate = max(self.min_rate, self.__rate * self.decrease_factor)
+                    self.__concurrency = max(self.min_concurrency, int(self.__concurrency * self.decrease_factor))
+                    logger.info("Server is overloaded, limits cut to %.2f rps, %s", self.__rate, self.__concurrency)
+            elif status_code < 500:
+                self.__successes += 1
+                if self.__successes >= self.__rate:
+                    self.__successes = 0
+                    self.__increases += 1
+                    self.__rate = min(self.max_rate, self.__rate + self.rate_step)
+                    self.__concurrency = min(self.max_concurrency, self.__concurrency + 1)
+                    self.__condition.notify_all()
+                    self.__wake_async_waiters()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Create context manager which waits until the number of requests in flight is below the limit."""
+        with self.__condition:
+            while self.__in_flight >= self.__concurrency:
+                self.__condition.wait()
+            self.__in_flight += 1
+        try:
+            yield
+        finally:
+            self.__release()
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Create async context manager which waits until the number of requests in flight is below the limit."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.__condition:
+                if self.__in_flight < self.__concurrency:
+                    self.__in_flight += 1
+                    break
+                # The event is cleared under the lock, so the wake-up of a release made after the check is not lost
+                slot_released = self.__slot_released.get(loop)
+                if slot_released is None:
+                    slot_released = self.__slot_released[loop] = asyncio.Event()
+                slot_released.clear()
+            await slot_released.wait()
+        try:
+            yield
+        finally:
+            self.__release()
+
+    def __release(self) -> None:
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__condition.notify()
+            self.__wake_async_waiters()
+
+    def __wake_async_waiters(self) -> None:
+        """Set the events of all loops with waiting coroutines, must be called under the lock."""
+        for loop, event in list(self.__slot_released.items()):
+            try:
+                # asyncio.Event is not thread-safe, so it is set by its own loop
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The loop is closed, nobody waits there anymore
+                self.__slot_released.pop(loop, None)
+
+
 class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
     """
     Iterator over a list of objects which could be from remote API in batches by given fetch function.
@@ -99,6 +464,14 @@ class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
         stream.goto_page(4)
         for epd in stream:
             print(epd)
+
+        # Fetch up to 3 next pages in background while the current one is being processed
+        for epd in stream.iterator(prefetch_pages=3):
+            print(epd)
+
+        # Fetch the remaining pages by 4 concurrent requests, items are still yielded in order
+        for epd in stream.iterator(concurrency=4):
+            print(epd)
     """
 
     def __init__(
@@ -106,9 +479,22 @@ class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
         fetch_handler: Callable[[int, int], OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto]],
         auto_init: bool = True,
         page_size: int | None = None,
+        prefetch_pages: int = 0,
+        concurrency: int = 1,
     ):
+        """
+        Construct the streaming list.
+
+        :param fetch_handler: function fetching the page by its number and size
+        :param auto_init: if True, the first page is fetched immediately
+        :param page_size: page size, None for default
+        :param prefetch_pages: default number of pages fetched in background during iteration, see `iterator`
+        :param concurrency: default number of pages fetched concurrently during iteration, see `iterator`
+        """
         self.__fetch_handler = fetch_handler
         self.__page_size = page_size or DEFAULT_PAGE_SIZE
+        self.__prefetch_pages = prefetch_pages
+        self.__concurrency = concurrency
         self.__current_page = 0
         self.__recent_response: OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto] | None = None
         if auto_init:
@@ -131,22 +517,7 @@ class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
         if self.__current_page != page_num or force_reload:
             self.__recent_response = self.__fetch_handler(page_num, self.__page_size)
             self.__current_page = page_num
-        if self.__recent_response is None:
-            msg = "Response is empty, this should not happen, check if fetch_handler is compatible"
-            raise RuntimeError(msg)
-        if self.__recent_response.payload is None:
-            msg = "Response does not contain payload"
-            raise ValueError(msg)
-        if not isinstance(self.__recent_response.payload, list):
-            msg = "Response does not contain a list"
-            raise ValueError(msg)
-        if self.__recent_response.meta is None:
-            msg = "Response does not contain meta"
-            raise ValueError(msg)
-        if not isinstance(self.__recent_response.meta, PagingMetaMixin):
-            msg = "Response does not contain paging meta"
-            raise ValueError(msg)
-        return self.__recent_response.payload
+        return _get_page_items(self.__recent_response)
 
     def get_paging_meta(self) -> PagingMeta:
         """
@@ -202,14 +573,35 @@ class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
         """
         return self.iterator(self.current_page)
 
-    def iterator(self, start_from_page: int = 1) -> Iterator[TOpenEpdObject]:
+    def iterator(
+        self, start_from_page: int = 1, prefetch_pages: int | None = None, concurrency: int | None = None
+    ) -> Iterator[TOpenEpdObject]:
         """
         Iterate over all items, when needed the new pages from server will be requested.
 
+        With prefetching, a background thread fetches the next pages one by one while the current page is being
+        consumed, so the time of the server round-trips overlaps with the processing. At most `prefetch_pages` pages
+        are held in memory besides the current one. Items are yielded in order, and an error fetching a page is raised
+        when the iteration reaches this page.
+
+        Once the first page is fetched, the number of pages is known, so the next pages could be fetched concurrently
+        by `concurrency` threads. The requests still pass through the client, so its throttling applies. At least
+        `concurrency` pages are fetched ahead then.
+
         :param start_from_page: page number to start from (1-based)
+        :param prefetch_pages: number of pages to fetch ahead, 0 to fetch pages only when needed, None for the default
+            given in the constructor
+        :param concurrency: maximum number of pages fetched at once, None for the default given in the constructor
         """
         if start_from_page <= 0:
             start_from_page = 1
+        if prefetch_pages is None:
+            prefetch_pages = self.__prefetch_pages
+        if concurrency is None:
+            concurrency = self.__concurrency
+        if prefetch_pages > 0 or concurrency > 1:
+            yield from self.__prefetching_iterator(start_from_page, max(prefetch_pages, concurrency), concurrency)
+            return
         self.goto_page(start_from_page)
         while True:
             items = self.goto_page(self.current_page)
@@ -219,6 +611,33 @@ class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
             else:
                 self.goto_page(self.current_page + 1)
 
+    def __prefetching_iterator(
+        self, start_from_page: int, prefetch_pages: int, concurrency: int
+    ) -> Iterator[TOpenEpdObject]:
+        items = self.goto_page(start_from_page)
+        next_page = start_from_page + 1
+        pending: deque[tuple[int, Future[OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto]]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="openepd-prefetch")
+        try:
+            while True:
+                # The number of pages is taken from the most recent response, as it might change during iteration
+                total_pages = self.get_total_pages()
+                while len(pending) < prefetch_pages and next_page <= total_pages:
+                    pending.append((next_page, executor.submit(self.__fetch_handler, next_page, self.__page_size)))
+                    next_page += 1
+                yield from items
+                if not pending:
+                    return  # no more pages
+                page_num, future = pending.popleft()
+                response = future.result()
+                self.__recent_response = response
+                self.__current_page = page_num
+                items = _get_page_items(response)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def __len__(self):
         return self.get_total_count()
 
@@ -232,6 +651,294 @@ class StreamingListResponse(Iterable[TOpenEpdObject], Generic[TOpenEpdObject]):
             self.goto_page(1)
 
 
+class AsyncStreamingListResponse(Generic[TOpenEpdObject]):
+    """
+    Async iterator over a list of objects fetched from remote API in batches, see `StreamingListResponse`.
+
+    Unlike the synchronous counterpart, the first page is not fetched on construction, but on the first access.
+
+    Typical use case:
+
+        stream: AsyncStreamingListResponse[Epd] # Assume we collected this from the async API Client
+
+        async for epd in stream:
+            print(epd)
+
+        total = await stream.get_total_count()
+
+        async for epd in stream.iterator(4):
+            print(epd)
+
+        # Fetch the remaining pages by 4 concurrent requests, items are still yielded in order
+        async for epd in stream.iterator(concurrency=4):
+            print(epd)
+    """
+
+    def __init__(
+        self,
+        fetch_handler: Callable[[int, int], Awaitable[OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto]]],
+        page_size: int | None = None,
+        prefetch_pages: int = 0,
+        concurrency: int = 1,
+    ):
+        """
+        Construct the streaming list.
+
+        :param fetch_handler: coroutine function fetching the page by its number and size
+        :param page_size: page size, None for default
+        :param prefetch_pages: default number of pages fetched in background during iteration, see `iterator`
+        :param concurrency: default number of pages fetched concurrently during iteration, see `iterator`
+        """
+        self.__fetch_handler = fetch_handler
+        self.__page_size = page_size or DEFAULT_PAGE_SIZE
+        self.__prefetch_pages = prefetch_pages
+        self.__concurrency = concurrency
+        self.__current_page = 0
+        self.__recent_response: OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto] | None = None
+
+    async def goto_page(self, page_num: int, force_reload: bool = False) -> list[TOpenEpdObject]:
+        """
+        Go to the given page and return items as result.
+
+        :param page_num: page number to retrieve
+        :param force_reload: if True, force reload of the page even if it was already loaded
+        :return: list of items on the page
+        """
+        if page_num <= 0:
+            msg = "Page number must be positive"
+            raise ValueError(msg)
+        if self.__current_page != page_num or force_reload:
+            self.__recent_response = await self.__fetch_handler(page_num, self.__page_size)
+            self.__current_page = page_num
+        return _get_page_items(self.__recent_response)
+
+    async def get_paging_meta(self) -> PagingMeta:
+        """
+        Get paging meta from the most recent response.
+
+        If no pages were retrieved yet, the first page will be fetched automatically.
+        :return: paging meta
+        """
+        paging_meta = cast(PagingMetaMixin, await self.get_meta()).paging
+        if paging_meta is None:
+            msg = "Response does not contain paging meta"
+            raise ValueError(msg)
+        return paging_meta
+
+    async def get_meta(self) -> MetaCollectionDto:
+        """
+        Get meta from the most recent response.
+
+        If no pages were retrieved yet, the first page will be fetched automatically.
+        :return: meta
+        """
+        if self.__recent_response is None:
+            await self.goto_page(1)
+        return self.__recent_response.meta  # type: ignore
+
+    @property
+    def current_page(self) -> int:
+        """Get current page number (numbering is 1-based), 0 if no pages were retrieved yet."""
+        return self.__current_page
+
+    async def get_total_pages(self) -> int:
+        """Get total number of pages."""
+        return (await self.get_paging_meta()).total_pages
+
+    async def get_total_count(self) -> int:
+        """Get total number of items."""
+        return (await self.get_paging_meta()).total_count
+
+    async def has_next_page(self) -> bool:
+        """Check if there is a next page."""
+        return self.current_page < await self.get_total_pages()
+
+    def reset(self):
+        """Reset iterator to the very beginning, cleanup internal buffers."""
+        self.__current_page = 0
+        self.__recent_response = None
+
+    def __aiter__(self) -> AsyncIterator[TOpenEpdObject]:
+        """
+        Iterate over all items, when needed the new pages from server will be requested.
+
+        Iteration starts from the current page.
+        """
+        return self.iterator(self.current_page)
+
+    async def iterator(
+        self, start_from_page: int = 1, prefetch_pages: int | None = None, concurrency: int | None = None
+    ) -> AsyncIterator[TOpenEpdObject]:
+        """
+        Iterate over all items, when needed the new pages from server will be requested.
+
+        Prefetching works like in `StreamingListResponse.iterator`, but the pages are fetched by tasks of the current
+        event loop instead of threads.
+
+        :param start_from_page: page number to start from (1-based)
+        :param prefetch_pages: number of pages to fetch ahead, 0 to fetch pages only when needed, None for the default
+            given in the constructor
+        :param concurrency: maximum number of pages fetched at once, None for the default given in the constructor
+        """
+        if start_from_page <= 0:
+            start_from_page = 1
+        if prefetch_pages is None:
+            prefetch_pages = self.__prefetch_pages
+        if concurrency is None:
+            concurrency = self.__concurrency
+        if prefetch_pages > 0 or concurrency > 1:
+            async for item in self.__prefetching_iterator(
+                start_from_page, max(prefetch_pages, concurrency), concurrency
+            ):
+                yield item
+            return
+        items = await self.goto_page(start_from_page)
+        while True:
+            for item in items:
+                yield item
+            if not await self.has_next_page():
+                return  # no more pages
+            items = await self.goto_page(self.current_page + 1)
+
+    async def __prefetching_iterator(
+        self, start_from_page: int, prefetch_pages: int, concurrency: int
+    ) -> AsyncIterator[TOpenEpdObject]:
+        items = await self.goto_page(start_from_page)
+        next_page = start_from_page + 1
+        limit = asyncio.Semaphore(max(concurrency, 1))
+        pending: deque[tuple[int, asyncio.Task[OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto]]]] = deque()
+
+        async def _fetch(page_num: int) -> OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto]:
+            async with limit:
+                return await self.__fetch_handler(page_num, self.__page_size)
+
+        try:
+            while True:
+                # The number of pages is taken from the most recent response, as it might change during iteration
+                total_pages = await self.get_total_pages()
+                while len(pending) < prefetch_pages and next_page <= total_pages:
+                    pending.append((next_page, asyncio.ensure_future(_fetch(next_page))))
+                    next_page += 1
+                for item in items:
+                    yield item
+                if not pending:
+                    return  # no more pages
+                page_num, task = pending.popleft()
+                response = await task
+                self.__recent_response = response
+                self.__current_page = page_num
+                items = _get_page_items(response)
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+
+class BatchGetResult(NamedTuple, Generic[T]):
+    """The result of getting a single object in a batch, see `get_many` methods of API method groups."""
+
+    obj: T | None
+    """The object or None if getting it failed."""
+    error: Exception | None
+    """The error occurred while getting the object, None on success."""
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into a single call.
+
+    While a call for a key is in flight, other threads calling with the same key wait for it and get the same result
+    (or exception) instead of making their own call. Results are not kept after the call is finished. Note that callers
+    share the returned object.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Call the function, unless the call with the same key is in flight already.
+
+        :param key: key of the call
+        :param func: function to call
+        :return: result of the call
+        """
+        with self.__lock:
+            future = self.__calls.get(key)
+            if future is not None:
+                is_leader = False
+            else:
+                is_leader = True
+                future = self.__calls[key] = Future()
+        if not is_leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce concurrent calls with the same key into a single call, asyncio counterpart of `SingleFlight`.
+
+    The call runs as a separate task, so cancellation of one of the callers doesn't affect the others.
+    """
+
+    def __init__(self) -> None:
+        self.__calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call the coroutine function, unless the call with the same key is in flight already.
+
+        :param key: key of the call
+        :param func: coroutine function to call
+        :return: result of the call
+        """
+        task = self.__calls.get(key)
+        if task is None:
+            task = self.__calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(partial(self.__on_done, key))
+        return await asyncio.shield(task)
+
+    def __on_done(self, key: Hashable, task: asyncio.Future) -> None:
+        if self.__calls.get(key) is task:
+            del self.__calls[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved, callers might be cancelled already
+            task.exception()
+
+
+def _get_page_items(
+    response: OpenEpdApiResponse[list[TOpenEpdObject], MetaCollectionDto] | None,
+) -> list[TOpenEpdObject]:
+    """Check that the response is a page of a streaming list and return its items."""
+    if response is None:
+        msg = "Response is empty, this should not happen, check if fetch_handler is compatible"
+        raise RuntimeError(msg)
+    if response.payload is None:
+        msg = "Response does not contain payload"
+        raise ValueError(msg)
+    if not isinstance(response.payload, list):
+        msg = "Response does not contain a list"
+        raise ValueError(msg)
+    if response.meta is None:
+        msg = "Response does not contain meta"
+        raise ValueError(msg)
+    if not isinstance(response.meta, PagingMetaMixin):
+        msg = "Response does not contain paging meta"
+        raise ValueError(msg)
+    return response.payload
+
+
 def no_trailing_slash(val: str) -> str:
     """
     Remove all trailing slashes from the given string. Might be useful to normalize URLs.
@@ -250,3 +957,25 @@ def paging_meta_from_v1_api(r: Response) -> PagingMeta:
         total_pages=int(r.headers["X-Total-Pages"]),
         page_size=int(r.headers["X-Page-Size"]),
     )
+
+
+def get_retry_after_seconds(retry_after: str | None, default: float = 10.0) -> float:
+    """
+    Get the number of seconds to wait from the value of Retry-After HTTP header.
+
+    :param retry_after: header value, either a number of seconds or an HTTP date
+    :param default: the value to return if the header is missing or invalid
+    :return: number of seconds to wait
+    """
+    if retry_after is None:
+        return default
+    try:
+        return float(retry_after)
+    except ValueError:
+        # This means the value is not at number of seconds but a date, so we parse it
+        try:
+            date_in_future = datetime.strptime(retry_after.strip(), HTTP_DATE_TIME_FORMAT)
+            return (date_in_future - datetime.utcnow()).total_seconds()
+        except ValueError:
+            logger.warning("Invalid Retry-After header: %s", retry_after)
+            return default
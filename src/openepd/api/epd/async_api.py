@@ -0,0 +1,268 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# NB! This is a generated code. Do not edit it manually. Please see tools/openepd/codegen/generate_async_api.py
+
+
+from collections.abc import Collection, Iterable
+from functools import partial
+from typing import Literal, overload
+
+from requests import Response
+
+from openepd.api.base_async_client import AsyncBaseApiMethodGroup
+from openepd.api.common import AsyncStreamingListResponse, BatchGetResult
+from openepd.api.epd.dto import EpdSearchResponse, EpdStatisticsResponse, StatisticsDto
+from openepd.api.metrics import instrument_method_group
+from openepd.api.utils import encode_path_param, remove_none_id_fields
+from openepd.model.epd import Epd
+
+
+@instrument_method_group
+class AsyncEpdApi(AsyncBaseApiMethodGroup):
+    """Asynchronous API methods for EPDs."""
+
+    @overload
+    async def get_by_openxpd_uuid(
+        self,
+        uuid: str,
+        with_response: Literal[False] = False,
+        *,
+        fields: Collection[str] | None = None,
+        raw_response: Literal[False] = False,
+    ) -> Epd: ...
+
+    @overload
+    async def get_by_openxpd_uuid(
+        self,
+        uuid: str,
+        with_response: Literal[True],
+        *,
+        fields: Collection[str] | None = None,
+        raw_response: Literal[False] = False,
+    ) -> tuple[Epd, Response]: ...
+
+    @overload
+    async def get_by_openxpd_uuid(
+        self,
+        uuid: str,
+        with_response: bool = False,
+        *,
+        fields: Collection[str] | None = None,
+        raw_response: Literal[True],
+    ) -> Response: ...
+
+    async def get_by_openxpd_uuid(
+        self,
+        uuid: str,
+        with_response: bool = False,
+        *,
+        fields: Collection[str] | None = None,
+        raw_response: bool = False,
+    ) -> Epd | tuple[Epd, Response] | Response:
+        """
+        Get EPD by OpenEPD UUID.
+
+        :param uuid: OpenEPD UUID
+        :param with_response: return the response object together with the EPD
+        :param fields: Optional collection of field names to include in the response
+        :param raw_response: if True, return the raw HTTP response without DTO conversion
+        :return: EPD, tuple of EPD and Response, or raw Response depending on parameters
+        :raise ObjectNotFound: if EPD is not found
+        """
+        params = {"fields": ",".join(set(fields))} if fields else None
+        response = await self._client.do_request("get", f"/epds/{uuid}", params=params)
+        if raw_response:
+            return response
+        epd = Epd.parse_obj(response.json())
+        if with_response:
+            return epd, response
+        return epd
+
+    async def get_many(
+        self, uuids: Iterable[str], concurrency: int = 8, *, fields: Collection[str] | None = None
+    ) -> dict[str, BatchGetResult[Epd]]:
+        """
+        Get EPDs by OpenEPD UUIDs.
+
+        UUIDs are fetched concurrently within the throttling limits of the client. Duplicates are fetched once, and
+        the objects being fetched by concurrent callers are not requested again.
+
+        :param uuids: OpenEPD UUIDs
+        :param concurrency: maximal number of requests in flight
+        :param fields: Optional collection of field names to include in the responses
+        :return: mapping of UUID to the result, holding either the object or the error, e.g. `ObjectNotFound`
+        """
+        return await self._get_many(
+            uuids,
+            partial(self.get_by_openxpd_uuid, fields=fields),
+            concurrency,
+            variant=frozenset(fields) if fields else None,
+        )
+
+    async def find_raw(self, omf: str, page_num: int = 1, page_size: int = 10) -> EpdSearchResponse:
+        """
+        Find EPDs by Open Material Filter(OMF).
+
+        OMF is a query language for searching materials/EPDs, running statistics and so on.
+        It can exist in a string form, which is accepted by most of the endpoints.
+
+        :param omf: OMF - open material filter string (see OMF spec).
+        :param page_num: page number
+        :param page_size: page size
+        :return: the list of EPDs
+        """
+        content = (
+            await self._client.do_request(
+                "get",
+                "/v2/epds/search",
+                params=dict(
+                    omf=omf,
+                    page_number=page_num,
+                    page_size=page_size,
+                ),
+            )
+        ).json()
+        return EpdSearchResponse.parse_obj(content)
+
+    def find(
+        self, omf: str, page_size: int | None = None, prefetch_pages: int = 0, concurrency: int = 1
+    ) -> AsyncStreamingListResponse[Epd]:
+        """
+        Find EPDs by Open Material Filter(OMF).
+
+        OMF is a query language for searching materials/EPDs, running statistics and so on.
+        It can exist in a string form, which is accepted by most of the endpoints.
+
+        :param omf: OMF - open material filter string (see OMF spec).
+        :param page_size: page size, None for default
+        :param prefetch_pages: number of pages fetched in background during iteration, see `AsyncStreamingListResponse`
+        :param concurrency: number of pages fetched concurrently during iteration, see `AsyncStreamingListResponse`
+        :return: streaming list of EPDs
+        """
+
+        async def _get_page(p_num: int, p_size: int) -> EpdSearchResponse:
+            return await self.find_raw(omf, page_num=p_num, page_size=p_size)
+
+        return AsyncStreamingListResponse[Epd](
+            _get_page, page_size=page_size, prefetch_pages=prefetch_pages, concurrency=concurrency
+        )
+
+    async def get_statistics_raw(self, omf: str) -> EpdStatisticsResponse:
+        """
+        Get statistics for a given search query.
+
+        Statistics contains aggregated parameters such as percentiles distributions of GWP and other parameters.
+        Please note - in addition to product EPDs statistics might include industry-wide EPDs and even generic
+        estimates to provide a more complete picture where there is not enough product EPDs.
+
+        :param omf: OMF - open material filter string (see OMF spec).
+        :return: statistics wrapped in OpenEpdApiResponse
+        """
+        content = (await self._client.do_request("get", "/v2/epds/statistics", params=dict(omf=omf))).json()
+        return EpdStatisticsResponse.parse_obj(content)
+
+    async def get_statistics(self, omf: str) -> StatisticsDto:
+        """
+        Get statistics for a given search query.
+
+        Statistics contains aggregated parameters such as percentiles distributions of GWP and other parameters.
+        Please note - in addition to product EPDs statistics might include industry-wide EPDs and even generic
+        estimates to provide a more complete picture where there is not enough product EPDs.
+
+        :param omf: OMF - open material filter string (see OMF spec).
+        :return: statistics wrapped in OpenEpdApiResponse
+        """
+        return (await self.get_statistics_raw(omf)).payload
+
+    @overload
+    async def post_with_refs(self, epd: Epd, with_response: Literal[True]) -> tuple[Epd, Response]: ...
+
+    @overload
+    async def post_with_refs(self, epd: Epd, with_response: Literal[False] = False) -> Epd: ...
+
+    async def post_with_refs(self, epd: Epd, with_response: bool = False) -> Epd | tuple[Epd, Response]:
+        """
+        Post an EPD with references.
+
+        :param epd: EPD
+        :param with_response: return the response object togather with the EPD
+        :param exclude_defaults: If True, fields with default values are excluded from the payload
+        :return: EPD or EPD with HTTP Response object depending on parameter
+        """
+        epd_data = epd.to_serializable(exclude_unset=True, by_alias=True)
+        # Remove 'id' fields with None values, as 'id' cannot be None
+        epd_data = remove_none_id_fields(epd_data)
+        response = await self._client.do_request(
+            "patch",
+            "/epds/post-with-refs",
+            json=epd_data,
+        )
+        content = response.json()
+        if with_response:
+            return Epd.parse_obj(content), response
+        return Epd.parse_obj(content)
+
+    @overload
+    async def create(self, epd: Epd, with_response: Literal[True]) -> tuple[Epd, Response]: ...
+
+    @overload
+    async def create(self, epd: Epd, with_response: Literal[False] = False) -> Epd: ...
+
+    async def create(self, epd: Epd, with_response: bool = False) -> Epd | tuple[Epd, Response]:
+        """
+        Create an EPD.
+
+        :param epd: EPD
+        :param with_response: return the response object together with the EPD
+        :return: EPD or EPD with HTTP Response object depending on parameter
+        """
+        response = await self._client.do_request(
+            "post",
+            "/epds",
+            json=epd.to_serializable(exclude_unset=True, exclude_defaults=True, by_alias=True),
+        )
+        content = response.json()
+        if with_response:
+            return Epd.parse_obj(content), response
+        return Epd.parse_obj(content)
+
+    @overload
+    async def edit(self, epd: Epd, with_response: Literal[True]) -> tuple[Epd, Response]: ...
+
+    @overload
+    async def edit(self, epd: Epd, with_response: Literal[False] = False) -> Epd: ...
+
+    async def edit(self, epd: Epd, with_response: bool = False) -> Epd | tuple[Epd, Response]:
+        """
+        Edit an EPD.
+
+        :param epd: EPD
+        :param with_response: return the response object together with the EPD
+        :return: EPD or EPD with HTTP Response object depending on parameter
+        """
+        epd_id = epd.id
+        if not epd_id:
+            msg = "The EPD ID must be set to edit an EPD."
+            raise ValueError(msg)
+        response = await self._client.do_request(
+            "put",
+            f"/epds/{encode_path_param(epd_id)}",
+            json=epd.to_serializable(exclude_unset=True, exclude_defaults=True, by_alias=True),
+        )
+        content = response.json()
+        if with_response:
+            return Epd.parse_obj(content), response
+        return Epd.parse_obj(content)
@@ -13,18 +13,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
+from functools import partial
 from typing import Literal, overload
 
 from requests import Response
 
 from openepd.api.base_sync_client import BaseApiMethodGroup
-from openepd.api.common import StreamingListResponse
+from openepd.api.common import BatchGetResult, StreamingListResponse
 from openepd.api.epd.dto import EpdSearchResponse, EpdStatisticsResponse, StatisticsDto
+from openepd.api.metrics import instrument_method_group
 from openepd.api.utils import encode_path_param, remove_none_id_fields
 from openepd.model.epd import Epd
 
 
+@instrument_method_group
 class EpdApi(BaseApiMethodGroup):
     """API methods for EPDs."""
 
@@ -85,6 +88,27 @@ class EpdApi(BaseApiMethodGroup):
             return epd, response
         return epd
 
+    def get_many(
+        self, uuids: Iterable[str], concurrency: int = 8, *, fields: Collection[str] | None = None
+    ) -> dict[str, BatchGetResult[Epd]]:
+        """
+        Get EPDs by OpenEPD UUIDs.
+
+        UUIDs are fetched concurrently within the throttling limits of the client. Duplicates are fetched once, and
+        the objects being fetched by concurrent callers are not requested again.
+
+        :param uuids: OpenEPD UUIDs
+        :param concurrency: maximal number of requests in flight
+        :param fields: Optional collection of field names to include in the responses
+        :return: mapping of UUID to the result, holding either the object or the error, e.g. `ObjectNotFound`
+        """
+        return self._get_many(
+            uuids,
+            partial(self.get_by_openxpd_uuid, fields=fields),
+            concurrency,
+            variant=frozenset(fields) if fields else None,
+        )
+
     def find_raw(self, omf: str, page_num: int = 1, page_size: int = 10) -> EpdSearchResponse:
         """
         Find EPDs by Open Material Filter(OMF).
@@ -108,7 +132,9 @@ class EpdApi(BaseApiMethodGroup):
         ).json()
         return EpdSearchResponse.parse_obj(content)
 
-    def find(self, omf: str, page_size: int | None = None) -> StreamingListResponse[Epd]:
+    def find(
+        self, omf: str, page_size: int | None = None, prefetch_pages: int = 0, concurrency: int = 1
+    ) -> StreamingListResponse[Epd]:
         """
         Find EPDs by Open Material Filter(OMF).
 
@@ -117,13 +143,17 @@ class EpdApi(BaseApiMethodGroup):
 
         :param omf: OMF - open material filter string (see OMF spec).
         :param page_size: page size, None for default
+        :param prefetch_pages: number of pages fetched in background during iteration, see `StreamingListResponse`
+        :param concurrency: number of pages fetched concurrently during iteration, see `StreamingListResponse`
         :return: streaming list of EPDs
         """
 
         def _get_page(p_num: int, p_size: int) -> EpdSearchResponse:
             return self.find_raw(omf, page_num=p_num, page_size=p_size)
 
-        return StreamingListResponse[Epd](_get_page, page_size=page_size)
+        return StreamingListResponse[Epd](
+            _get_page, page_size=page_size, prefetch_pages=prefetch_pages, concurrency=concurrency
+        )
 
     def get_statistics_raw(self, omf: str) -> EpdStatisticsResponse:
         """
@@ -0,0 +1,513 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Client-side instrumentation of API requests.
+
+When a metrics sink is passed to the HTTP client, every `do_request` call is reported to the sink as `RequestMetrics`.
+The time of the request is split into waiting for the throttler, waiting for the network (sending the request and
+receiving the response) and waiting between retries of unavailable server. The execution time reported by the server
+in the ``meta.performance`` of the response (`PerformanceMeta`) is captured as well, so the slowness of the server could
+be told apart from the network and client-side delays. It is taken from the response model returned by the method
+group, so the response is not parsed twice; requests made within a method call are therefore reported once the call
+returns.
+
+Calls of the API method groups (e.g. `EpdApi.get_by_openxpd_uuid`) which made requests are reported as
+`MethodCallMetrics`, their time outside of the requests is the time of parsing the responses into the models. Method
+groups opt into this with the `instrument_method_group` class decorator, which the method groups of this package use.
+
+`InMemoryMetricsSink` aggregates the metrics into histograms per endpoint and per method, other sinks (e.g. forwarding
+the metrics to a monitoring system) could be implemented by subclassing `MetricsSink`:
+
+    sink = InMemoryMetricsSink()
+    client = OpenEpdApiClientSync(base_url, token, metrics=sink)
+    ...
+    for endpoint, stats in sink.get_endpoint_stats().items():
+        print(endpoint, stats.count, stats.latency.quantile(0.95), stats.server_time.mean)
+"""
+
+import bisect
+from collections.abc import Callable
+from contextvars import ContextVar
+import copy
+from dataclasses import dataclass, field
+from functools import wraps
+import inspect
+import logging
+import math
+import re
+import threading
+import time
+from typing import Any, NamedTuple, TypeVar
+from urllib.parse import urlsplit
+
+from requests import Response
+
+from openepd.api.dto.meta import PerformanceMeta
+
+__all__ = (
+    "EndpointStats",
+    "Histogram",
+    "InMemoryMetricsSink",
+    "MethodCallMetrics",
+    "MethodStats",
+    "MetricsSink",
+    "RequestMetrics",
+    "instrument_method_group",
+    "normalize_endpoint",
+)
+
+logger = logging.getLogger(__name__)
+
+# Path segments looking like identifiers (openEPD ids, UUIDs, numbers) - having digits and long enough
+_ID_SEGMENT_RE = re.compile(r"^(?=[^/]*\d)[\w.-]{6,}$|^\d+$")
+
+TMethodGroup = TypeVar("TMethodGroup", bound=type)
+
+
+def normalize_endpoint(path_or_url: str) -> str:
+    """
+    Get the name of the endpoint the request was sent to, replacing identifiers in the path with ``{id}``.
+
+    For example, ``/epds/ec3b9j5t`` is ``/epds/{id}``.
+    """
+    path = urlsplit(path_or_url).path
+    return "/".join("{id}" if _ID_SEGMENT_RE.match(x) else x for x in path.split("/"))
+
+
+class RequestMetrics(NamedTuple):
+    """Metrics of a single `do_request` call, including all its retries."""
+
+    method: str
+    """HTTP method, uppercase."""
+    endpoint: str
+    """Endpoint of the request, see `normalize_endpoint`."""
+    url: str
+    """Path or URL of the request as passed to the client."""
+    status_code: int | None
+    """Status code of the last response, None if no response was received."""
+    attempts: int
+    """Number of HTTP requests sent, i.e. the first one and the retries."""
+    throttled: int
+    """Number of 429 Too Many Requests responses."""
+    total_time: float
+    """Time of the call, seconds."""
+    network_time: float
+    """Time spent sending the requests and receiving the responses, seconds."""
+    throttle_time: float
+    """Time spent waiting for the throttler and for Retry-After of throttled requests, seconds."""
+    backoff_time: float
+    """Time spent waiting before retries of requests to unavailable server, seconds."""
+    bytes_sent: int
+    """Total size of the request bodies."""
+    bytes_received: int
+    """Total size of the response bodies."""
+    cache_hit: bool
+    """True if the response was taken from the cache after revalidation."""
+    server_performance: PerformanceMeta | None
+    """Performance information reported by the server in the response meta, if parsed by a method group."""
+    error: Exception | None
+    """The error raised by the call, None on success."""
+
+
+class MethodCallMetrics(NamedTuple):
+    """Metrics of a call of API method group method which made requests."""
+
+    group: str
+    """Class name of the method group, e.g. ``EpdApi``."""
+    method: str
+    """Name of the method."""
+    requests: int
+    """Number of `do_request` calls made by the method."""
+    total_time: float
+    """Time of the call, seconds."""
+    request_time: float
+    """Time spent in requests, seconds."""
+    parse_time: float
+    """Time spent outside of requests, mostly parsing of the responses into the models, seconds."""
+    error: Exception | None
+    """The error raised by the call, None on success."""
+
+
+class MetricsSink:
+    """
+    Receiver of the metrics, base class doing nothing.
+
+    Methods are called synchronously by the clients, possibly from many threads at once, so implementations must be
+    thread-safe and fast. Errors raised by the sink are logged and ignored.
+    """
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """Process metrics of a request."""
+
+    def on_method_call(self, metrics: MethodCallMetrics) -> None:
+        """Process metrics of a method call."""
+
+
+class Histogram:
+    """Histogram of durations in seconds with fixed exponential buckets."""
+
+    BOUNDS: tuple[float, ...] = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+        30,
+        60,
+        300,
+        math.inf,
+    )
+    """Upper bounds of the buckets."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * len(self.BOUNDS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Add the value to the histogram."""
+        self.buckets[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the values, 0 if there are none."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Get the approximate quantile: the upper bound of the bucket holding it, or the maximal value if less.
+
+        :param q: the quantile between 0 and 1, e.g. 0.95
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.BOUNDS, self.buckets, strict=True):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics of the requests to an endpoint."""
+
+    count: int = 0
+    """Number of requests."""
+    errors: int = 0
+    """Number of requests which raised errors."""
+    retries: int = 0
+    """Number of retries, i.e. HTTP requests sent in addition to the first one."""
+    throttled: int = 0
+    """Number of 429 Too Many Requests responses."""
+    cache_hits: int = 0
+    """Number of responses taken from the cache."""
+    bytes_sent: int = 0
+    """Total size of the request bodies."""
+    bytes_received: int = 0
+    """Total size of the response bodies."""
+    latency: Histogram = field(default_factory=Histogram)
+    """Total time of the requests."""
+    network_time: Histogram = field(default_factory=Histogram)
+    """Network time of the requests."""
+    throttle_time: Histogram = field(default_factory=Histogram)
+    """Throttling time of the requests."""
+    backoff_time: Histogram = field(default_factory=Histogram)
+    """Waiting for unavailable server."""
+    server_time: Histogram = field(default_factory=Histogram)
+    """Execution time reported by the server, for the requests reporting it."""
+
+
+@dataclass
+class MethodStats:
+    """Aggregated metrics of the calls of a method group method."""
+
+    count: int = 0
+    """Number of calls."""
+    errors: int = 0
+    """Number of calls which raised errors."""
+    latency: Histogram = field(default_factory=Histogram)
+    """Total time of the calls."""
+    parse_time: Histogram = field(default_factory=Histogram)
+    """Time spent outside of the requests, mostly parsing."""
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Sink aggregating the metrics in memory, per endpoint (method and path) and per method group method."""
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__endpoints: dict[str, EndpointStats] = {}
+        self.__methods: dict[str, MethodStats] = {}
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """Add the metrics of the request to the statistics of the endpoint."""
+        with self.__lock:
+            key = f"{metrics.method} {metrics.endpoint}"
+            stats = self.__endpoints.get(key)
+            if stats is None:
+                stats = self.__endpoints[key] = EndpointStats()
+            stats.count += 1
+            stats.errors += metrics.error is not None
+            stats.retries += max(0, metrics.attempts - 1)
+            stats.throttled += metrics.throttled
+            stats.cache_hits += metrics.cache_hit
+            stats.bytes_sent += metrics.bytes_sent
+            stats.bytes_received += metrics.bytes_received
+            stats.latency.add(metrics.total_time)
+            stats.network_time.add(metrics.network_time)
+            stats.throttle_time.add(metrics.throttle_time)
+            stats.backoff_time.add(metrics.backoff_time)
+            if metrics.server_performance is not None:
+                stats.server_time.add(metrics.server_performance.execution_time_ms / 1000)
+
+    def on_method_call(self, metrics: MethodCallMetrics) -> None:
+        """Add the metrics of the call to the statistics of the method."""
+        with self.__lock:
+            key = f"{metrics.group}.{metrics.method}"
+            stats = self.__methods.get(key)
+            if stats is None:
+                stats = self.__methods[key] = MethodStats()
+            stats.count += 1
+            stats.errors += metrics.error is not None
+            stats.latency.add(metrics.total_time)
+            stats.parse_time.add(metrics.parse_time)
+
+    def get_endpoint_stats(self) -> dict[str, EndpointStats]:
+        """Get the statistics keyed by HTTP method and endpoint, e.g. ``GET /epds/{id}``."""
+        with self.__lock:
+            return copy.deepcopy(self.__endpoints)
+
+    def get_method_stats(self) -> dict[str, MethodStats]:
+        """Get the statistics keyed by method group and method names, e.g. ``EpdApi.get_by_openxpd_uuid``."""
+        with self.__lock:
+            return copy.deepcopy(self.__methods)
+
+    def reset(self) -> None:
+        """Remove all the statistics."""
+        with self.__lock:
+            self.__endpoints = {}
+            self.__methods = {}
+
+
+def get_performance_meta(result: Any) -> PerformanceMeta | None:
+    """
+    Get the performance meta reported by the server from the result of a method group call.
+
+    The result is the response model already parsed by the method group (e.g. `EpdSearchResponse`), or a tuple with it,
+    e.g. the one returned along with the HTTP response.
+    """
+    for item in result if isinstance(result, tuple) else (result,):
+        performance = getattr(getattr(item, "meta", None), "performance", None)
+        if isinstance(performance, PerformanceMeta):
+            return performance
+    return None
+
+
+class RequestTrace:
+    """Metrics of the request being made, collected by the HTTP clients."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.attempts = 0
+        self.throttled = 0
+        self.network_time = 0.0
+        self.throttle_time = 0.0
+        self.backoff_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status_code: int | None = None
+        self.cache_hit = False
+
+    def on_response(self, response: Response, network_time: float, streamed: bool = False) -> None:
+        """Record the response of an attempt."""
+        self.network_time += network_time
+        self.status_code = response.status_code
+        body = response.request.body if response.request is not None else None
+        self.bytes_sent += len(body) if isinstance(body, bytes | str) else 0
+        if streamed:
+            # The content is not read yet
+            self.bytes_received += int(response.headers.get("Content-Length") or 0)
+        else:
+            self.bytes_received += len(response.content)
+
+    def finish(self, method: str, url: str, error: Exception | None) -> RequestMetrics:
+        """Get the metrics of the finished request."""
+        return RequestMetrics(
+            method=method.upper(),
+            endpoint=normalize_endpoint(url),
+            url=url,
+            status_code=self.status_code,
+            attempts=self.attempts,
+            throttled=self.throttled,
+            total_time=time.perf_counter() - self.started,
+            network_time=self.network_time,
+            throttle_time=self.throttle_time,
+            backoff_time=self.backoff_time,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            cache_hit=self.cache_hit,
+            # Set from the parsed response by the method group, if the request is made by one, see `report_request`
+            server_performance=None,
+            error=error,
+        )
+
+
+class _MethodCallTrace:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.request_time = 0.0
+        self.pending: list[tuple[MetricsSink, RequestMetrics]] = []
+
+
+current_request_trace: ContextVar[RequestTrace | None] = ContextVar("current_request_trace", default=None)
+"""Trace of the request being made in the current context, set by the HTTP clients when metrics are enabled."""
+
+_current_call_trace: ContextVar[_MethodCallTrace | None] = ContextVar("_current_call_trace", default=None)
+
+
+def report_request(sink: MetricsSink, metrics: RequestMetrics) -> None:
+    """
+    Report the metrics of the request to the sink, and account it in the method call being made, if any.
+
+    Requests of a method call are reported when the call returns, along with the performance meta of its result.
+    """
+    call_trace = _current_call_trace.get()
+    if call_trace is not None:
+        call_trace.requests += 1
+        call_trace.request_time += metrics.total_time
+        call_trace.pending.append((sink, metrics))
+        return
+    _send_request(sink, metrics)
+
+
+def _send_request(sink: MetricsSink, metrics: RequestMetrics) -> None:
+    try:
+        sink.on_request(metrics)
+    except Exception:
+        logger.exception("Metrics sink failed")
+
+
+def _report_method_call(
+    sink: MetricsSink,
+    group: str,
+    method: str,
+    trace: _MethodCallTrace,
+    started: float,
+    error: Exception | None,
+    result: Any = None,
+) -> None:
+    total_time = time.perf_counter() - started
+    if trace.pending:
+        # The result is parsed from the response of the last request
+        performance = get_performance_meta(result) if error is None else None
+        if performance is not None:
+            request_sink, metrics = trace.pending[-1]
+            trace.pending[-1] = request_sink, metrics._replace(server_performance=performance)
+        for request_sink, metrics in trace.pending:
+            _send_request(request_sink, metrics)
+    # Calls which didn't make requests themselves, e.g. batches of other calls or lazy lists, are not reported
+    if not trace.requests:
+        return
+    try:
+        sink.on_method_call(
+            MethodCallMetrics(
+                group=group,
+                method=method,
+                requests=trace.requests,
+                total_time=total_time,
+                request_time=trace.request_time,
+                parse_time=max(0.0, total_time - trace.request_time),
+                error=error,
+            )
+        )
+    except Exception:
+        logger.exception("Metrics sink failed")
+
+
+def _instrument_method(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            sink: MetricsSink | None = getattr(self._client, "metrics", None)
+            if sink is None:
+                return await func(self, *args, **kwargs)
+            trace = _MethodCallTrace()
+            token = _current_call_trace.set(trace)
+            started = time.perf_counter()
+            error: Exception | None = None
+            result: Any = None
+            try:
+                result = await func(self, *args, **kwargs)
+                return result
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                _current_call_trace.reset(token)
+                _report_method_call(sink, type(self).__name__, name, trace, started, error, result)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        sink: MetricsSink | None = getattr(self._client, "metrics", None)
+        if sink is None:
+            return func(self, *args, **kwargs)
+        trace = _MethodCallTrace()
+        token = _current_call_trace.set(trace)
+        started = time.perf_counter()
+        error: Exception | None = None
+        result: Any = None
+        try:
+            result = func(self, *args, **kwargs)
+            return result
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _current_call_trace.reset(token)
+            _report_method_call(sink, type(self).__name__, name, trace, started, error, result)
+
+    return wrapper
+
+
+def instrument_method_group(cls: TMethodGroup) -> TMethodGroup:
+    """
+    Class decorator wrapping public methods of the method group to report their metrics, see `MethodCallMetrics`.
+
+    Only the methods defined in the decorated class are wrapped, methods added by its subclasses are not instrumented
+    unless the subclass is decorated too. Metrics are collected only if the client of the group has a metrics sink.
+    """
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(value):
+            setattr(cls, name, _instrument_method(name, value))
+    return cls
@@ -18,10 +18,12 @@ from typing import Literal, overload
 from requests import Response
 
 from openepd.api.base_sync_client import BaseApiMethodGroup
+from openepd.api.metrics import instrument_method_group
 from openepd.api.utils import encode_path_param
 from openepd.model.pcr import Pcr, PcrRef
 
 
+@instrument_method_group
 class PcrApi(BaseApiMethodGroup):
     """API methods for EPDs."""
 
@@ -20,7 +20,9 @@ from requests.auth import AuthBase
 from openepd.api.average_dataset.generic_estimate_sync_api import GenericEstimateApi
 from openepd.api.average_dataset.industry_epd_sync_api import IndustryEpdApi
 from openepd.api.base_sync_client import ErrorHandler, SyncHttpClient, TokenAuth
+from openepd.api.cache import HttpCache
 from openepd.api.category.sync_api import CategoryApi
+from openepd.api.common import AdaptiveRateController
 from openepd.api.epd.sync_api import EpdApi
 from openepd.api.org.sync_api import OrgApi
 from openepd.api.pcr.sync_api import PcrApi
@@ -29,7 +31,12 @@ from openepd.api.standard.sync_api import StandardApi
 
 
 class OpenEpdApiClientSync:
-    """Synchronous API client for OpenEPD."""
+    """
+    Synchronous API client for OpenEPD.
+
+    The client could be used from many threads at once, e.g. workers of a thread pool. Connections are kept alive and
+    reused, `pool_maxsize` argument should be not less than the number of threads to avoid opening extra connections.
+    """
 
     def __init__(self, base_url: str, auth_token: str | None, **kwargs) -> None:
         """
@@ -42,69 +49,68 @@ class OpenEpdApiClientSync:
         super().__init__()
         auth: AuthBase | None = TokenAuth(auth_token) if auth_token is not None else None
         self._http_client = SyncHttpClient(base_url, auth=auth, **kwargs)
-        self.__epd_api: EpdApi | None = None
-        self.__pcr_api: PcrApi | None = None
-        self.__org_api: OrgApi | None = None
-        self.__plant_api: PlantApi | None = None
-        self.__standard_api: StandardApi | None = None
-        self.__category_api: CategoryApi | None = None
-        self.__generic_estimate_api: GenericEstimateApi | None = None
-        self.__industry_epd_api: IndustryEpdApi | None = None
+        # Method groups are created upfront, so that all threads use the same instances and share their state
+        self.__epd_api = EpdApi(self._http_client)
+        self.__pcr_api = PcrApi(self._http_client)
+        self.__org_api = OrgApi(self._http_client)
+        self.__plant_api = PlantApi(self._http_client)
+        self.__standard_api = StandardApi(self._http_client)
+        self.__category_api = CategoryApi(self._http_client)
+        self.__generic_estimate_api = GenericEstimateApi(self._http_client)
+        self.__industry_epd_api = IndustryEpdApi(self._http_client)
+
+    def close(self) -> None:
+        """Close the connections of the client."""
+        self._http_client.close()
+
+    @property
+    def http_cache(self) -> HttpCache | None:
+        """Cache of the responses if enabled with `cache` argument, e.g. to get the statistics."""
+        return self._http_client.cache
+
+    @property
+    def rate_controller(self) -> AdaptiveRateController | None:
+        """Controller of the adaptive rate if enabled with `adaptive_rate` argument, e.g. to get the current limits."""
+        return self._http_client.rate_controller
 
     @property
     def epds(self) -> EpdApi:
         """Get the EPD API."""
-        if self.__epd_api is None:
-            self.__epd_api = EpdApi(self._http_client)
         return self.__epd_api
 
     @property
     def pcrs(self) -> PcrApi:
         """Get the PCR API."""
-        if self.__pcr_api is None:
-            self.__pcr_api = PcrApi(self._http_client)
         return self.__pcr_api
 
     @property
     def orgs(self) -> OrgApi:
         """Get the Org API."""
-        if self.__org_api is None:
-            self.__org_api = OrgApi(self._http_client)
         return self.__org_api
 
     @property
     def plants(self) -> PlantApi:
         """Get the Plant API."""
-        if self.__plant_api is None:
-            self.__plant_api = PlantApi(self._http_client)
         return self.__plant_api
 
     @property
     def standards(self) -> StandardApi:
         """Get the Standard API."""
-        if self.__standard_api is None:
-            self.__standard_api = StandardApi(self._http_client)
         return self.__standard_api
 
     @property
     def categories(self) -> CategoryApi:
         """Get the Category API."""
-        if self.__category_api is None:
-            self.__category_api = CategoryApi(self._http_client)
         return self.__category_api
 
     @property
     def industry_epds(self) -> IndustryEpdApi:
         """Get the Category API."""
-        if self.__industry_epd_api is None:
-            self.__industry_epd_api = IndustryEpdApi(self._http_client)
         return self.__industry_epd_api
 
     @property
     def generic_estimates(self) -> GenericEstimateApi:
         """Get the GE API."""
-        if self.__generic_estimate_api is None:
-            self.__generic_estimate_api = GenericEstimateApi(self._http_client)
         return self.__generic_estimate_api
 
     def set_error_handler(self, http_status_code: int, error_handler: ErrorHandler | None) -> None:
@@ -0,0 +1,145 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""Stub of the OpenEPD API server for the client tests."""
+
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from typing import Any
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+EPD_IDS = [f"ec3b9j{x:02d}" for x in range(7)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StubServer"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.__handle()
+
+    def do_POST(self) -> None:
+        self.__handle()
+
+    def __handle(self) -> None:
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests.append((self.command, url.path, dict(self.headers)))
+            self.server.clients.add(self.client_address)
+            hits = self.server.hits[url.path] = self.server.hits.get(url.path, 0) + 1
+
+        if url.path.startswith("/epds/missing"):
+            self.__send_json({"detail": "Not found"}, status=404)
+        elif url.path.startswith("/epds/"):
+            etag = f'"{url.path}:{self.server.version}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+            else:
+                self.__send_json({"id": url.path.rsplit("/", 1)[1], "product_name": "Test"}, headers={"ETag": etag})
+        elif url.path == "/v2/epds/search":
+            page, size = int(query["page_number"]), int(query["page_size"])
+            self.__send_json(
+                {
+                    "payload": [{"id": x} for x in EPD_IDS[(page - 1) * size : page * size]],
+                    "meta": {
+                        "performance": {"execution_time_ms": 12},
+                        "paging": {
+                            "total_count": len(EPD_IDS),
+                            "total_pages": -(-len(EPD_IDS) // size),
+                            "page_size": size,
+                        },
+                    },
+                },
+                chunked=True,
+            )
+        elif url.path == "/industry_epds":
+            self.__send_json(
+                [{"id": "EC3GGJEJ"}],
+                headers={"X-Total-Count": "1", "X-Total-Pages": "1", "X-Page-Size": query["page_size"]},
+                compress=True,
+            )
+        elif url.path == "/pcrs":
+            self.__send_json({"id": "ec3c8gt7", "name": json.loads(body)["name"], "ref": "https://pcr"})
+        elif url.path == "/throttled" and hits == 1:
+            self.__send_json({"detail": "Slow down"}, status=429, headers={"Retry-After": "0"})
+        elif url.path == "/unavailable" and hits == 1:
+            self.__send_json({"detail": "Maintenance"}, status=503)
+        elif url.path == "/invalid":
+            self.__send_json({"detail": "Bad", "validation_errors": {"code": "invalid", "detail": "Bad OMF"}}, 400)
+        elif url.path in ("/throttled", "/unavailable"):
+            self.__send_json({"ok": True})
+        else:
+            self.__send_json({"detail": "Not found"}, status=404)
+
+    def __send_json(
+        self,
+        content: Any,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+        chunked: bool = False,
+        compress: bool = False,
+    ) -> None:
+        data = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if compress:
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(data), 10):
+                chunk = data[i : i + 10]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.clients: set[tuple[str, int]] = set()
+        self.hits: dict[str, int] = {}
+        self.version = 1
+
+
+def start_stub_server(test_case: unittest.TestCase) -> tuple[StubServer, str]:
+    """Start the server for the test, it is stopped on cleanup. Return the server and its base URL."""
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    test_case.addCleanup(thread.join)
+    test_case.addCleanup(server.server_close)
+    test_case.addCleanup(server.shutdown)
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
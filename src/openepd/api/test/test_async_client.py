@@ -0,0 +1,226 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import asyncio
+from collections import deque
+import gzip
+from typing import cast
+import unittest
+from unittest import mock
+
+import requests
+
+from openepd.api.async_client import OpenEpdApiClientAsync
+from openepd.api.base_async_client import AsyncHttpClient
+from openepd.api.common import AdaptiveRateController
+from openepd.api.errors import ObjectNotFound, ValidationError
+from openepd.api.test.stub_server import EPD_IDS, start_stub_server
+from openepd.model.epd import Epd
+from openepd.model.industry_epd import IndustryEpdPreview
+from openepd.model.pcr import Pcr
+
+
+class AsyncClientTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server, self.base_url = start_stub_server(self)
+
+    def _get_client(self, **kwargs) -> OpenEpdApiClientAsync:
+        return OpenEpdApiClientAsync(self.base_url, "secret", requests_per_sec=1000, **kwargs)
+
+    async def test_get_epd(self):
+        async with self._get_client(user_agent="Test Agent") as client:
+            epd, response = await client.epds.get_by_openxpd_uuid("ec3b9j5t", with_response=True)
+        self.assertEqual("ec3b9j5t", epd.id)
+        self.assertEqual(200, response.status_code)
+        _, path, headers = self.server.requests[0]
+        self.assertEqual("/epds/ec3b9j5t", path)
+        self.assertEqual("Bearer secret", headers["Authorization"])
+        self.assertEqual("Test Agent", headers["user-agent"])
+
+    async def test_find_epds(self):
+        async with self._get_client() as client:
+            stream = client.epds.find("omf", page_size=3)
+            self.assertEqual(len(EPD_IDS), await stream.get_total_count())
+            self.assertEqual(EPD_IDS, [x.id async for x in stream])
+            self.assertEqual(EPD_IDS[3:], [x.id async for x in stream.iterator(2)])
+
+    async def test_list_industry_epds(self):
+        async with self._get_client() as client:
+            items = [x async for x in client.industry_epds.list()]
+        self.assertEqual(1, len(items))
+        self.assertIsInstance(items[0], IndustryEpdPreview)
+
+    async def test_create_pcr(self):
+        async with self._get_client() as client:
+            ref = await client.pcrs.create(Pcr(name="Test PCR"))
+        self.assertEqual("Test PCR", ref.name)
+        self.assertEqual("POST", self.server.requests[0][0])
+
+    async def test_errors(self):
+        async with self._get_client() as client:
+            with self.assertRaises(ObjectNotFound):
+                await client.pcrs.get_by_openxpd_uuid("missing")
+            with self.assertRaises(ValidationError) as cm:
+                await client._http_client.do_request("get", "/invalid")
+            self.assertEqual("invalid", cm.exception.error_code)
+            response = await client._http_client.do_request("get", "/missing", raise_for_status=False)
+            self.assertEqual(404, response.status_code)
+
+    async def test_throttled_and_unavailable(self):
+        async with self._get_client() as client:
+            response = await client._http_client.do_request("get", "/throttled")
+            self.assertEqual({"ok": True}, response.json())
+            with mock.patch("openepd.api.base_async_client.random.randint", return_value=0):
+                response = await client._http_client.do_request("get", "/unavailable")
+            self.assertEqual({"ok": True}, response.json())
+        self.assertEqual({"/throttled": 2, "/unavailable": 2}, self.server.hits)
+
+    async def test_concurrent_requests(self):
+        async with self._get_client(max_connections=4) as client:
+            epds = await asyncio.gather(*(client.epds.get_by_openxpd_uuid(f"ec3b9j{x:02d}") for x in range(40)))
+        self.assertEqual([f"ec3b9j{x:02d}" for x in range(40)], [x.id for x in epds])
+        # Connections are kept alive and reused
+        self.assertLessEqual(len(self.server.clients), 4)
+
+    async def test_adaptive_rate(self):
+        controller = AdaptiveRateController(initial_rate=40, initial_concurrency=2)
+        async with self._get_client(adaptive_rate=controller) as client:
+            self.assertIs(controller, client.rate_controller)
+            initial_rate = controller.rate
+            response = await client._http_client.do_request("get", "/throttled")
+            self.assertEqual({"ok": True}, response.json())
+            stats = controller.get_stats()
+            self.assertEqual((2, 1, 1), (stats.responses, stats.throttled, stats.decreases))
+            self.assertLess(stats.rate, initial_rate)
+            await asyncio.gather(*(client.epds.get_by_openxpd_uuid(f"ec3b9j{x:02d}") for x in range(20)))
+            self.assertGreater(controller.rate, stats.rate)
+            self.assertEqual(0, controller.get_stats().in_flight)
+
+    async def test_adaptive_rate_unavailable(self):
+        controller = AdaptiveRateController(initial_rate=40, cooldown_sec=0.01)
+        async with self._get_client(adaptive_rate=controller) as client:
+            # Unavailability is handled by the controller, instead of waiting for minutes
+            with mock.patch("openepd.api.base_async_client.random.randint", side_effect=AssertionError):
+                response = await client._http_client.do_request("get", "/unavailable")
+            self.assertEqual({"ok": True}, response.json())
+            stats = controller.get_stats()
+            self.assertEqual((1, 1), (stats.unavailable, stats.decreases))
+
+    async def test_get_many(self):
+        async with self._get_client() as client:
+            results = await client.epds.get_many(["ec3b9j01", "missing", "ec3b9j01", "ec3b9j02"], fields=["id"])
+        self.assertEqual(["ec3b9j01", "missing", "ec3b9j02"], list(results))
+        self.assertEqual("ec3b9j01", cast(Epd, results["ec3b9j01"].obj).id)
+        self.assertIsInstance(results["missing"].error, ObjectNotFound)
+        self.assertEqual(1, self.server.hits["/epds/ec3b9j01"])
+
+
+class _ScriptedServer:
+    """HTTP server sending the given raw responses in order, None closes the connection without a response."""
+
+    def __init__(self, responses: list[bytes | None]) -> None:
+        self.responses = deque(responses)
+        self.requests: list[bytes] = []
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while self.responses:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = next(
+                    (int(x.split(b":")[1]) for x in head.split(b"\r\n") if x.lower().startswith(b"content-length")),
+                    0,
+                )
+                self.requests.append(head + await reader.readexactly(length))
+                response = self.responses.popleft()
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+                if b"connection: close" in response.lower():
+                    break
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+
+class AsyncHttpTransportTestCase(unittest.IsolatedAsyncioTestCase):
+    async def _start(self, *responses: bytes | None) -> tuple[_ScriptedServer, AsyncHttpClient]:
+        scripted = _ScriptedServer(list(responses))
+        server = await asyncio.start_server(scripted.handle, "127.0.0.1", 0)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncHttpClient(f"http://127.0.0.1:{port}", requests_per_sec=1000, timeout_sec=5)
+        self.addAsyncCleanup(client.close)
+        return scripted, client
+
+    async def test_chunked_body(self):
+        scripted, client = await self._start(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: ignored\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nnext",
+        )
+        self.assertEqual(b"hello world", (await client.do_request("get", "/chunked")).content)
+        self.assertNotIn("X-Trailer", (await client.do_request("get", "/next")).headers)
+        self.assertEqual(1, scripted.connections)
+
+    async def test_gzip_body(self):
+        content = gzip.compress(b'{"ok": true}')
+        _, client = await self._start(
+            b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nContent-Type: application/json\r\n"
+            + f"Content-Length: {len(content)}\r\n\r\n".encode()
+            + content
+        )
+        self.assertEqual({"ok": True}, (await client.do_request("get", "/gzip")).json())
+
+    async def test_body_until_close(self):
+        scripted, client = await self._start(
+            b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 200 OK\r\nConnection: close\r\n\r\nuntil close",
+            b"HTTP/1.1 304 Not Modified\r\n\r\n",
+            b"HTTP/1.1 204 No Content\r\n\r\n",
+        )
+        self.assertEqual(b"until close", (await client.do_request("get", "/close")).content)
+        self.assertEqual(304, (await client.do_request("get", "/not-modified", raise_for_status=False)).status_code)
+        self.assertEqual(b"", (await client.do_request("get", "/empty")).content)
+        # The closed connection is not reused, responses without body keep the connection alive
+        self.assertEqual(2, scripted.connections)
+
+    async def test_redirect(self):
+        scripted, client = await self._start(
+            b"HTTP/1.1 302 Found\r\nLocation: /moved\r\nContent-Length: 0\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nmoved",
+        )
+        response = await client.do_request("get", "/old")
+        self.assertEqual(b"moved", response.content)
+        self.assertTrue(response.url.endswith("/moved"))
+        self.assertTrue(scripted.requests[1].startswith(b"GET /moved "))
+
+    async def test_closed_connection_retry(self):
+        ok = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+        scripted, client = await self._start(ok, None, ok, None, ok)
+        await client.do_request("get", "/first")
+        # Idempotent request is repeated on a new connection
+        self.assertEqual(b"ok", (await client.do_request("get", "/second")).content)
+        self.assertEqual(3, len(scripted.requests))
+        self.assertEqual(2, scripted.connections)
+
+        # POST might have been processed already, so it is not repeated even though the server would respond
+        request = requests.Request("POST", client._get_url_for_request("/create"), json={}).prepare()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            await client._send(request)
+        self.assertEqual(4, len(scripted.requests))
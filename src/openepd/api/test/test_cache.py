@@ -0,0 +1,108 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import os
+import tempfile
+import unittest
+
+from openepd.api.async_client import OpenEpdApiClientAsync
+from openepd.api.cache import CachedResponse, DiskLruHttpCache
+from openepd.api.sync_client import OpenEpdApiClientSync
+from openepd.api.test.stub_server import start_stub_server
+
+
+def _response(content: bytes) -> CachedResponse:
+    return CachedResponse(url="https://example.com", headers={"ETag": '"1"'}, content=content)
+
+
+class DiskLruHttpCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "cache", "http.sqlite")
+
+    def _get_cache(self, max_size: int = DiskLruHttpCache.DEFAULT_MAX_SIZE) -> DiskLruHttpCache:
+        cache = DiskLruHttpCache(self.path, max_size=max_size)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_persistence(self):
+        self._get_cache().put("a", _response(b"data"))
+        cached = self._get_cache().get("a")
+        self.assertEqual(_response(b"data"), cached)
+        assert cached is not None
+        self.assertEqual({"If-None-Match": '"1"'}, cached.get_conditional_headers())
+        self.assertIsNone(self._get_cache().get("b"))
+
+    def test_lru_eviction(self):
+        cache = self._get_cache(max_size=10)
+        cache.put("a", _response(b"aaaa"))
+        cache.put("b", _response(b"bbbb"))
+        # Makes "a" recently used
+        cache.get("a")
+        cache.put("c", _response(b"cccc"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(8, cache.get_size())
+        self.assertEqual(1, cache.get_stats().evictions)
+        # Too large to be cached at all
+        cache.put("d", _response(b"d" * 11))
+        self.assertIsNone(cache.get("d"))
+        cache.clear()
+        self.assertEqual(0, cache.get_size())
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            DiskLruHttpCache(self.path, max_size=0)
+
+
+class HttpCacheClientTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server, self.base_url = start_stub_server(self)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = DiskLruHttpCache(os.path.join(tmp_dir.name, "http.sqlite"))
+        self.addCleanup(self.cache.close)
+
+    def test_sync_revalidation(self):
+        client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000, cache=self.cache)
+        self.assertIs(self.cache, client.http_cache)
+        first = client.epds.get_by_openxpd_uuid("ec3b9j5t")
+        second, response = client.epds.get_by_openxpd_uuid("ec3b9j5t", with_response=True)
+        self.assertEqual(first, second)
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("If-None-Match", self.server.requests[0][2])
+        self.assertEqual('"/epds/ec3b9j5t:1"', self.server.requests[1][2]["If-None-Match"])
+        stats = self.cache.get_stats()
+        self.assertEqual((1, 1, 1), (stats.hits, stats.misses, stats.stores))
+        self.assertEqual(stats.bytes_received, stats.bytes_saved)
+
+        # Modified resource is received again
+        self.server.version = 2
+        client.epds.get_by_openxpd_uuid("ec3b9j5t")
+        self.assertEqual((1, 2), self.cache.get_stats()[:2])
+        # Responses of other users are not shared
+        OpenEpdApiClientSync(self.base_url, "other", requests_per_sec=1000, cache=self.cache).epds.get_by_openxpd_uuid(
+            "ec3b9j5t"
+        )
+        self.assertNotIn("If-None-Match", self.server.requests[-1][2])
+
+    async def test_async_revalidation(self):
+        async with OpenEpdApiClientAsync(self.base_url, "secret", requests_per_sec=1000, cache=self.cache) as client:
+            first = await client.epds.get_by_openxpd_uuid("ec3b9j5t")
+            second = await client.epds.get_by_openxpd_uuid("ec3b9j5t")
+        self.assertEqual(first, second)
+        self.assertEqual((1, 1), self.cache.get_stats()[:2])
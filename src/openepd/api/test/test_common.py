@@ -13,10 +13,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+import asyncio
 import math
+import os
+import tempfile
+import threading
+import time
 import unittest
 
-from openepd.api.common import StreamingListResponse
+from openepd.api.common import (
+    AdaptiveRateController,
+    AsyncSingleFlight,
+    AsyncStreamingListResponse,
+    SingleFlight,
+    StreamingListResponse,
+    Throttler,
+)
 from openepd.api.dto.common import MetaCollectionDto, OpenEpdApiResponse
 from openepd.api.dto.meta import PagingMeta, PagingMetaMixin
 from openepd.api.errors import ValidationError
@@ -53,19 +65,308 @@ class StreamingListResponseTestCase(unittest.TestCase):
         self.assertEqual(len(sl), len(self.DATA))
         self.assertEqual(sl.get_total_pages(), math.ceil(len(self.DATA) / page_size))
 
-        result = []
-        for x in sl:
-            result.append(x)
+        result = list(sl)
         self.assertEqual(result, self.DATA)
 
     def test_streaming_list_skip_pages(self):
         page_size = 7
         sl = StreamingListResponse[int](self.fetch_data, page_size=page_size)
 
+        result = list(sl.iterator(start_from_page=4))
+        self.assertEqual(result, self.DATA[(4 - 1) * page_size :])
+
+    def test_streaming_list_prefetch(self):
+        page_size = 10
+        fetched: list[int] = []
+        second_page_fetched = threading.Event()
+
+        def fetch_data(page_num: int, p_size: int) -> OpenEpdApiResponse[list[int], PagingMetaResponseForTest]:
+            fetched.append(page_num)
+            if page_num == 2:
+                second_page_fetched.set()
+            return self.fetch_data(page_num, p_size)
+
+        sl = StreamingListResponse[int](fetch_data, page_size=page_size, prefetch_pages=2)
         result = []
-        for x in sl.iterator(start_from_page=4):
+        for x in sl.iterator(start_from_page=1):
+            if not result:
+                # The next page is fetched while the first one is being consumed
+                self.assertTrue(second_page_fetched.wait(5))
             result.append(x)
-        self.assertEqual(result, self.DATA[(4 - 1) * page_size :])
+        self.assertEqual(result, self.DATA)
+        self.assertEqual(list(range(1, 11)), sorted(set(fetched)))
+        self.assertEqual(10, sl.current_page)
+
+    def test_streaming_list_prefetch_error(self):
+        def fetch_data(page_num: int, page_size: int) -> OpenEpdApiResponse[list[int], PagingMetaResponseForTest]:
+            if page_num == 3:
+                msg = "Page 3 failed"
+                raise ValueError(msg)
+            return self.fetch_data(page_num, page_size)
+
+        sl = StreamingListResponse[int](fetch_data, page_size=10)
+        iterator = sl.iterator(prefetch_pages=3)
+        # Items of the pages before the failed one are yielded
+        self.assertEqual(self.DATA[:20], [next(iterator) for _ in range(20)])
+        with self.assertRaisesRegex(ValueError, "Page 3 failed"):
+            next(iterator)
+
+    def test_streaming_list_concurrency(self):
+        # Pages 2-4 are fetched at once, otherwise the barrier is broken by timeout
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch_data(page_num: int, page_size: int) -> OpenEpdApiResponse[list[int], PagingMetaResponseForTest]:
+            if 2 <= page_num <= 4:
+                barrier.wait()
+            return self.fetch_data(page_num, page_size)
+
+        sl = StreamingListResponse[int](fetch_data, page_size=10, concurrency=3)
+        self.assertEqual(self.DATA, list(sl))
+        self.assertEqual(10, sl.current_page)
+
+
+class AsyncStreamingListResponseTestCase(unittest.IsolatedAsyncioTestCase):
+    async def fetch_data(
+        self,
+        page_num: int,
+        page_size: int,
+    ) -> OpenEpdApiResponse[list[int], PagingMetaResponseForTest]:
+        return StreamingListResponseTestCase.fetch_data(page_num, page_size)
+
+    async def test_streaming_list_response(self):
+        page_size = 7
+        sl = AsyncStreamingListResponse[int](self.fetch_data, page_size=page_size)
+
+        self.assertEqual(0, sl.current_page)
+        self.assertEqual(len(StreamingListResponseTestCase.DATA), await sl.get_total_count())
+        self.assertEqual(StreamingListResponseTestCase.DATA, [x async for x in sl])
+        self.assertEqual(
+            StreamingListResponseTestCase.DATA[(4 - 1) * page_size :], [x async for x in sl.iterator(start_from_page=4)]
+        )
+
+    async def test_streaming_list_concurrency(self):
+        # Pages 2-4 are fetched at once, otherwise the barrier is broken by timeout
+        barrier = asyncio.Barrier(3)
+
+        async def fetch_data(page_num: int, page_size: int) -> OpenEpdApiResponse[list[int], PagingMetaResponseForTest]:
+            if 2 <= page_num <= 4:
+                await asyncio.wait_for(barrier.wait(), 5)
+            return await self.fetch_data(page_num, page_size)
+
+        sl = AsyncStreamingListResponse[int](fetch_data, page_size=10, concurrency=3)
+        self.assertEqual(StreamingListResponseTestCase.DATA, [x async for x in sl])
+        self.assertEqual(10, sl.current_page)
+
+    async def test_streaming_list_prefetch_error(self):
+        async def fetch_data(page_num: int, page_size: int) -> OpenEpdApiResponse[list[int], PagingMetaResponseForTest]:
+            if page_num == 3:
+                msg = "Page 3 failed"
+                raise ValueError(msg)
+            return await self.fetch_data(page_num, page_size)
+
+        sl = AsyncStreamingListResponse[int](fetch_data, page_size=10)
+        result = []
+        with self.assertRaisesRegex(ValueError, "Page 3 failed"):
+            async for x in sl.iterator(prefetch_pages=3):
+                result.append(x)
+        # Items of the pages before the failed one are yielded
+        self.assertEqual(StreamingListResponseTestCase.DATA[:20], result)
+
+
+class ThrottlerTestCase(unittest.TestCase):
+    def test_burst(self):
+        throttler = Throttler(rate_per_sec=10, burst=3)
+        self.assertEqual([0.0, 0.0, 0.0], [throttler.reserve() for _ in range(3)])
+        self.assertAlmostEqual(0.1, throttler.reserve(), delta=0.05)
+        self.assertAlmostEqual(0.2, throttler.reserve(), delta=0.05)
+        self.assertEqual(10, Throttler(rate_per_sec=10).burst)
+
+    def test_concurrent_threads(self):
+        throttler = Throttler(rate_per_sec=100, burst=1)
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def reserve() -> None:
+            for _ in range(10):
+                wait = throttler.reserve()
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Every call gets its own slot
+        for i, wait in enumerate(sorted(waits)):
+            self.assertAlmostEqual(i / 100, wait, delta=0.05)
+
+    @unittest.skipIf(os.name != "posix", "Shared state requires fcntl")
+    def test_shared_state(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_file = os.path.join(tmp_dir, "throttle.state")
+            first = Throttler(rate_per_sec=10, burst=2, state_file=state_file)
+            second = Throttler(rate_per_sec=10, burst=2, state_file=state_file)
+            self.assertEqual(0.0, first.reserve())
+            self.assertEqual(0.0, second.reserve())
+            self.assertAlmostEqual(0.1, first.reserve(), delta=0.05)
+            self.assertAlmostEqual(0.2, second.reserve(), delta=0.05)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            Throttler(rate_per_sec=0)
+
+    def test_pause(self):
+        throttler = Throttler(rate_per_sec=100, burst=5)
+        throttler.pause(0.5)
+        self.assertAlmostEqual(0.5, throttler.reserve(), delta=0.05)
+
+
+class AdaptiveRateControllerTestCase(unittest.TestCase):
+    def test_additive_increase(self):
+        controller = AdaptiveRateController(initial_rate=2, rate_step=1, initial_concurrency=1, max_rate=3)
+        for _ in range(2):
+            controller.on_response(200)
+        self.assertEqual((3, 2), (controller.rate, controller.concurrency))
+        for _ in range(3):
+            controller.on_response(404)
+        # Limited by max_rate
+        self.assertEqual((3, 3), (controller.rate, controller.concurrency))
+        # Server errors are neither success nor overload
+        controller.on_response(500)
+        stats = controller.get_stats()
+        self.assertEqual((6, 2, 0), (stats.responses, stats.increases, stats.decreases))
+
+    def test_multiplicative_decrease(self):
+        controller = AdaptiveRateController(initial_rate=8, initial_concurrency=8, min_rate=3, cooldown_sec=60)
+        controller.on_response(429)
+        self.assertEqual((4, 4), (controller.rate, controller.concurrency))
+        # Responses to the requests sent before the cut don't cut the limits again
+        controller.on_response(503)
+        self.assertEqual((4, 4), (controller.rate, controller.concurrency))
+        stats = controller.get_stats()
+        self.assertEqual((1, 1, 1), (stats.throttled, stats.unavailable, stats.decreases))
+
+        controller = AdaptiveRateController(initial_rate=8, initial_concurrency=8, min_rate=3, cooldown_sec=0)
+        controller.on_response(429)
+        controller.on_response(429)
+        self.assertEqual((3, 2), (controller.rate, controller.concurrency))
+
+    def test_slot(self):
+        controller = AdaptiveRateController(initial_rate=1, initial_concurrency=2)
+        in_flight: list[int] = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(2)
+
+        def request() -> None:
+            with controller.slot():
+                with lock:
+                    in_flight.append(controller.get_stats().in_flight)
+                barrier.wait(timeout=1)
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(6, len(in_flight))
+        self.assertLessEqual(max(in_flight), 2)
+        self.assertEqual(0, controller.get_stats().in_flight)
+
+    def test_async_slot_event_loops(self):
+        # Slots are shared by coroutines of different loops and threads, releases wake the waiters of other loops
+        controller = AdaptiveRateController(initial_rate=1, initial_concurrency=1)
+        in_flight: list[int] = []
+
+        async def requests() -> None:
+            for _ in range(20):
+                async with controller.async_slot():
+                    in_flight.append(controller.get_stats().in_flight)
+                    await asyncio.sleep(0)
+
+        def thread_request() -> None:
+            for _ in range(20):
+                with controller.slot():
+                    in_flight.append(controller.get_stats().in_flight)
+
+        threads = [threading.Thread(target=asyncio.run, args=(requests(),)) for _ in range(3)]
+        threads.append(threading.Thread(target=thread_request))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        self.assertFalse(any(t.is_alive() for t in threads))
+        self.assertEqual(80, len(in_flight))
+        self.assertEqual(1, max(in_flight))
+        self.assertEqual(0, controller.get_stats().in_flight)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AdaptiveRateController(decrease_factor=1)
+        with self.assertRaises(ValueError):
+            AdaptiveRateController(min_rate=10, max_rate=5)
+
+
+class SingleFlightTestCase(unittest.TestCase):
+    def test_coalescing(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[str] = []
+
+        def call() -> str:
+            calls.append("a")
+            started.set()
+            release.wait(timeout=5)
+            return "result"
+
+        results: list[str] = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("a", call)))
+        leader.start()
+        started.wait(timeout=5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do("a", call))) for _ in range(3)]
+        for t in followers:
+            t.start()
+        # Gives the followers time to join the call in flight
+        time.sleep(0.2)
+        release.set()
+        for t in [leader, *followers]:
+            t.join()
+        self.assertEqual(["result"] * 4, results)
+        self.assertEqual(1, len(calls))
+        # Finished calls are not cached
+        self.assertEqual("other", flight.do("a", lambda: "other"))
+
+    def test_error(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do("a", lambda: int("x"))
+        self.assertEqual(1, flight.do("a", lambda: 1))
+
+
+class AsyncSingleFlightTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_coalescing(self):
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        self.assertEqual([1, 1, 1], await asyncio.gather(*(flight.do("a", call) for _ in range(3))))
+        self.assertEqual(2, await flight.do("a", call))
+
+    async def test_error(self):
+        flight = AsyncSingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0)
+            raise ValueError
+
+        results = await asyncio.gather(flight.do("a", call), flight.do("a", call), return_exceptions=True)
+        self.assertTrue(all(isinstance(x, ValueError) for x in results))
 
 
 class TestValidationErrorSerialization(unittest.TestCase):
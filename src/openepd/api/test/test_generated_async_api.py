@@ -0,0 +1,75 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import ast
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+import unittest
+from unittest import TestCase
+
+API_ROOT = Path(__file__).parents[1]
+GENERATOR_PATH = Path(__file__).parents[4] / "tools" / "openepd" / "codegen" / "generate_async_api.py"
+
+
+def _load_generator() -> ModuleType | None:
+    if not GENERATOR_PATH.exists():
+        return None
+    spec = importlib.util.spec_from_file_location("generate_async_api", GENERATOR_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _normalize(source: str) -> tuple[list[str], list[str]]:
+    """Get the dumps of the imports and other statements, so that formatting and import order don't matter."""
+    imports: list[str] = []
+    statements: list[str] = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            names = [ast.alias(name=x.name, asname=x.asname) for x in sorted(node.names, key=lambda x: x.name)]
+            if isinstance(node, ast.ImportFrom):
+                imports.append(ast.dump(ast.ImportFrom(module=node.module, names=names, level=node.level)))
+            else:
+                imports.append(ast.dump(ast.Import(names=names)))
+        else:
+            statements.append(ast.dump(node))
+    return sorted(imports), statements
+
+
+@unittest.skipIf(not GENERATOR_PATH.exists(), "Code generator is available in the source tree only")
+class GeneratedAsyncApiTestCase(TestCase):
+    def test_generated_async_api_is_in_sync(self) -> None:
+        """
+        Test that the asynchronous method groups are synchronized with the synchronous ones.
+
+        If the test fails, the generated code is out of sync and should be updated by running
+        ``make codegen-async-api``.
+        """
+        generator = _load_generator()
+        assert generator is not None
+        sync_modules = [x for x in API_ROOT.rglob("*sync_api.py") if not x.name.endswith("async_api.py")]
+        self.assertTrue(sync_modules)
+        for sync_path in sync_modules:
+            async_path = sync_path.with_name(sync_path.name.removesuffix("sync_api.py") + "async_api.py")
+            with self.subTest(module=str(sync_path.relative_to(API_ROOT))):
+                generated = generator.generate_async_api(sync_path.read_text(), generator.get_module_name(sync_path))
+                self.assertEqual(
+                    _normalize(generated),
+                    _normalize(async_path.read_text()),
+                    msg=f"`{async_path.relative_to(API_ROOT.parents[1])}` is out of sync with `{sync_path.name}`. "
+                    "Please run `make codegen-async-api` to update the generated code.",
+                )
@@ -0,0 +1,158 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from types import SimpleNamespace
+from typing import cast
+import unittest
+
+from requests import Response
+
+from openepd.api.async_client import OpenEpdApiClientAsync
+from openepd.api.base_sync_client import SyncHttpClient
+from openepd.api.dto.meta import PerformanceMeta
+from openepd.api.epd.dto import EpdSearchMeta, EpdSearchResponse
+from openepd.api.epd.sync_api import EpdApi
+from openepd.api.errors import ObjectNotFound
+from openepd.api.metrics import (
+    Histogram,
+    InMemoryMetricsSink,
+    MethodCallMetrics,
+    RequestMetrics,
+    get_performance_meta,
+    normalize_endpoint,
+)
+from openepd.api.sync_client import OpenEpdApiClientSync
+from openepd.api.test.stub_server import start_stub_server
+
+
+class _RecordingSink(InMemoryMetricsSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: list[RequestMetrics] = []
+        self.method_calls: list[MethodCallMetrics] = []
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        super().on_request(metrics)
+        self.requests.append(metrics)
+
+    def on_method_call(self, metrics: MethodCallMetrics) -> None:
+        super().on_method_call(metrics)
+        self.method_calls.append(metrics)
+
+
+class _CustomEpdApi(EpdApi):
+    def get_two(self, first: str, second: str) -> None:
+        self.get_by_openxpd_uuid(first)
+        self.get_by_openxpd_uuid(second)
+
+
+class MetricsTestCase(unittest.TestCase):
+    def test_normalize_endpoint(self):
+        self.assertEqual("/epds/{id}", normalize_endpoint("/epds/ec3b9j5t"))
+        self.assertEqual("/v2/epds/search", normalize_endpoint("/v2/epds/search?page_number=2"))
+        self.assertEqual(
+            "/api/pcrs/{id}", normalize_endpoint("https://example.com/api/pcrs/0b4b4e6a-5a8e-4c43-9d35-5ef5a3d0b3c1")
+        )
+        self.assertEqual("/orgs/{id}", normalize_endpoint("/orgs/42"))
+
+    def test_histogram(self):
+        histogram = Histogram()
+        self.assertEqual(0.0, histogram.quantile(0.5))
+        for value in (0.002, 0.003, 0.2, 7):
+            histogram.add(value)
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(1.80125, histogram.mean)
+        self.assertEqual(0.0025, histogram.quantile(0.25))
+        self.assertEqual(0.25, histogram.quantile(0.75))
+        self.assertEqual(7, histogram.quantile(1))
+
+    def test_performance_meta(self):
+        performance = PerformanceMeta(execution_time_ms=12.0)
+        response = EpdSearchResponse(payload=[], meta=EpdSearchMeta(performance=performance))
+        self.assertEqual(performance, get_performance_meta(response))
+        self.assertEqual(performance, get_performance_meta((response, Response())))
+        self.assertIsNone(get_performance_meta(EpdSearchResponse(payload=[], meta=EpdSearchMeta())))
+        self.assertIsNone(get_performance_meta({"meta": {"performance": {"execution_time_ms": 5}}}))
+        self.assertIsNone(get_performance_meta(None))
+
+
+class ClientMetricsTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server, self.base_url = start_stub_server(self)
+        self.sink = _RecordingSink()
+
+    def test_sync_client(self):
+        client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000, metrics=self.sink)
+        client.epds.get_by_openxpd_uuid("ec3b9j5t")
+        with self.assertRaises(ObjectNotFound):
+            client.epds.get_by_openxpd_uuid("missing01")
+        client._http_client.do_request("get", "/throttled")
+        self.assertEqual(7, len(list(client.epds.find("omf", page_size=3))))
+
+        request = self.sink.requests[0]
+        self.assertEqual(("GET", "/epds/{id}", 200, 1), request[:2] + (request.status_code, request.attempts))
+        self.assertGreater(request.bytes_received, 0)
+        self.assertGreater(request.network_time, 0)
+        self.assertLessEqual(request.network_time + request.throttle_time, request.total_time)
+        self.assertIsNone(request.server_performance)
+
+        endpoints = self.sink.get_endpoint_stats()
+        self.assertEqual((2, 1), (endpoints["GET /epds/{id}"].count, endpoints["GET /epds/{id}"].errors))
+        self.assertEqual((1, 1), (endpoints["GET /throttled"].retries, endpoints["GET /throttled"].throttled))
+        search = endpoints["GET /v2/epds/search"]
+        self.assertEqual((3, 3), (search.count, search.server_time.count))
+        self.assertAlmostEqual(0.012, search.server_time.mean)
+
+        methods = self.sink.get_method_stats()
+        self.assertEqual(
+            (2, 1), (methods["EpdApi.get_by_openxpd_uuid"].count, methods["EpdApi.get_by_openxpd_uuid"].errors)
+        )
+        self.assertEqual(3, methods["EpdApi.find_raw"].count)
+        # Lazy list doesn't make requests itself
+        self.assertNotIn("EpdApi.find", methods)
+        call = self.sink.method_calls[0]
+        self.assertEqual(1, call.requests)
+        self.assertAlmostEqual(call.total_time, call.request_time + call.parse_time)
+
+    def test_method_group_subclass(self):
+        client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000, metrics=self.sink)
+        _CustomEpdApi(client._http_client).get_two("ec3b9j01", "ec3b9j02")
+        # Methods added by the subclass are not instrumented implicitly, the inherited ones are
+        self.assertEqual({"_CustomEpdApi.get_by_openxpd_uuid"}, set(self.sink.get_method_stats()))
+        self.assertEqual(2, self.sink.get_method_stats()["_CustomEpdApi.get_by_openxpd_uuid"].count)
+
+    def test_client_without_metrics(self):
+        client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000)
+        # Clients without metrics (e.g. test doubles) are supported
+        http_client = cast(SyncHttpClient, SimpleNamespace(do_request=client._http_client.do_request))
+        self.assertEqual("ec3b9j5t", EpdApi(http_client).get_by_openxpd_uuid("ec3b9j5t").id)
+
+    def test_get_many(self):
+        client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000, metrics=self.sink)
+        client.epds.get_many(["ec3b9j01", "ec3b9j02"])
+        self.assertEqual({"EpdApi.get_by_openxpd_uuid"}, set(self.sink.get_method_stats()))
+        self.assertEqual(2, self.sink.get_method_stats()["EpdApi.get_by_openxpd_uuid"].count)
+
+    async def test_async_client(self):
+        async with OpenEpdApiClientAsync(self.base_url, "secret", requests_per_sec=1000, metrics=self.sink) as client:
+            await client.epds.get_by_openxpd_uuid("ec3b9j5t")
+            await client.epds.get_many(["ec3b9j01", "ec3b9j02"])
+            self.assertEqual(7, len([x async for x in client.epds.find("omf", page_size=3)]))
+        endpoints = self.sink.get_endpoint_stats()
+        self.assertEqual(3, endpoints["GET /epds/{id}"].count)
+        self.assertEqual(3, endpoints["GET /v2/epds/search"].server_time.count)
+        methods = self.sink.get_method_stats()
+        self.assertEqual({"AsyncEpdApi.get_by_openxpd_uuid", "AsyncEpdApi.find_raw"}, set(methods))
+        self.assertEqual(3, methods["AsyncEpdApi.get_by_openxpd_uuid"].count)
@@ -13,15 +13,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 from os import environ
 from typing import cast
 import unittest
+from unittest import mock
 
 from requests import Response
 
-from openepd.api.errors import ApiError, AuthError, ValidationError
+from openepd.api.base_sync_client import SyncHttpClient
+from openepd.api.common import AdaptiveRateController
+from openepd.api.errors import ApiError, AuthError, ObjectNotFound, ValidationError
 from openepd.api.sync_client import OpenEpdApiClientSync
+from openepd.api.test.stub_server import start_stub_server
 from openepd.model.epd import Epd
 from openepd.model.generic_estimate import GenericEstimateWithDeps
 from openepd.model.industry_epd import IndustryEpd, IndustryEpdPreview
@@ -238,3 +243,67 @@ class LocalOnlySyncClientApiTestCase(unittest.TestCase):
         resp = self.api_client.industry_epds.create(new_iepd)
         self.assertEqual("Test IEPD name", resp.name)
         self.assertIsNotNone(resp.id)
+
+
+class SyncClientStubTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server, self.base_url = start_stub_server(self)
+        self.api_client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000)
+
+    def test_get_many(self):
+        uuids = ["ec3b9j01", "ec3b9j02", "ec3b9j01", "missing", "ec3b9j03"]
+        results = self.api_client.epds.get_many(uuids, concurrency=4)
+        self.assertEqual(["ec3b9j01", "ec3b9j02", "missing", "ec3b9j03"], list(results))
+        self.assertEqual("ec3b9j02", cast(Epd, results["ec3b9j02"].obj).id)
+        self.assertIsNone(results["ec3b9j02"].error)
+        self.assertIsNone(results["missing"].obj)
+        self.assertIsInstance(results["missing"].error, ObjectNotFound)
+        # Duplicates are fetched once
+        self.assertEqual(1, self.server.hits["/epds/ec3b9j01"])
+        # Workers use the connection pool of the client
+        self.assertIsNotNone(self.api_client._http_client._session)
+        self.assertLessEqual(len(self.server.clients), 4)
+
+    def test_get_many_pool_size(self):
+        api_client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000, pool_maxsize=2)
+        uuids = ["ec3b9j01", "ec3b9j02", "ec3b9j03", "missing"]
+        results = api_client.epds.get_many(uuids, concurrency=8)
+        self.assertEqual(uuids, list(results))
+        # Not more workers than the connections in the pool, so that no connections are discarded
+        self.assertLessEqual(len(self.server.clients), 2)
+
+    def test_thread_pool_reuses_connections(self):
+        api_client = OpenEpdApiClientSync(self.base_url, "secret", requests_per_sec=1000, pool_maxsize=32)
+        self.addCleanup(api_client.close)
+        uuids = [f"ec3b9j{x:02d}" for x in range(100)]
+        with self.assertNoLogs("urllib3.connectionpool", level="WARNING"), ThreadPoolExecutor(32) as executor:
+            epds = list(executor.map(api_client.epds.get_by_openxpd_uuid, uuids))
+        self.assertEqual(uuids, [x.id for x in epds])
+        self.assertLessEqual(len(self.server.clients), 32)
+
+    def test_method_groups_shared_by_threads(self):
+        api_client = OpenEpdApiClientSync(self.base_url, "secret")
+        with ThreadPoolExecutor(4) as executor:
+            groups = list(executor.map(lambda _: api_client.epds, range(8)))
+        self.assertTrue(all(x is api_client.epds for x in groups))
+
+    def test_session_per_thread(self):
+        http_client = SyncHttpClient(self.base_url, session_per_thread=True)
+        self.addCleanup(http_client.close)
+        session = http_client._current_session
+        self.assertIs(session, http_client._current_session)
+        with ThreadPoolExecutor(1) as executor:
+            self.assertIsNot(session, executor.submit(lambda: http_client._current_session).result())
+        http_client.reset_session()
+        self.assertIsNot(session, http_client._current_session)
+
+    def test_adaptive_rate_unavailable(self):
+        controller = AdaptiveRateController(initial_rate=40, cooldown_sec=0.01)
+        http_client = SyncHttpClient(self.base_url, adaptive_rate=controller)
+        self.addCleanup(http_client.close)
+        # Unavailability is handled by the controller, instead of waiting for minutes
+        with mock.patch("openepd.api.base_sync_client.random.randint", side_effect=AssertionError):
+            response = http_client.do_request("get", "/unavailable")
+        self.assertEqual({"ok": True}, response.json())
+        stats = controller.get_stats()
+        self.assertEqual((1, 1), (stats.unavailable, stats.decreases))
@@ -14,18 +14,79 @@
 #  limitations under the License.
 #
 import abc
-from collections.abc import Callable, Iterator, Sequence
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 import csv
-from typing import IO, Self
+import functools
+import hashlib
+import os
+import threading
+from typing import IO, Generic, NamedTuple, Self
 
 from openepd.bundle.model import AssetInfo, AssetType, BundleManifest, RelType
-from openepd.model.base import TOpenEpdObject
+from openepd.model.base import BaseOpenEpdSchema, TOpenEpdObject
 
 AssetFilter = Callable[[AssetInfo], bool]
 """A filter function for assets. Returns True if the asset should be included."""
 AssetRef = str | AssetInfo
 
 
+class DependencyField(NamedTuple):
+    """Field of objects which values are written as separate assets in normalized mode."""
+
+    field_name: str
+    """Name of the field of the object."""
+    rel_type: RelType
+    """Relation of the dependency asset to the object."""
+    asset_type: AssetType
+    """Type of the dependency asset."""
+    model: type[BaseOpenEpdSchema]
+    """Class the dependency is read as."""
+
+
+@functools.cache
+def get_dependency_fields() -> tuple[DependencyField, ...]:
+    """Get the fields of objects which values are written as separate assets in normalized mode."""
+    # Imported here, so the models are not loaded by the bundle package until they are needed
+    from openepd.model.org import Org, Plant
+    from openepd.model.pcr import Pcr
+
+    return (
+        DependencyField("manufacturer", RelType.Manufacturer, AssetType.Org, Org),
+        DependencyField("epd_developer", RelType.EpdDeveloper, AssetType.Org, Org),
+        DependencyField("program_operator", RelType.ProgramOperator, AssetType.Org, Org),
+        DependencyField("third_party_verifier", RelType.ThirdPartyVerifier, AssetType.Org, Org),
+        DependencyField("plants", RelType.Plant, AssetType.Plant, Plant),
+        DependencyField("pcr", RelType.Pcr, AssetType.Pcr, Pcr),
+    )
+
+
+class ObjectAssetReadResult(NamedTuple, Generic[TOpenEpdObject]):
+    """The result of reading a single object asset in a batch."""
+
+    ref: str
+    """Reference of the asset."""
+    obj: TOpenEpdObject | None
+    """Parsed object or None if reading failed."""
+    error: Exception | None
+    """The error occurred while reading or parsing the asset, None on success."""
+
+
+class AssetIntegrityError(NamedTuple):
+    """The mismatch between the asset content and its TOC record found by the integrity verification."""
+
+    ref: str
+    """Reference of the asset."""
+    message: str
+    """Description of the mismatch."""
+
+
+def _parse_object_asset(obj_class: type[TOpenEpdObject], data: bytes) -> TOpenEpdObject:
+    # Must be a module level function to be usable from the process pool
+    return obj_class.parse_raw(data)
+
+
 class toc_dialect(csv.Dialect):
     """Describe the usual properties of Excel-generated CSV files."""
 
@@ -55,7 +116,57 @@ class BundleMixin:
         "size",
         "custom_type",
         "custom_data",
+        "content_hash",
+        "location",
+    )
+    _TOC_OPTIONAL_FIELDS: tuple[str, ...] = ("content_hash", "location")
+    """TOC fields added in later versions of the format, bundles written before don't have them."""
+    _TOC_NULLABLE_FIELDS: tuple[str, ...] = (
+        "rel_type",
+        "rel_asset",
+        "lang",
+        "content_type",
+        "custom_type",
+        "custom_data",
+        "content_hash",
+        "location",
     )
+    """TOC fields for which empty value in CSV means None."""
+    _CONTENT_HASH_ALGORITHM: str = "sha256"
+    """The algorithm of the content hashes written to the TOC, any of hashlib algorithms could be read."""
+    _HASH_BUFFER_SIZE: int = 64 * 1024
+
+    @classmethod
+    def _hash_stream(
+        cls,
+        data: IO[bytes],
+        copy_to: IO[bytes] | None = None,
+        algorithm: str | None = None,
+        buffer_size: int | None = None,
+    ) -> tuple[str, int]:
+        """
+        Compute the content hash of the stream, reading it to the end.
+
+        :param data: the stream to hash
+        :param copy_to: if given, the content is copied to this stream while hashing
+        :param algorithm: hashlib algorithm, the default one if None
+        :param buffer_size: the size of chunks to read the stream with
+        :return: the hash in the TOC form (`<algorithm>:<hex digest>`) and the size of the content
+        """
+        algorithm = algorithm or cls._CONTENT_HASH_ALGORITHM
+        hasher = hashlib.new(algorithm)
+        size = 0
+        while chunk := data.read(buffer_size or cls._HASH_BUFFER_SIZE):
+            hasher.update(chunk)
+            size += len(chunk)
+            if copy_to is not None:
+                copy_to.write(chunk)
+        return f"{algorithm}:{hasher.hexdigest()}", size
+
+    @classmethod
+    def _hash_bytes(cls, data: bytes) -> str:
+        """Compute the content hash of the data in the TOC form."""
+        return f"{cls._CONTENT_HASH_ALGORITHM}:{hashlib.new(cls._CONTENT_HASH_ALGORITHM, data).hexdigest()}"
 
     @classmethod
     def _asset_ref_to_str(cls, asset_ref: AssetRef) -> str:
@@ -104,10 +215,29 @@ class BundleMixin:
         else:
             return rel_asset_str
 
+    @classmethod
+    def _get_rel_asset_list(cls, asset_info: AssetInfo) -> list[str]:
+        """Get the list of related asset references from an AssetInfo object."""
+        deserialized = cls._deserialize_rel_asset_from_csv(asset_info.rel_asset)
+        if isinstance(deserialized, list):
+            return deserialized
+        elif isinstance(deserialized, str):
+            return [deserialized]
+        else:
+            return []
+
 
 class BaseBundleReader(BundleMixin, metaclass=abc.ABCMeta):
     """Base class for bundle readers."""
 
+    _hydrate_dependencies: bool = False
+    """If True, objects are hydrated on read, see `hydrate_dependencies`."""
+    _dependency_cache: OrderedDict[str, BaseOpenEpdSchema] | None = None
+    _dependency_cache_size: int = 1024
+    """Maximal number of the parsed dependencies kept for reuse by `hydrate_dependencies`, least recent are evicted."""
+    _dependency_cache_lock = threading.Lock()
+    """Guards the dependency caches of all readers, it is held for lookups and updates only, not for parsing."""
+
     def __enter__(self) -> Self:
         return self
 
@@ -117,12 +247,10 @@ class BaseBundleReader(BundleMixin, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def get_manifest(self) -> BundleManifest:
         """Get the manifest of the bundle. Manifest object is immutable."""
-        pass
 
     @abc.abstractmethod
     def close(self):
         """Close the reader."""
-        pass
 
     @abc.abstractmethod
     def get_relative_assets_iter(
@@ -135,12 +263,10 @@ class BaseBundleReader(BundleMixin, metaclass=abc.ABCMeta):
         :param rel_type: The type of the relation. If None, all relations are returned.
         :return: An iterator over the related assets.
         """
-        pass
 
     @abc.abstractmethod
     def assets_iter(self) -> Iterator[AssetInfo]:
         """Get an iterator over all assets in the bundle."""
-        pass
 
     @abc.abstractmethod
     def root_assets_iter(
@@ -161,22 +287,302 @@ class BaseBundleReader(BundleMixin, metaclass=abc.ABCMeta):
         :param is_translated: Whether the asset is translated.
         :return: An iterator over the root assets.
         """
-        pass
 
     @abc.abstractmethod
     def get_asset_by_ref(self, asset_ref: AssetRef) -> AssetInfo | None:
         """Get an asset by its reference or None if not found."""
-        pass
 
     @abc.abstractmethod
     def read_blob_asset(self, asset_ref: AssetRef) -> IO[bytes]:
         """Read a blob asset by given reference."""
-        pass
 
     @abc.abstractmethod
     def read_object_asset(self, obj_class: type[TOpenEpdObject], asset_ref: AssetRef) -> TOpenEpdObject:
         """Read an object asset by given reference."""
-        pass
+
+    def read_blob_asset_view(self, asset_ref: AssetRef) -> memoryview | IO[bytes]:
+        """
+        Read a blob asset without copying its content, if possible.
+
+        Returns a read-only memoryview over the memory-mapped content when the storage allows it (e.g. for entries
+        stored without compression), and falls back to the stream returned by `read_blob_asset` otherwise. The view
+        should be released once it is not needed anymore.
+        """
+        return self.read_blob_asset(asset_ref)
+
+    def read_object_assets_many(
+        self,
+        obj_class: type[TOpenEpdObject],
+        assets: Iterable[AssetRef] | AssetFilter | None = None,
+        ordered: bool = True,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> Iterator[ObjectAssetReadResult[TOpenEpdObject]]:
+        """
+        Read many object assets, parsing them in parallel.
+
+        Raw asset data is read sequentially in the calling thread, while parsing (which is CPU-bound) is delegated to
+        the executor. The number of assets being processed at the same time is bounded, so memory consumption doesn't
+        depend on the number of requested assets. Errors do not interrupt the iteration, they are reported in the
+        result of the failing asset instead.
+
+        :param obj_class: The class of objects to read.
+        :param assets: Assets to read - either a list of references or a filter function. If None, all assets of the
+            type matching `obj_class` are read.
+        :param ordered: If True, results are yielded in the order of assets, otherwise as soon as they are ready.
+        :param max_workers: The number of worker processes. Ignored if `executor` is given.
+        :param executor: Executor to parse objects with. If None, a process pool is created for the duration of the
+            iteration.
+        :return: An iterator over the results.
+        """
+        if obj_class.get_asset_type() is None:
+            msg = f"Target object {obj_class.__name__} is not supported asset"
+            raise ValueError(msg)
+        asset_refs: Iterable[AssetRef]
+        if assets is None or callable(assets):
+            _filter = assets
+            asset_refs = (
+                x
+                for x in self.assets_iter()
+                if x.type == obj_class.get_asset_type() and (_filter is None or _filter(x))
+            )
+        else:
+            asset_refs = assets
+
+        own_executor = executor is None
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        max_pending = 4 * (max_workers or os.cpu_count() or 1)
+
+        def _submit(asset_ref: AssetRef) -> tuple[str, Future]:
+            ref = self._asset_ref_to_str(asset_ref)
+            try:
+                asset = self._get_object_asset(obj_class, asset_ref)
+                return ref, executor.submit(_parse_object_asset, obj_class, self._read_asset_bytes(asset))
+            # Errors are reported per asset and don't fail the whole batch
+            except Exception as e:  # noqa: BLE001
+                failed: Future = Future()
+                failed.set_exception(e)
+                return ref, failed
+
+        def _to_result(ref: str, future: Future) -> ObjectAssetReadResult[TOpenEpdObject]:
+            error = future.exception()
+            if error is not None:
+                return ObjectAssetReadResult(ref, None, error)  # type: ignore[arg-type]
+            if not self._hydrate_dependencies:
+                return ObjectAssetReadResult(ref, future.result(), None)
+            try:
+                return ObjectAssetReadResult(ref, self.hydrate_dependencies(future.result(), ref), None)
+            except Exception as e:  # noqa: BLE001
+                return ObjectAssetReadResult(ref, None, e)  # type: ignore[arg-type]
+
+        pending: deque[tuple[str, Future]] = deque()
+        try:
+            refs_iter = iter(asset_refs)
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    next_ref = next(refs_iter, None)
+                    if next_ref is None:
+                        exhausted = True
+                    else:
+                        pending.append(_submit(next_ref))
+                if not pending:
+                    return
+                if ordered:
+                    yield _to_result(*pending.popleft())
+                else:
+                    done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                    for item in [x for x in pending if x[1] in done]:
+                        pending.remove(item)
+                        yield _to_result(*item)
+        finally:
+            for _, f in pending:
+                f.cancel()
+            if own_executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def verify_assets(
+        self,
+        assets: Iterable[AssetRef] | AssetFilter | None = None,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> list[AssetIntegrityError]:
+        """
+        Verify the content of the assets against the sizes and content hashes recorded in the TOC.
+
+        Assets are read and hashed in parallel. Threads are used by default, since both decompression and hashing
+        release GIL. Assets without recorded hash (e.g. written by older versions) are checked by size only.
+
+        :param assets: Assets to verify - either a list of references or a filter function. If None, all assets are
+            verified.
+        :param max_workers: The number of worker threads. Ignored if `executor` is given.
+        :param executor: Executor to verify assets with. If None, a thread pool is created for the duration of the
+            call.
+        :return: The list of found mismatches in the order of assets, empty if the bundle is intact.
+        """
+        asset_refs: Iterable[AssetRef]
+        if assets is None or callable(assets):
+            _filter = assets
+            asset_refs = (x for x in self.assets_iter() if _filter is None or _filter(x))
+        else:
+            asset_refs = assets
+
+        own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        max_pending = 4 * (max_workers or os.cpu_count() or 1)
+
+        errors: list[AssetIntegrityError] = []
+        pending: deque[tuple[str, Future[str | None]]] = deque()
+
+        def _collect(ref: str, future: Future[str | None]) -> None:
+            try:
+                message = future.result()
+            # Unreadable asset is an integrity error of the bundle rather than an error of the verification
+            except Exception as e:  # noqa: BLE001
+                message = f"Asset could not be read: {e}"
+            if message is not None:
+                errors.append(AssetIntegrityError(ref, message))
+
+        try:
+            # Only a window of assets is in flight, so that the assets of large bundles are not queued all at once
+            for asset_ref in asset_refs:
+                if len(pending) >= max_pending:
+                    _collect(*pending.popleft())
+                pending.append((self._asset_ref_to_str(asset_ref), executor.submit(self.__verify_asset, asset_ref)))
+            while pending:
+                _collect(*pending.popleft())
+            return errors
+        finally:
+            for _, f in pending:
+                f.cancel()
+            if own_executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def __verify_asset(self, asset_ref: AssetRef) -> str | None:
+        asset = self.get_asset_by_ref(asset_ref)
+        if asset is None:
+            return "Asset not found"
+        algorithm = asset.content_hash.partition(":")[0] if asset.content_hash else self._CONTENT_HASH_ALGORITHM
+        if algorithm not in hashlib.algorithms_available:
+            return f"Unsupported hash algorithm {algorithm}"
+        with self.read_blob_asset(asset) as stream:
+            content_hash, size = self._hash_stream(stream, algorithm=algorithm)
+        if asset.size is not None and size != asset.size:
+            return f"Size mismatch. Expected {asset.size}, got {size}"
+        if asset.content_hash is not None and content_hash != asset.content_hash:
+            return f"Content hash mismatch. Expected {asset.content_hash}, got {content_hash}"
+        return None
+
+    def hydrate_dependencies(self, obj: TOpenEpdObject, asset_ref: AssetRef) -> TOpenEpdObject:
+        """
+        Restore the dependencies (organizations, plants and PCR) of the object written in normalized mode.
+
+        Recently used dependencies are parsed once and the same instance is set to all the objects referring to it, so
+        dependencies must not be modified. Objects written without normalization are returned as is.
+
+        :param obj: the object read from the asset
+        :param asset_ref: the asset the object was read from
+        :return: the same object with its dependencies set
+        """
+        dependency_fields = get_dependency_fields()
+        rel_types = [x.rel_type for x in dependency_fields]
+        values: dict[str, list[BaseOpenEpdSchema]] = {}
+        for dependency in self.get_relative_assets_iter(asset_ref, rel_types):
+            for x in dependency_fields:
+                if dependency.rel_type == x.rel_type and x.field_name in obj.__fields__:
+                    values.setdefault(x.field_name, []).append(self.__get_dependency(dependency, x.model))
+        for field_name, items in values.items():
+            setattr(obj, field_name, items if isinstance(getattr(obj, field_name), list) else items[0])
+        return obj
+
+    def __get_dependency(self, asset: AssetInfo, dependency_class: type[BaseOpenEpdSchema]) -> BaseOpenEpdSchema:
+        # Rows of the same dependency point to the same entry
+        key = asset.location or asset.ref
+        with self._dependency_cache_lock:
+            if self._dependency_cache is None:
+                self._dependency_cache = OrderedDict()
+            cache = self._dependency_cache
+            dependency = cache.get(key)
+            if dependency is not None:
+                cache.move_to_end(key)
+                return dependency
+        parsed = dependency_class.parse_raw(self._read_asset_bytes(asset))
+        with self._dependency_cache_lock:
+            # Another thread might have parsed the same dependency meanwhile, its instance is kept
+            dependency = cache.setdefault(key, parsed)
+            cache.move_to_end(key)
+            while len(cache) > self._dependency_cache_size:
+                cache.popitem(last=False)
+        return dependency
+
+    def _create_asset_filter(
+        self,
+        asset_type: AssetType | str | None = None,
+        name: str | None = None,
+        parent_ref: AssetRef | None = None,
+        ref_type: str | None = None,
+        is_translated: bool | None = None,
+    ) -> AssetFilter:
+        """Create the filter function for the root assets from the filtering arguments of `root_assets_iter`."""
+
+        def _filter(a: AssetInfo):
+            if asset_type is not None and a.type != asset_type:
+                return False
+            if name is not None and a.name != name:
+                return False
+            if parent_ref is not None:
+                parent_ref_str = self._asset_ref_to_str(parent_ref)
+                # Get the actual list of related assets
+                rel_asset_list = self._get_rel_asset_list(a)
+                if parent_ref_str not in rel_asset_list:
+                    return False
+            if ref_type is not None and a.rel_type != ref_type:
+                return False
+            if is_translated is not None and a.lang is not None and "translated" in a.lang:
+                return True
+            return True
+
+        return _filter
+
+    def _get_object_asset(self, obj_class: type[TOpenEpdObject], asset_ref: AssetRef) -> AssetInfo:
+        """Get the asset by reference ensuring it could be read as an object of the given class."""
+        asset = self.get_asset_by_ref(asset_ref)
+        if asset is None:
+            msg = "Asset not found"
+            raise ValueError(msg)
+        if obj_class.get_asset_type() is None:
+            msg = f"Target object {obj_class.__name__} is not supported asset"
+            raise ValueError(msg)
+        if asset.type != obj_class.get_asset_type():
+            msg = f"Asset type mismatch. Expected {obj_class.get_asset_type()}, got {asset.type}"
+            raise ValueError(msg)
+        return asset
+
+    def read_asset_bytes(self, asset_ref: AssetRef) -> bytes:
+        """
+        Read the whole content of the asset of any type, e.g. to parse it as plain JSON without validation.
+
+        :param asset_ref: the asset to read
+        :return: the content of the asset
+        :raise ValueError: if the asset is not found
+        """
+        asset = self.get_asset_by_ref(asset_ref)
+        if asset is None:
+            msg = "Asset not found"
+            raise ValueError(msg)
+        return self._read_asset_bytes(asset)
+
+    @classmethod
+    def get_rel_asset_list(cls, asset_info: AssetInfo) -> list[str]:
+        """Get the references of the assets the given asset is related to, empty list for the root assets."""
+        return cls._get_rel_asset_list(asset_info)
+
+    def _read_asset_bytes(self, asset: AssetInfo) -> bytes:
+        """Read the whole content of the asset. Subclasses might override this with a more efficient approach."""
+        with self.read_blob_asset(asset) as stream:
+            return stream.read()
 
     def get_relative_assets(self, asset: AssetInfo, rel_type: str | Sequence[str] | None = None) -> list[AssetInfo]:
         """Get all assets that are related to the given asset."""
@@ -230,7 +636,6 @@ class BaseBundleWriter(BundleMixin, metaclass=abc.ABCMeta):
         custom_data: str | None = None,
     ) -> AssetInfo:
         """Write a blob asset."""
-        pass
 
     @abc.abstractmethod
     def write_object_asset(
@@ -246,14 +651,23 @@ class BaseBundleWriter(BundleMixin, metaclass=abc.ABCMeta):
         custom_data: str | None = None,
     ) -> AssetInfo:
         """Write an object asset."""
-        pass
+
+    @abc.abstractmethod
+    def copy_asset(self, asset: AssetInfo, data: IO[bytes]) -> AssetInfo:
+        """
+        Write the asset read from another bundle, keeping its reference and metadata.
+
+        The content is copied as is, without parsing. Size and content hash are computed anew.
+
+        :param asset: the record of the asset in the source bundle
+        :param data: the content of the asset
+        :return: the record of the written asset
+        """
 
     @abc.abstractmethod
     def commit(self):
         """Write all relevant metadata into the bundle."""
-        pass
 
     @abc.abstractmethod
     def close(self):
         """Close the writer."""
-        pass
@@ -0,0 +1,190 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Bundle diffs and delta bundles.
+
+Delta bundle holds only the assets added or changed since the base bundle, along with the references of the removed
+ones (tombstones). It is an ordinary bundle, the tombstones are kept in the JSON blob asset of `DELTA_CUSTOM_TYPE`
+custom type, so delta bundles could be written and read by any bundle writer and reader. The tombstones asset is named
+``blob/delta.json`` unless the delta holds an asset with this reference, then a free ``blob/delta-<n>.json`` is used.
+"""
+
+from io import BytesIO
+import json
+from typing import NamedTuple
+
+from openepd.bundle.base import BaseBundleReader, BaseBundleWriter, BundleMixin
+from openepd.bundle.model import AssetInfo, AssetType
+
+__all__ = ("DELTA_CUSTOM_TYPE", "BundleDiff", "apply_delta", "diff_bundles", "write_delta_bundle")
+
+DELTA_CUSTOM_TYPE = "openepd.bundle.delta"
+"""Custom type of the blob asset holding the tombstones of the delta bundle."""
+
+# Fields of the TOC record which changes make the asset changed, besides its content
+_COMPARED_FIELDS = (
+    "name",
+    "type",
+    "lang",
+    "rel_type",
+    "rel_asset",
+    "comment",
+    "content_type",
+    "custom_type",
+    "custom_data",
+)
+
+
+class BundleDiff(NamedTuple):
+    """The difference between two bundles as lists of asset references, in the order of the bundles."""
+
+    added: list[str]
+    """Assets present in the target bundle only."""
+    changed: list[str]
+    """Assets present in both bundles, which content or metadata differ."""
+    removed: list[str]
+    """Assets present in the base bundle only."""
+
+    def is_empty(self) -> bool:
+        """Check if the bundles are the same."""
+        return not (self.added or self.changed or self.removed)
+
+
+def _get_content_hash(reader: BaseBundleReader, asset: AssetInfo, algorithm: str) -> str:
+    if asset.content_hash is not None and asset.content_hash.startswith(f"{algorithm}:"):
+        return asset.content_hash
+    # Bundles written by older versions don't have hashes, the content is hashed then
+    with reader.read_blob_asset(asset) as stream:
+        return BundleMixin._hash_stream(stream, algorithm=algorithm)[0]
+
+
+def _is_same_asset(
+    base: BaseBundleReader, base_asset: AssetInfo, target: BaseBundleReader, target_asset: AssetInfo
+) -> bool:
+    if any(getattr(base_asset, x) != getattr(target_asset, x) for x in _COMPARED_FIELDS):
+        return False
+    if base_asset.size is not None and target_asset.size is not None and base_asset.size != target_asset.size:
+        return False
+    recorded_hash = base_asset.content_hash or target_asset.content_hash
+    algorithm = recorded_hash.partition(":")[0] if recorded_hash else BundleMixin._CONTENT_HASH_ALGORITHM
+    return _get_content_hash(base, base_asset, algorithm) == _get_content_hash(target, target_asset, algorithm)
+
+
+def _get_tombstones_file_name(copied: set[str]) -> str:
+    # The tombstones must not take the reference of a copied asset, they are found by the custom type anyway
+    file_name = "delta.json"
+    counter = 0
+    while f"{AssetType.Blob}/{file_name}" in copied:
+        counter += 1
+        file_name = f"delta-{counter}.json"
+    return file_name
+
+
+def _copy_asset(reader: BaseBundleReader, asset: AssetInfo, writer: BaseBundleWriter) -> None:
+    with reader.read_blob_asset(asset) as stream:
+        writer.copy_asset(asset, stream)
+
+
+def diff_bundles(base: BaseBundleReader, target: BaseBundleReader) -> BundleDiff:
+    """
+    Compare two bundles by asset references, TOC records and content hashes.
+
+    Content hashes recorded in the TOC are compared without reading the assets. The content is read and hashed only
+    if the hash is missing, e.g. for bundles written by older versions.
+
+    :param base: the older bundle
+    :param target: the newer bundle
+    :return: the difference between the bundles
+    """
+    diff = BundleDiff([], [], [])
+    target_refs: set[str] = set()
+    for asset in target.assets_iter():
+        target_refs.add(asset.ref)
+        base_asset = base.get_asset_by_ref(asset.ref)
+        if base_asset is None:
+            diff.added.append(asset.ref)
+        elif not _is_same_asset(base, base_asset, target, asset):
+            diff.changed.append(asset.ref)
+    diff.removed.extend(x.ref for x in base.assets_iter() if x.ref not in target_refs)
+    return diff
+
+
+def write_delta_bundle(base: BaseBundleReader, target: BaseBundleReader, writer: BaseBundleWriter) -> BundleDiff:
+    """
+    Write the delta bundle turning the base bundle into the target one, see `apply_delta`.
+
+    Added and changed assets are copied from the target bundle as is, keeping their references. The writer is
+    neither committed nor closed by this function.
+
+    :param base: the older bundle
+    :param target: the newer bundle
+    :param writer: the writer of the delta bundle
+    :return: the difference between the bundles
+    :raise ValueError: if the target bundle contains assets of `DELTA_CUSTOM_TYPE` custom type to be copied, they
+        could not be told apart from the tombstones
+    """
+    diff = diff_bundles(base, target)
+    copied = set(diff.added).union(diff.changed)
+    for asset in target.assets_iter():
+        if asset.ref in copied:
+            if asset.custom_type == DELTA_CUSTOM_TYPE:
+                msg = f"Asset {asset.ref} has the custom type reserved for the delta tombstones"
+                raise ValueError(msg)
+            _copy_asset(target, asset, writer)
+    tombstones = json.dumps({"removed": diff.removed}, separators=(",", ":")).encode("utf-8")
+    writer.write_blob_asset(
+        BytesIO(tombstones),
+        "application/json",
+        file_name=_get_tombstones_file_name(copied),
+        custom_type=DELTA_CUSTOM_TYPE,
+    )
+    return diff
+
+
+def apply_delta(base: BaseBundleReader, delta: BaseBundleReader, writer: BaseBundleWriter) -> BundleDiff:
+    """
+    Apply the delta bundle to the base one, writing the resulting bundle.
+
+    Assets of the base bundle keep their order, changed assets are taken from the delta in place, and added assets
+    follow them. The writer is neither committed nor closed by this function.
+
+    :param base: the bundle the delta was created against
+    :param delta: the delta bundle written by `write_delta_bundle`
+    :param writer: the writer of the resulting bundle
+    :return: the difference applied
+    :raise ValueError: if the delta is not a delta bundle
+    """
+    tombstones_asset = next(delta.root_assets_iter(lambda x: x.custom_type == DELTA_CUSTOM_TYPE), None)
+    if tombstones_asset is None:
+        msg = "The bundle is not a delta bundle"
+        raise ValueError(msg)
+    with delta.read_blob_asset(tombstones_asset) as stream:
+        removed = set(json.load(stream)["removed"])
+    delta_assets = {x.ref: x for x in delta.assets_iter() if x.ref != tombstones_asset.ref}
+
+    diff = BundleDiff([], [], [])
+    for asset in base.assets_iter():
+        if asset.ref in removed:
+            diff.removed.append(asset.ref)
+        elif asset.ref in delta_assets:
+            diff.changed.append(asset.ref)
+            _copy_asset(delta, delta_assets.pop(asset.ref), writer)
+        else:
+            _copy_asset(base, asset, writer)
+    for asset in delta_assets.values():
+        diff.added.append(asset.ref)
+        _copy_asset(delta, asset, writer)
+    return diff
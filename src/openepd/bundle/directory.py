@@ -0,0 +1,267 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Bundles unpacked into a directory.
+
+The layout of the directory is the same as the layout of the ZIP bundle: manifest and TOC in the root and every
+asset in a plain file named by its reference. This form is suitable for random access workloads, while ZIP form is
+suitable for shipping; use `pack_bundle` and `unpack_bundle` to convert between them.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+import mmap
+import os
+from os import PathLike
+from pathlib import Path, PurePosixPath
+import shutil
+from typing import IO
+import zipfile
+
+from openepd.bundle.base import AssetRef
+from openepd.bundle.reader import BaseTocBundleReader
+from openepd.bundle.summary import SummaryFieldPath
+from openepd.bundle.writer import BaseTocBundleWriter
+from openepd.bundle.ziputils import CompressedData
+
+__all__ = ("DirectoryBundleReader", "DirectoryBundleWriter", "pack_bundle", "unpack_bundle")
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _entry_path(bundle_dir: Path, name: str) -> Path:
+    entry_name = PurePosixPath(name)
+    if entry_name.is_absolute() or ".." in entry_name.parts:
+        msg = f"Invalid bundle entry name: {name}"
+        raise ValueError(msg)
+    return bundle_dir.joinpath(*entry_name.parts)
+
+
+def _is_empty_dir(path: Path) -> bool:
+    return path.is_dir() and next(path.iterdir(), None) is None
+
+
+class DirectoryBundleReader(BaseTocBundleReader):
+    """
+    Bundle reader implementation for the bundle unpacked into a directory.
+
+    Every asset is a plain file, so it could be read without decompression, memory-mapped or read with `os.pread`
+    (see `get_asset_path`). Unlike DefaultBundleReader, the reader doesn't keep any open handles, so it could be
+    safely shared between threads.
+    """
+
+    def __init__(self, bundle_dir: PathLike | str, use_binary_toc: bool = True, hydrate_dependencies: bool = False):
+        """
+        Construct the reader.
+
+        :param bundle_dir: path to the bundle directory
+        :param use_binary_toc: if False, the binary TOC is ignored even if the bundle contains one
+        :param hydrate_dependencies: if True, dependencies of the objects written in normalized mode are restored
+        """
+        self._bundle_dir = Path(bundle_dir)
+        if not self._bundle_dir.is_dir():
+            msg = f"Bundle directory {bundle_dir} does not exist"
+            raise ValueError(msg)
+        self._use_binary_toc = use_binary_toc
+        self._hydrate_dependencies = hydrate_dependencies
+        self._load_metadata()
+
+    def close(self):
+        """Close the reader. Nothing to release, files are opened per read."""
+
+    def get_asset_path(self, asset_ref: AssetRef) -> Path:
+        """
+        Get the path to the file holding the content of the asset.
+
+        The file must not be modified, it could be opened for reading, memory-mapped, etc.
+        """
+        asset = self.get_asset_by_ref(asset_ref)
+        if asset is None:
+            msg = "Asset not found"
+            raise ValueError(msg)
+        return _entry_path(self._bundle_dir, self._get_entry_name(asset))
+
+    def read_blob_asset_view(self, asset_ref: AssetRef) -> memoryview | IO[bytes]:
+        """Read a blob asset as a read-only memoryview over the memory-mapped asset file."""
+        with open(self.get_asset_path(asset_ref), "rb") as stream:
+            if os.fstat(stream.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                return memoryview(b"")
+            return memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _open_entry(self, name: str) -> IO[bytes]:
+        return open(_entry_path(self._bundle_dir, name), "rb")
+
+    def _entry_exists(self, name: str) -> bool:
+        return _entry_path(self._bundle_dir, name).is_file()
+
+    def _read_entry(self, name: str) -> bytes:
+        return _entry_path(self._bundle_dir, name).read_bytes()
+
+
+class DirectoryBundleWriter(BaseTocBundleWriter):
+    """
+    Bundle writer implementation for the bundle unpacked into a directory.
+
+    Supports the same options as DefaultBundleWriter except compression. Entries are written into temporary files
+    first and renamed when complete, so readers never see partially written manifest or TOC. Amending a bundle
+    (`append=True`) still requires exclusive access to it until the writer is closed.
+    """
+
+    def __init__(
+        self,
+        bundle_dir: PathLike | str,
+        comment: str | None = None,
+        compact_json: bool = False,
+        max_workers: int | None = None,
+        append: bool = False,
+        binary_toc: bool = False,
+        deduplicate_blobs: bool = False,
+        summary_fields: Mapping[str, SummaryFieldPath] | None = None,
+        search_fields: Mapping[str, SummaryFieldPath] | None = None,
+        normalize_dependencies: bool = False,
+    ):
+        """
+        Construct the writer.
+
+        :param bundle_dir: path to the bundle directory, it is created if it doesn't exist
+        :param comment: optional comment to put into the manifest. When appending, the existing comment is kept if
+            None is given
+        :param compact_json: if True, objects are serialized without indentation and extra whitespaces
+        :param max_workers: number of background threads serializing objects. If None or 0, this is done in the
+            calling thread. Objects must not be modified after they were passed to the writer.
+        :param append: if True, the existing bundle is amended instead of creating a new one
+        :param binary_toc: if True, the binary TOC is written in addition to the CSV one
+        :param deduplicate_blobs: if True, blobs with the same content are stored in the bundle only once
+        :param summary_fields: if given, the summary index with these preview fields is written
+        :param search_fields: if given, the search index over these text fields is written
+        :param normalize_dependencies: if True, organizations, plants and PCR embedded into objects are written as
+            separate assets with one stored copy per distinct object
+        """
+        self._bundle_dir = Path(bundle_dir)
+        if self._bundle_dir.exists() and not append and not _is_empty_dir(self._bundle_dir):
+            msg = "Bundle directory already exists and is not empty. Use append mode to amend it."
+            raise ValueError(msg)
+        self._bundle_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(
+            comment=comment,
+            compact_json=compact_json,
+            max_workers=max_workers,
+            append=append,
+            binary_toc=binary_toc,
+            deduplicate_blobs=deduplicate_blobs,
+            summary_fields=summary_fields,
+            search_fields=search_fields,
+            normalize_dependencies=normalize_dependencies,
+        )
+
+    def _entry_exists(self, name: str) -> bool:
+        return _entry_path(self._bundle_dir, name).exists()
+
+    def _open_entry(self, name: str) -> IO[bytes]:
+        return open(_entry_path(self._bundle_dir, name), "rb")
+
+    @contextmanager
+    def _open_entry_for_write(self, name: str) -> Iterator[IO[bytes]]:
+        path = _entry_path(self._bundle_dir, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            with open(tmp_path, "wb") as stream:
+                yield stream
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write_compressed_entry(self, name: str, entry: CompressedData):
+        if entry.compress_type != zipfile.ZIP_STORED:
+            msg = "Directory bundles do not support compression"
+            raise ValueError(msg)
+        with self._open_entry_for_write(name) as stream:
+            stream.write(entry.data)
+
+    def _create_dir(self, name: str):
+        path = _entry_path(self._bundle_dir, name)
+        if path.exists() and not path.is_dir():
+            msg = f"Object with name {name} already exists in the bundle."
+            raise ValueError(msg)
+        path.mkdir(exist_ok=True)
+
+    def _remove_entries(self, names: Sequence[str]):
+        for x in names:
+            _entry_path(self._bundle_dir, x).unlink(missing_ok=True)
+
+    def _close_storage(self):
+        pass
+
+
+def unpack_bundle(bundle_file: PathLike | IO[bytes] | str, bundle_dir: PathLike | str) -> None:
+    """
+    Unpack the ZIP bundle into the directory, so it could be read with DirectoryBundleReader.
+
+    :param bundle_file: path or a file-like object to read the bundle from
+    :param bundle_dir: target directory, it must not exist or be empty
+    """
+    target = Path(bundle_dir)
+    if target.exists() and not _is_empty_dir(target):
+        msg = "Bundle directory already exists and is not empty."
+        raise ValueError(msg)
+    with zipfile.ZipFile(bundle_file, "r") as archive:
+        for info in archive.infolist():
+            path = _entry_path(target, info.filename)
+            if info.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info, "r") as src, open(path, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+
+def pack_bundle(
+    bundle_dir: PathLike | str,
+    bundle_file: PathLike | IO[bytes] | str,
+    compression: int = zipfile.ZIP_STORED,
+    compresslevel: int | None = None,
+) -> None:
+    """
+    Pack the bundle directory into a ZIP bundle, so it could be read with DefaultBundleReader.
+
+    Only the entries referenced by the TOC are packed, assets go in the TOC order followed by the metadata.
+
+    :param bundle_dir: path to the bundle directory
+    :param bundle_file: path or a file-like object to write the bundle to. Existing files are not overwritten.
+    :param compression: ZIP compression method for the assets, see DefaultBundleWriter
+    :param compresslevel: compression level, see zipfile.ZipFile for allowed values
+    """
+    if isinstance(bundle_file, PathLike | str) and Path(bundle_file).exists():
+        msg = "Bundle file already exists."
+        raise ValueError(msg)
+    source = Path(bundle_dir)
+    with DirectoryBundleReader(source) as reader:
+        entry_names = dict.fromkeys(reader._get_entry_name(x) for x in reader.assets_iter())
+    with zipfile.ZipFile(bundle_file, "w", compression=compression, compresslevel=compresslevel) as archive:
+        dirs: set[str] = set()
+        for name in entry_names:
+            for parent in reversed(PurePosixPath(name).parents[:-1]):
+                if str(parent) not in dirs:
+                    archive.mkdir(str(parent))
+                    dirs.add(str(parent))
+            archive.write(_entry_path(source, name), name)
+        for name in BaseTocBundleWriter._METADATA_ENTRIES:
+            path = _entry_path(source, name)
+            if path.is_file():
+                archive.write(path, name)
@@ -15,6 +15,7 @@
 #
 from datetime import datetime
 from enum import StrEnum
+from typing import Any
 
 from openepd.compat.pydantic import pyd
 from openepd.model.base import BaseOpenEpdSchema
@@ -39,6 +40,7 @@ class AssetType(StrEnum):
     Epd = "epd"
     Pcr = "pcr"
     Org = "org"
+    Plant = "plant"
     Blob = "blob"
 
 
@@ -51,6 +53,18 @@ class RelType(StrEnum):
     """A PDF representation of the asset."""
     Ilcd = "repr.ilcd"
     """An ILCD representation of the asset."""
+    Manufacturer = "dep.manufacturer"
+    """The manufacturer of the product, for the objects written with normalized dependencies."""
+    EpdDeveloper = "dep.epd_developer"
+    """The developer of the EPD, for the objects written with normalized dependencies."""
+    ProgramOperator = "dep.program_operator"
+    """The program operator of the EPD, for the objects written with normalized dependencies."""
+    ThirdPartyVerifier = "dep.third_party_verifier"
+    """The third party verifier of the EPD, for the objects written with normalized dependencies."""
+    Plant = "dep.plant"
+    """A manufacturing plant of the product, for the objects written with normalized dependencies."""
+    Pcr = "dep.pcr"
+    """The PCR of the EPD, for the objects written with normalized dependencies."""
 
 
 class BundleManifest(BaseOpenEpdSchema):
@@ -85,3 +99,46 @@ class AssetInfo(BaseOpenEpdSchema):
     size: int | None = pyd.Field(default=None)
     custom_type: str | None = pyd.Field(default=None)
     custom_data: str | None = pyd.Field(default=None)
+    content_hash: str | None = pyd.Field(default=None)
+    """Hash of the asset content in form of `<algorithm>:<hex digest>`, e.g. `sha256:...`."""
+    location: str | None = pyd.Field(default=None)
+    """The bundle entry holding the content of the asset, if it differs from ref (e.g. for deduplicated blobs)."""
+
+
+class AssetSummary(BaseOpenEpdSchema):
+    """A row of the summary index: preview fields of an object asset."""
+
+    ref: str
+    """The ID of the asset."""
+    type: AssetType
+    """The type of the asset."""
+    fields: dict[str, Any] = pyd.Field(default_factory=dict)
+    """Preview fields of the asset, see openepd.bundle.summary for details."""
+
+
+class BundleShardInfo(BaseOpenEpdSchema):
+    """A part of the sharded bundle."""
+
+    file_name: str
+    """The name of the part file, relative to the bundle directory."""
+    first_asset: int
+    """The index of the first asset of the part within the whole bundle."""
+    asset_count: int = 0
+    """The number of assets in the part."""
+    total_size: int = 0
+    """The total size of assets in the part in bytes."""
+
+
+class ShardedBundleManifest(BaseOpenEpdSchema):
+    """The top-level manifest of a sharded bundle."""
+
+    format: str = "openEPD Sharded Bundle/1.0"
+    """The format of the bundle."""
+    generator: str
+    """The generator of the bundle."""
+    assets: BundleManifestAssetsStats = pyd.Field(default_factory=BundleManifestAssetsStats)
+    comment: str | None = pyd.Field(default=None)
+    created_at: datetime = pyd.Field(default_factory=datetime.utcnow)
+    """The date and time when the bundle was generated."""
+    shards: list[BundleShardInfo] = pyd.Field(default_factory=list)
+    """The parts of the bundle in order."""
@@ -13,102 +13,126 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+import abc
 from collections.abc import Callable, Iterator, Sequence
 import csv
 import io
+import json
+import mmap
 from os import PathLike
-from typing import IO, cast
+import threading
+from typing import IO, Any, cast
 import zipfile
+import zlib
 
 from openepd.bundle.base import AssetFilter, AssetRef, BaseBundleReader
-from openepd.bundle.model import AssetInfo, AssetType, BundleManifest
+from openepd.bundle.model import AssetInfo, AssetSummary, AssetType, BundleManifest
+from openepd.bundle.search import SEARCH_INDEX_ENTRY, SearchHit, SearchIndex
+from openepd.bundle.summary import SUMMARY_ENTRY
+from openepd.bundle.toc import BINARY_TOC_ENTRY, BinaryTocReader, TocIndex
+from openepd.bundle.ziputils import stored_entry_data_offset
 from openepd.model.base import TOpenEpdObject
 
 
-class DefaultBundleReader(BaseBundleReader):
-    """Default bundle reader implementation. Reads the bundle from a ZIP file."""
+class BaseTocBundleReader(BaseBundleReader, metaclass=abc.ABCMeta):
+    """
+    Base class for readers of bundles consisting of the manifest, the TOC and the asset entries.
 
-    def __init__(self, bundle_file: PathLike | IO[bytes] | str):
-        self._bundle_archive = zipfile.ZipFile(bundle_file, mode="r")
+    Subclasses define how the entries are stored and must call `_load_metadata` once the storage is opened. If the
+    bundle contains an up-to-date binary TOC (see DefaultBundleWriter), it is used instead of the CSV one.
+    """
+
+    _use_binary_toc: bool = True
+    _search_index: SearchIndex | None = None
+
+    def _load_metadata(self):
+        """Read the manifest and the TOC of the bundle."""
         try:
-            with self._bundle_archive.open("manifest", "r") as manifest_stream:
+            with self._open_entry("manifest") as manifest_stream:
                 self.__manifest = BundleManifest.parse_raw(manifest_stream.read())
         except Exception as e:
             raise ValueError("The bundle file is not valid. Manifest reading error: " + str(e)) from e
         try:
             self.__check_toc()
+            self.__toc_index = self.__load_toc_index()
         except Exception as e:
             raise ValueError("The bundle file is not valid. TOC reading error: " + str(e)) from e
 
-    def close(self):
-        """Close the reader."""
-        self._bundle_archive.close()
+    @abc.abstractmethod
+    def _open_entry(self, name: str) -> IO[bytes]:
+        """Open the entry of the bundle for reading."""
+
+    @abc.abstractmethod
+    def _entry_exists(self, name: str) -> bool:
+        """Check if the bundle contains the entry with the given name."""
+
+    def _read_entry(self, name: str) -> bytes:
+        """Read the whole content of the entry."""
+        with self._open_entry(name) as stream:
+            return stream.read()
+
+    def _entry_crc(self, name: str) -> int:
+        """Get CRC32 of the entry content."""
+        crc = 0
+        with self._open_entry(name) as stream:
+            while chunk := stream.read(io.DEFAULT_BUFFER_SIZE * 16):
+                crc = zlib.crc32(chunk, crc)
+        return crc
 
     def get_manifest(self) -> BundleManifest:
         """Get the manifest of the bundle. Manifest object is immutable."""
         return self.__manifest.copy(deep=True)
 
-    def __create_asset_filter(
-        self,
-        asset_type: AssetType | str | None = None,
-        name: str | None = None,
-        parent_ref: AssetRef | None = None,
-        ref_type: str | None = None,
-        is_translated: bool | None = None,
-    ) -> AssetFilter:
-        def _filter(a: AssetInfo):
-            if asset_type is not None and a.type != asset_type:
-                return False
-            if name is not None and a.name != name:
-                return False
-            if parent_ref is not None:
-                parent_ref_str = self._asset_ref_to_str(parent_ref)
-                # Get the actual list of related assets
-                rel_asset_list = self._get_rel_asset_list(a)
-                if parent_ref_str not in rel_asset_list:
-                    return False
-            if ref_type is not None and a.rel_type != ref_type:
-                return False
-            if is_translated is not None and a.lang is not None and "translated" in a.lang:
-                return True
-            return True
-
-        return _filter
-
     def __preprocess_csv_dict(self, input_dict: dict[str, str | None]) -> dict[str, str | None]:
-        default_to_none_fields = ("rel_type", "rel_asset", "lang", "content_type", "custom_type", "custom_data")
-        for x in default_to_none_fields:
-            if input_dict[x] == "":
+        for x in self._TOC_NULLABLE_FIELDS:
+            if input_dict.get(x) == "":
                 input_dict[x] = None
         return input_dict
 
-    def _get_rel_asset_list(self, asset_info: AssetInfo) -> list[str]:
-        """Get the list of related asset references from an AssetInfo object."""
-        if asset_info.rel_asset is None:
-            return []
-
-        # Deserialize from CSV format (semicolon-separated values)
-        deserialized = self._deserialize_rel_asset_from_csv(asset_info.rel_asset)
-        if isinstance(deserialized, list):
-            return deserialized
-        elif isinstance(deserialized, str):
-            return [deserialized]
-        else:
-            return []
-
     def assets_iter(self) -> Iterator[AssetInfo]:
         """Iterate over all assets in the bundle."""
-        with self._bundle_archive.open("toc", "r") as toc_stream:
+        yield from self.__toc_index.assets()
+
+    def __read_toc_iter(self) -> Iterator[AssetInfo]:
+        with self._open_entry("toc") as toc_stream:
             toc_reader = csv.DictReader(io.TextIOWrapper(toc_stream, encoding="utf-8"), dialect="toc")
             for x in toc_reader:
                 yield AssetInfo.parse_obj(self.__preprocess_csv_dict(x))
 
+    def __read_binary_toc_iter(self) -> Iterator[AssetInfo] | None:
+        if not self._use_binary_toc or not self._entry_exists(BINARY_TOC_ENTRY):
+            return None
+        try:
+            binary_toc = BinaryTocReader(self._read_entry(BINARY_TOC_ENTRY))
+        except ValueError:
+            return None
+        # Binary TOC is a derived data, it is ignored if the CSV TOC was changed after it was written
+        if binary_toc.toc_crc != self._entry_crc("toc"):
+            return None
+        return self.__construct_asset_info_iter(binary_toc.rows_iter(AssetInfo.__fields__.keys()))
+
+    @staticmethod
+    def __construct_asset_info_iter(rows: Iterator[dict[str, Any]]) -> Iterator[AssetInfo]:
+        # Binary TOC is written from the validated CSV TOC, so validation is skipped
+        for row in rows:
+            row["type"] = AssetType(row["type"])
+            yield AssetInfo.construct(**row)
+
+    def __load_toc_index(self) -> TocIndex:
+        return TocIndex(self.__read_binary_toc_iter() or self.__read_toc_iter())
+
     def __check_toc(self):
-        with self._bundle_archive.open("toc", "r") as toc_stream:
+        with self._open_entry("toc") as toc_stream:
             toc_reader = csv.DictReader(io.TextIOWrapper(toc_stream, encoding="utf-8"), dialect="toc")
-            if not toc_reader.fieldnames or len(toc_reader.fieldnames) < len(self._TOC_FIELDS):
+            if not toc_reader.fieldnames:
                 msg = "The bundle file is not valid. TOC reading error: wrong number of fields"
                 raise ValueError(msg)
+            missing_fields = [
+                x for x in self._TOC_FIELDS if x not in self._TOC_OPTIONAL_FIELDS and x not in toc_reader.fieldnames
+            ]
+            if missing_fields:
+                msg = f"The bundle file is not valid. TOC reading error: missing fields {', '.join(missing_fields)}"
+                raise ValueError(msg)
 
     def root_assets_iter(
         self,
@@ -120,43 +144,36 @@ class DefaultBundleReader(BaseBundleReader):
     ) -> Iterator[AssetInfo]:
         """Iterate over all root assets in the bundle."""
         _filter: AssetFilter
+        candidates: Sequence[AssetInfo]
         if isinstance(filter_or_type, Callable):  # type: ignore
             _filter = filter_or_type  # type: ignore
+            candidates = self.__toc_index.root_assets()
         else:
-            _filter = self.__create_asset_filter(
+            _filter = self._create_asset_filter(
                 asset_type=cast(str, filter_or_type),
                 name=name,
                 parent_ref=parent_ref,
                 ref_type=ref_type,
                 is_translated=is_translated,
             )
+            candidates = self.__toc_index.root_assets(cast(str | None, filter_or_type))
 
-        for x in self.assets_iter():
-            if _filter(x) and x.rel_asset is None:
+        for x in candidates:
+            if _filter(x):
                 yield x
 
     def get_relative_assets_iter(
         self, asset: AssetRef, rel_type: str | Sequence[str] | None = None
     ) -> Iterator[AssetInfo]:
         """Iterate over all assets that are relative to the given asset."""
-        if rel_type is not None and isinstance(rel_type, str):
-            rel_type = [rel_type]
         asset_ref = self._asset_ref_to_str(asset)
-        for x in self.assets_iter():
-            rel_asset_list = self._get_rel_asset_list(x)
-            if asset_ref in rel_asset_list:
-                if rel_type is None or x.rel_type in rel_type:
-                    yield x
+        yield from self.__toc_index.relatives_iter(asset_ref, rel_type)
 
     def get_asset_by_ref(self, asset_ref: AssetRef) -> AssetInfo | None:
         """Get the asset by its reference."""
         if isinstance(asset_ref, AssetInfo):
             return asset_ref
-        asset_ref = self._asset_ref_to_str(asset_ref)
-        for x in self.assets_iter():
-            if x.ref == asset_ref:
-                return x
-        return None
+        return self.__toc_index.get(self._asset_ref_to_str(asset_ref))
 
     def read_blob_asset(self, asset_ref: AssetRef) -> IO[bytes]:
         """Read the blob asset."""
@@ -164,19 +181,172 @@ class DefaultBundleReader(BaseBundleReader):
         if asset is None:
             msg = "Asset not found"
             raise ValueError(msg)
-        return self._bundle_archive.open(asset.ref, "r")
+        return self._open_entry(self._get_entry_name(asset))
 
     def read_object_asset(self, obj_class: type[TOpenEpdObject], asset_ref: AssetRef) -> TOpenEpdObject:
         """Read the object asset."""
+        asset = self._get_object_asset(obj_class, asset_ref)
+        obj = obj_class.parse_raw(self._read_asset_bytes(asset))
+        return self.hydrate_dependencies(obj, asset) if self._hydrate_dependencies else obj
+
+    def has_summary_index(self) -> bool:
+        """Check if the bundle contains the summary index (see DefaultBundleWriter)."""
+        return self._entry_exists(SUMMARY_ENTRY)
+
+    def summaries_iter(
+        self,
+        asset_type: AssetType | str | None = None,
+        filter: Callable[[AssetSummary], bool] | None = None,  # noqa: A002
+    ) -> Iterator[AssetSummary]:
+        """
+        Iterate over the rows of the summary index, without reading the objects themselves.
+
+        :param asset_type: the type of assets to include, all object assets by default
+        :param filter: optional filter function for the rows
+        :raise ValueError: if the bundle has no summary index
+        """
+        if not self.has_summary_index():
+            msg = "The bundle has no summary index"
+            raise ValueError(msg)
+        with self._open_entry(SUMMARY_ENTRY) as summary_stream:
+            for line in io.TextIOWrapper(summary_stream, encoding="utf-8"):
+                row = json.loads(line)
+                if asset_type is not None and row["type"] != asset_type:
+                    continue
+                # Summary index is written from the validated objects, so validation is skipped
+                summary = AssetSummary.construct(ref=row["ref"], type=AssetType(row["type"]), fields=row["fields"])
+                if filter is None or filter(summary):
+                    yield summary
+
+    def has_search_index(self) -> bool:
+        """Check if the bundle contains the search index (see DefaultBundleWriter)."""
+        return self._entry_exists(SEARCH_INDEX_ENTRY)
+
+    def get_search_index(self) -> SearchIndex:
+        """
+        Get the search index of the bundle. It is loaded on the first call and kept in memory.
+
+        :raise ValueError: if the bundle has no search index
+        """
+        if self._search_index is None:
+            if not self.has_search_index():
+                msg = "The bundle has no search index"
+                raise ValueError(msg)
+            self._search_index = SearchIndex(self._read_entry(SEARCH_INDEX_ENTRY))
+        return self._search_index
+
+    def search(
+        self,
+        query: str,
+        prefix: bool = False,
+        asset_type: AssetType | str | None = None,
+        limit: int | None = 20,
+    ) -> list[SearchHit]:
+        """
+        Find object assets by keywords using the search index, without reading the objects themselves.
+
+        :param query: the text to search, all its words must match
+        :param prefix: if True, the words of the query match the words starting with them
+        :param asset_type: the type of assets to include, all object assets by default
+        :param limit: the maximum number of results, all results if None
+        :return: matching assets, most relevant first
+        :raise ValueError: if the bundle has no search index
+        """
+        return self.get_search_index().search(query, prefix=prefix, asset_type=asset_type, limit=limit)
+
+    def _read_asset_bytes(self, asset: AssetInfo) -> bytes:
+        return self._read_entry(self._get_entry_name(asset))
+
+    def _get_entry_name(self, asset: AssetInfo) -> str:
+        """Get the name of the entry holding the asset content. Deduplicated assets share the same entry."""
+        return asset.location or asset.ref
+
+
+class DefaultBundleReader(BaseTocBundleReader):
+    """
+    Default bundle reader implementation. Reads the bundle from a ZIP file.
+
+    If the bundle contains an up-to-date binary TOC (see DefaultBundleWriter), it is used instead of the CSV one.
+
+    Blobs stored without compression could be accessed without copying via `read_blob_asset_view`, in this case the
+    bundle file is memory-mapped once and shared by all the views.
+
+    With `hydrate_dependencies=True` the objects written with normalized dependencies are restored on read, sharing
+    one instance per distinct dependency (see `hydrate_dependencies`).
+    """
+
+    def __init__(
+        self,
+        bundle_file: PathLike | IO[bytes] | str,
+        use_binary_toc: bool = True,
+        hydrate_dependencies: bool = False,
+    ):
+        """
+        Construct the reader.
+
+        :param bundle_file: path or a file-like object to read bundle from
+        :param use_binary_toc: if False, the binary TOC is ignored even if the bundle contains one
+        :param hydrate_dependencies: if True, dependencies of the objects written in normalized mode are restored
+        """
+        self._use_binary_toc = use_binary_toc
+        self._hydrate_dependencies = hydrate_dependencies
+        self._bundle_archive = zipfile.ZipFile(bundle_file, mode="r")
+        self.__archive_map: mmap.mmap | None = None
+        self.__archive_map_unavailable = False
+        self.__archive_map_lock = threading.Lock()
+        self._load_metadata()
+
+    def close(self):
+        """Close the reader."""
+        self._bundle_archive.close()
+        with self.__archive_map_lock:
+            if self.__archive_map is not None:
+                try:
+                    self.__archive_map.close()
+                except BufferError:
+                    # Some views are still in use, the mapping is released when the last of them is gone
+                    pass
+                self.__archive_map = None
+
+    def read_blob_asset_view(self, asset_ref: AssetRef) -> memoryview | IO[bytes]:
+        """
+        Read a blob asset without copying its content, if possible.
+
+        Returns a read-only memoryview over the memory-mapped bundle file for the entries stored without compression.
+        Falls back to the stream for compressed entries and for bundles which are not backed by a file.
+        """
         asset = self.get_asset_by_ref(asset_ref)
         if asset is None:
             msg = "Asset not found"
             raise ValueError(msg)
-        if obj_class.get_asset_type() is None:
-            msg = f"Target object {obj_class.__name__} is not supported asset"
-            raise ValueError(msg)
-        if asset.type != obj_class.get_asset_type():
-            msg = f"Asset type mismatch. Expected {obj_class.get_asset_type()}, got {asset.type}"
-            raise ValueError(msg)
-        with self._bundle_archive.open(asset.ref, "r") as asset_stream:
-            return obj_class.parse_raw(asset_stream.read())
+        entry_name = self._get_entry_name(asset)
+        zinfo = self._bundle_archive.getinfo(entry_name)
+        archive_map = self.__get_archive_map()
+        if archive_map is not None:
+            offset = stored_entry_data_offset(archive_map, zinfo)
+            if offset is not None:
+                return memoryview(archive_map)[offset : offset + zinfo.file_size]
+        return self._open_entry(entry_name)
+
+    def __get_archive_map(self) -> mmap.mmap | None:
+        with self.__archive_map_lock:
+            if self.__archive_map is None and not self.__archive_map_unavailable:
+                try:
+                    fileno = self._bundle_archive.fp.fileno()  # type: ignore[union-attr]
+                    self.__archive_map = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                except (AttributeError, OSError, ValueError):
+                    # In-memory streams, pipes, etc.
+                    self.__archive_map_unavailable = True
+            return self.__archive_map
+
+    def _open_entry(self, name: str) -> IO[bytes]:
+        return self._bundle_archive.open(name, "r")
+
+    def _entry_exists(self, name: str) -> bool:
+        return name in self._bundle_archive.NameToInfo
+
+    def _read_entry(self, name: str) -> bytes:
+        return self._bundle_archive.read(name)
+
+    def _entry_crc(self, name: str) -> int:
+        return self._bundle_archive.getinfo(name).CRC
@@ -0,0 +1,239 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Full-text search index of the bundle.
+
+Search index is an optional bundle entry holding an inverted index over the text fields of the object assets. It
+allows finding objects by keywords without reading and parsing them. Terms are lowercase words of the field values,
+results are ranked with BM25.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator, Mapping
+import json
+import math
+import re
+from typing import Any, NamedTuple
+
+from openepd.bundle.summary import SummaryFieldPath, extract_summary
+from openepd.compat.pydantic import pyd
+from openepd.model.base import BaseOpenEpdSchema
+
+__all__ = (
+    "DEFAULT_SEARCH_FIELDS",
+    "SEARCH_INDEX_ENTRY",
+    "SearchHit",
+    "SearchIndex",
+    "SearchIndexBuilder",
+    "tokenize",
+)
+
+SEARCH_INDEX_ENTRY = "search.json"
+"""Name of the bundle entry holding the search index."""
+
+DEFAULT_SEARCH_FIELDS: Mapping[str, SummaryFieldPath] = {
+    "name": "name",
+    "product_name": "product_name",
+    "description": "description",
+    "product_description": "product_description",
+    "manufacturer": "manufacturer.name",
+    "product_classes": "product_classes",
+}
+"""Text fields of EPDs: names and descriptions of the product, manufacturer name and categories."""
+
+_FORMAT = "openEPD Search Index/1.0"
+_TOKEN_RE = re.compile(r"\w+")
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Split the text into search terms."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _iter_text(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, pyd.BaseModel):
+        yield from _iter_text(value.dict(exclude_none=True))
+    elif isinstance(value, Mapping):
+        for x in value.values():
+            yield from _iter_text(x)
+    elif isinstance(value, list | tuple | set):
+        for x in value:
+            yield from _iter_text(x)
+
+
+class SearchHit(NamedTuple):
+    """A single search result."""
+
+    ref: str
+    """Reference of the asset."""
+    score: float
+    """Relevance of the asset, higher is better."""
+
+
+class SearchIndexBuilder:
+    """
+    Builder of the search index, used by bundle writers.
+
+    Postings are kept in memory as flat lists of (document, term frequency) pairs, so the memory consumption is
+    proportional to the total number of distinct terms per object.
+    """
+
+    def __init__(self, fields: Mapping[str, SummaryFieldPath]) -> None:
+        self._fields = fields
+        self.__refs: list[str] = []
+        self.__types: list[str] = []
+        self.__lengths: list[int] = []
+        self.__postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__refs)
+
+    def add(self, ref: str, asset_type: str, obj: BaseOpenEpdSchema) -> None:
+        """Add the object to the index."""
+        terms: list[str] = []
+        for value in extract_summary(obj, self._fields).values():
+            for text in _iter_text(value):
+                terms.extend(tokenize(text))
+        self.__add_document(ref, asset_type, len(terms), Counter(terms))
+
+    def load(self, data: bytes) -> None:
+        """Add all documents of the existing index, e.g. when a bundle is amended."""
+        index = SearchIndex(data)
+        doc_terms: list[dict[str, int]] = [{} for _ in range(len(index))]
+        for term, postings in index._postings.items():
+            for i in range(0, len(postings), 2):
+                doc_terms[postings[i]][term] = postings[i + 1]
+        for i, terms in enumerate(doc_terms):
+            self.__add_document(index._refs[i], index._types[i], index._lengths[i], terms)
+
+    def __add_document(self, ref: str, asset_type: str, length: int, term_counts: Mapping[str, int]) -> None:
+        doc_id = len(self.__refs)
+        self.__refs.append(ref)
+        self.__types.append(str(asset_type))
+        self.__lengths.append(length)
+        for term, count in term_counts.items():
+            postings = self.__postings.get(term)
+            if postings is None:
+                postings = self.__postings[term] = []
+            postings.append(doc_id)
+            postings.append(count)
+
+    def to_json(self) -> bytes:
+        """Serialize the index."""
+        return json.dumps(
+            {
+                "format": _FORMAT,
+                "refs": self.__refs,
+                "types": self.__types,
+                "lengths": self.__lengths,
+                "postings": self.__postings,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class SearchIndex:
+    """The search index loaded from the bundle."""
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Load the index.
+
+        :param data: the content of the search index entry
+        :raise ValueError: if data is not a valid search index
+        """
+        try:
+            content = json.loads(data)
+        except ValueError as e:
+            raise ValueError("Search index is not valid: " + str(e)) from e
+        if not isinstance(content, dict) or content.get("format") != _FORMAT:
+            msg = "Unsupported search index format"
+            raise ValueError(msg)
+        self._refs: list[str] = content["refs"]
+        self._types: list[str] = content["types"]
+        self._lengths: list[int] = content["lengths"]
+        self._postings: dict[str, list[int]] = content["postings"]
+        self.__terms = sorted(self._postings)
+        self.__avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def terms_with_prefix(self, prefix: str) -> list[str]:
+        """Get all indexed terms starting with the given prefix."""
+        start = bisect_left(self.__terms, prefix)
+        end = start
+        while end < len(self.__terms) and self.__terms[end].startswith(prefix):
+            end += 1
+        return self.__terms[start:end]
+
+    def search(
+        self, query: str, prefix: bool = False, asset_type: str | None = None, limit: int | None = 20
+    ) -> list[SearchHit]:
+        """
+        Find assets matching all terms of the query.
+
+        :param query: the text to search, split into terms the same way as the indexed fields
+        :param prefix: if True, query terms match all the terms starting with them, e.g. "conc" matches "concrete"
+        :param asset_type: if given, only assets of this type are returned
+        :param limit: the maximum number of results, all results if None
+        :return: matching assets, most relevant first
+        """
+        query_terms = dict.fromkeys(tokenize(query))
+        if not query_terms or not self._refs:
+            return []
+        scores: dict[int, float] | None = None
+        for query_term in query_terms:
+            term_scores: dict[int, float] = {}
+            for term in self.terms_with_prefix(query_term) if prefix else [query_term]:
+                self.__score_term(term, term_scores)
+            # Documents must match every term of the query
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc: score + term_scores[doc] for doc, score in scores.items() if doc in term_scores}
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        hits = (
+            SearchHit(self._refs[doc], score)
+            for doc, score in scores.items()
+            if asset_type is None or self._types[doc] == asset_type
+        )
+        return sorted(hits, key=lambda x: (-x.score, x.ref))[:limit]
+
+    def __score_term(self, term: str, scores: dict[int, float]) -> None:
+        postings = self._postings.get(term)
+        if not postings:
+            return
+        doc_count = len(self._refs)
+        doc_freq = len(postings) // 2
+        idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+        for i in range(0, len(postings), 2):
+            doc, freq = postings[i], postings[i + 1]
+            norm = 1 - _B + _B * self._lengths[doc] / self.__avg_length if self.__avg_length else 1.0
+            score = idf * freq * (_K1 + 1) / (freq + _K1 * norm)
+            # Prefix queries might match several terms of the same document, the best one counts
+            if score > scores.get(doc, 0.0):
+                scores[doc] = score
@@ -0,0 +1,425 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Sharded bundles.
+
+Sharded bundle is a directory with several ordinary ZIP bundles (parts) and the top-level manifest listing them. Asset
+references are unique across the parts, so together they form one logical bundle, while every part is still a valid
+bundle on its own and could be processed independently, e.g. by a separate process or machine (see `map_shards`).
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+import os
+from os import PathLike
+from pathlib import Path
+from typing import IO, Any, TypeVar, cast
+
+from openepd.__version__ import VERSION
+from openepd.bundle.base import AssetFilter, AssetRef, BaseBundleReader, BaseBundleWriter
+from openepd.bundle.model import (
+    AssetInfo,
+    AssetType,
+    BundleManifest,
+    BundleShardInfo,
+    ShardedBundleManifest,
+)
+from openepd.bundle.reader import DefaultBundleReader
+from openepd.bundle.toc import TocIndex
+from openepd.bundle.writer import DefaultBundleWriter
+from openepd.model.base import TOpenEpdObject
+
+__all__ = ("SHARDS_MANIFEST", "ShardedBundleReader", "ShardedBundleWriter", "map_shards")
+
+SHARDS_MANIFEST = "shards.json"
+"""Name of the top-level manifest file of the sharded bundle."""
+
+_PART_NAME_TEMPLATE = "part-{:05d}.epb"
+
+T = TypeVar("T")
+
+
+def _read_sharded_manifest(bundle_dir: Path) -> ShardedBundleManifest:
+    try:
+        return ShardedBundleManifest.parse_raw((bundle_dir / SHARDS_MANIFEST).read_bytes())
+    except Exception as e:
+        raise ValueError("The bundle is not valid. Shards manifest reading error: " + str(e)) from e
+
+
+class ShardedBundleWriter(BaseBundleWriter):
+    """
+    Writer of sharded bundles.
+
+    Assets are written into the current part until it reaches `max_shard_assets` assets or `max_shard_size` bytes of
+    asset content, then the next part is started. Parts are rolled over only before the assets without relations, so
+    the related assets written right after their parent stay in the same part with it. Each part is written by
+    DefaultBundleWriter, which options could be passed as keyword arguments. Blob deduplication works within a part.
+    """
+
+    def __init__(
+        self,
+        bundle_dir: PathLike | str,
+        comment: str | None = None,
+        max_shard_assets: int | None = None,
+        max_shard_size: int | None = None,
+        **writer_options: Any,
+    ):
+        """
+        Construct the writer.
+
+        :param bundle_dir: path to the bundle directory, it must not exist or be empty
+        :param comment: optional comment to put into the manifest
+        :param max_shard_assets: the number of assets after which the next part is started
+        :param max_shard_size: the total size of assets (in bytes, uncompressed) after which the next part is started.
+            Sizes of the objects still being serialized in background are not known, so the limit is approximate.
+        :param writer_options: options of DefaultBundleWriter for the parts, e.g. compression
+        """
+        if max_shard_assets is None and max_shard_size is None:
+            msg = "Either max_shard_assets or max_shard_size must be given"
+            raise ValueError(msg)
+        if "append" in writer_options:
+            msg = "Sharded bundles could not be amended"
+            raise ValueError(msg)
+        if writer_options.get("normalize_dependencies"):
+            # Names of the dependency assets are generated by the parts, so they are not unique across the bundle
+            msg = "Sharded bundles could not be written with normalized dependencies"
+            raise ValueError(msg)
+        self._bundle_dir = Path(bundle_dir)
+        if self._bundle_dir.exists() and next(self._bundle_dir.iterdir(), None) is not None:
+            msg = "Bundle directory already exists and is not empty."
+            raise ValueError(msg)
+        self._bundle_dir.mkdir(parents=True, exist_ok=True)
+        self._max_shard_assets = max_shard_assets
+        self._max_shard_size = max_shard_size
+        self._writer_options = writer_options
+        self.__manifest = ShardedBundleManifest(generator=f"openEPD Python SDK/{VERSION}", comment=comment)
+        self.__type_counters: dict[str, int] = {}
+        self.__refs: set[str] = set()
+        self.__part_writer: DefaultBundleWriter | None = None
+        self.__part_assets: list[AssetInfo] = []
+        self.__part_size = 0
+        self.__part_sized_count = 0
+
+    def write_blob_asset(
+        self,
+        data: IO[bytes],
+        content_type: str | None = None,
+        rel_asset: AssetRef | list[AssetRef] | None = None,
+        rel_type: str | None = None,
+        file_name: str | None = None,
+        name: str | None = None,
+        lang: str | None = None,
+        comment: str | None = None,
+        custom_type: str | None = None,
+        custom_data: str | None = None,
+    ) -> AssetInfo:
+        """Write a blob asset to the current part of the bundle."""
+        writer = self.__get_part_writer(rel_asset)
+        asset_info = writer.write_blob_asset(
+            data,
+            content_type,
+            rel_asset,
+            rel_type,
+            self.__get_file_name(AssetType.Blob, "bin", file_name),
+            name,
+            lang,
+            comment,
+            custom_type,
+            custom_data,
+        )
+        self.__part_assets.append(asset_info)
+        return asset_info
+
+    def write_object_asset(
+        self,
+        obj: TOpenEpdObject,
+        rel_asset: list[AssetRef] | AssetRef | None = None,
+        rel_type: str | None = None,
+        file_name: str | None = None,
+        name: str | None = None,
+        lang: str | None = None,
+        comment: str | None = None,
+        custom_type: str | None = None,
+        custom_data: str | None = None,
+    ) -> AssetInfo:
+        """Write an object asset to the current part of the bundle."""
+        asset_type = obj.get_asset_type()
+        if asset_type is None:
+            msg = f"Object {obj} does not have a valid asset type and can't be written to a bundle."
+            raise ValueError(msg)
+        writer = self.__get_part_writer(rel_asset)
+        asset_info = writer.write_object_asset(
+            obj,
+            rel_asset,
+            rel_type,
+            self.__get_file_name(asset_type, "json", file_name),
+            name,
+            lang,
+            comment,
+            custom_type,
+            custom_data,
+        )
+        self.__part_assets.append(asset_info)
+        return asset_info
+
+    def copy_asset(self, asset: AssetInfo, data: IO[bytes]) -> AssetInfo:
+        """Write the asset read from another bundle to the current part, keeping its reference and metadata."""
+        if asset.ref in self.__refs:
+            msg = f"Asset {asset.ref} already exists in the bundle."
+            raise ValueError(msg)
+        writer = self.__get_part_writer(asset.rel_asset)
+        asset_info = writer.copy_asset(asset, data)
+        self.__refs.add(asset.ref)
+        self.__part_assets.append(asset_info)
+        return asset_info
+
+    def commit(self):
+        """Commit the current part and write the top-level manifest."""
+        if self.__part_writer is not None:
+            self.__part_writer.commit()
+            self.__update_part_stats()
+        self.__write_manifest()
+
+    def close(self):
+        """Close the current part and write the top-level manifest."""
+        self.__close_part()
+        self.__write_manifest()
+
+    def __get_file_name(self, asset_type: str, extension: str, file_name: str | None) -> str:
+        # Names are generated here rather than by the part writers to keep them unique across the parts
+        if file_name is not None:
+            if f"{asset_type}/{file_name}" in self.__refs:
+                msg = f"Asset {asset_type}/{file_name} already exists in the bundle."
+                raise ValueError(msg)
+        else:
+            counter = self.__type_counters.get(asset_type, 0)
+            while file_name is None or f"{asset_type}/{file_name}" in self.__refs:
+                counter += 1
+                file_name = f"{str(counter).rjust(6, '0')}.{extension}"
+            self.__type_counters[asset_type] = counter
+        self.__refs.add(f"{asset_type}/{file_name}")
+        return file_name
+
+    def __get_part_writer(self, rel_asset: AssetRef | list[AssetRef] | None) -> DefaultBundleWriter:
+        if self.__part_writer is not None and not rel_asset and self.__is_part_full():
+            self.__close_part()
+        if self.__part_writer is None:
+            first_asset = sum(x.asset_count for x in self.__manifest.shards)
+            shard = BundleShardInfo(
+                file_name=_PART_NAME_TEMPLATE.format(len(self.__manifest.shards) + 1), first_asset=first_asset
+            )
+            self.__part_writer = DefaultBundleWriter(
+                self._bundle_dir / shard.file_name, comment=self.__manifest.comment, **self._writer_options
+            )
+            self.__manifest.shards.append(shard)
+        return self.__part_writer
+
+    def __is_part_full(self) -> bool:
+        if self._max_shard_assets is not None and len(self.__part_assets) >= self._max_shard_assets:
+            return True
+        if self._max_shard_size is not None:
+            # Assets are written in order, so sizes become known in order too
+            while (
+                self.__part_sized_count < len(self.__part_assets)
+                and self.__part_assets[self.__part_sized_count].size is not None
+            ):
+                self.__part_size += cast(int, self.__part_assets[self.__part_sized_count].size)
+                self.__part_sized_count += 1
+            return self.__part_size >= self._max_shard_size
+        return False
+
+    def __update_part_stats(self):
+        shard = self.__manifest.shards[-1]
+        shard.asset_count = len(self.__part_assets)
+        shard.total_size = sum(x.size or 0 for x in self.__part_assets)
+        self.__manifest.assets.total_count = sum(x.asset_count for x in self.__manifest.shards)
+        self.__manifest.assets.total_size = sum(x.total_size for x in self.__manifest.shards)
+
+    def __close_part(self):
+        if self.__part_writer is None:
+            return
+        self.__part_writer.close()
+        self.__update_part_stats()
+        for x in self.__part_assets:
+            self.__manifest.assets.count_by_type[x.type] = self.__manifest.assets.count_by_type.get(x.type, 0) + 1
+        self.__part_writer = None
+        self.__part_assets = []
+        self.__part_size = 0
+        self.__part_sized_count = 0
+
+    def __write_manifest(self):
+        manifest = self.__manifest.copy(deep=True)
+        # Assets of the part still being written are not counted by type yet
+        for x in self.__part_assets:
+            manifest.assets.count_by_type[x.type] = manifest.assets.count_by_type.get(x.type, 0) + 1
+        tmp_path = self._bundle_dir / f".{SHARDS_MANIFEST}.tmp"
+        tmp_path.write_text(manifest.json(indent=2, exclude_none=True), encoding="utf-8")
+        os.replace(tmp_path, self._bundle_dir / SHARDS_MANIFEST)
+
+
+class ShardedBundleReader(BaseBundleReader):
+    """
+    Reader of sharded bundles, presents all the parts as one logical bundle.
+
+    All the parts are opened and their TOCs are loaded on construction. To process the parts independently, open them
+    with DefaultBundleReader (see `get_shard_paths`) or use `map_shards`.
+    """
+
+    def __init__(self, bundle_dir: PathLike | str, use_binary_toc: bool = True):
+        """
+        Construct the reader.
+
+        :param bundle_dir: path to the bundle directory
+        :param use_binary_toc: if False, binary TOCs of the parts are ignored
+        """
+        self._bundle_dir = Path(bundle_dir)
+        self.__manifest = _read_sharded_manifest(self._bundle_dir)
+        self.__parts: list[DefaultBundleReader] = []
+        self.__part_by_ref: dict[str, DefaultBundleReader] = {}
+        self.__toc_index = TocIndex()
+        try:
+            for path in self.get_shard_paths():
+                part = DefaultBundleReader(path, use_binary_toc=use_binary_toc)
+                self.__parts.append(part)
+                for asset in part.assets_iter():
+                    self.__toc_index.add(asset)
+                    self.__part_by_ref[asset.ref] = part
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Close all the parts."""
+        for x in self.__parts:
+            x.close()
+
+    def get_manifest(self) -> BundleManifest:
+        """Get the manifest of the whole bundle. Manifest object is immutable."""
+        return BundleManifest(
+            format=self.__manifest.format,
+            generator=self.__manifest.generator,
+            assets=self.__manifest.assets.copy(deep=True),
+            comment=self.__manifest.comment,
+            created_at=self.__manifest.created_at,
+        )
+
+    def get_sharded_manifest(self) -> ShardedBundleManifest:
+        """Get the top-level manifest listing the parts. Manifest object is immutable."""
+        return self.__manifest.copy(deep=True)
+
+    def get_shard_paths(self) -> list[Path]:
+        """Get paths of the parts in order."""
+        return [self._bundle_dir / x.file_name for x in self.__manifest.shards]
+
+    def assets_iter(self) -> Iterator[AssetInfo]:
+        """Iterate over all assets in the bundle."""
+        yield from self.__toc_index.assets()
+
+    def root_assets_iter(
+        self,
+        filter_or_type: AssetFilter | str | AssetType | None = None,
+        name: str | None = None,
+        parent_ref: AssetRef | None = None,
+        ref_type: str | None = None,
+        is_translated: bool | None = None,
+    ) -> Iterator[AssetInfo]:
+        """Iterate over all root assets in the bundle."""
+        if callable(filter_or_type):
+            _filter = filter_or_type
+            candidates = self.__toc_index.root_assets()
+        else:
+            _filter = self._create_asset_filter(filter_or_type, name, parent_ref, ref_type, is_translated)
+            candidates = self.__toc_index.root_assets(filter_or_type)
+        for x in candidates:
+            if _filter(x):
+                yield x
+
+    def get_relative_assets_iter(
+        self, asset: AssetRef, rel_type: str | Sequence[str] | None = None
+    ) -> Iterator[AssetInfo]:
+        """Iterate over all assets that are relative to the given asset, regardless of the part they are in."""
+        yield from self.__toc_index.relatives_iter(self._asset_ref_to_str(asset), rel_type)
+
+    def get_asset_by_ref(self, asset_ref: AssetRef) -> AssetInfo | None:
+        """Get the asset by its reference."""
+        if isinstance(asset_ref, AssetInfo):
+            return asset_ref
+        return self.__toc_index.get(asset_ref)
+
+    def read_blob_asset(self, asset_ref: AssetRef) -> IO[bytes]:
+        """Read the blob asset."""
+        return self.__get_part(asset_ref).read_blob_asset(asset_ref)
+
+    def read_blob_asset_view(self, asset_ref: AssetRef) -> memoryview | IO[bytes]:
+        """Read the blob asset without copying, see DefaultBundleReader.read_blob_asset_view."""
+        return self.__get_part(asset_ref).read_blob_asset_view(asset_ref)
+
+    def read_object_asset(self, obj_class: type[TOpenEpdObject], asset_ref: AssetRef) -> TOpenEpdObject:
+        """Read the object asset."""
+        return self.__get_part(asset_ref).read_object_asset(obj_class, asset_ref)
+
+    def _read_asset_bytes(self, asset: AssetInfo) -> bytes:
+        return self.__get_part(asset)._read_asset_bytes(asset)
+
+    def __get_part(self, asset_ref: AssetRef) -> DefaultBundleReader:
+        part = self.__part_by_ref.get(self._asset_ref_to_str(asset_ref))
+        if part is None:
+            msg = "Asset not found"
+            raise ValueError(msg)
+        return part
+
+
+def _run_on_shard(func: Callable[[DefaultBundleReader], T], path: Path, use_binary_toc: bool) -> T:
+    # Must be a module level function to be usable from the process pool
+    with DefaultBundleReader(path, use_binary_toc=use_binary_toc) as reader:
+        return func(reader)
+
+
+def map_shards(
+    bundle_dir: PathLike | str,
+    func: Callable[[DefaultBundleReader], T],
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    use_binary_toc: bool = True,
+) -> Iterator[T]:
+    """
+    Apply the function to every part of the sharded bundle in parallel.
+
+    Every part is opened by the worker itself, so nothing but the path is sent to the worker. Relations pointing to
+    the assets in other parts could not be resolved by the function.
+
+    :param bundle_dir: path to the bundle directory
+    :param func: the function to apply, it gets the reader of the part. Must be picklable if processes are used.
+    :param max_workers: the number of worker processes. Ignored if `executor` is given.
+    :param executor: executor to run the function with. If None, a process pool is created for the duration of the
+        iteration.
+    :param use_binary_toc: if False, binary TOCs of the parts are ignored
+    :return: an iterator over the results in the order of parts
+    """
+    bundle_path = Path(bundle_dir)
+    manifest = _read_sharded_manifest(bundle_path)
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    futures = [executor.submit(_run_on_shard, func, bundle_path / x.file_name, use_binary_toc) for x in manifest.shards]
+    try:
+        for x in futures:
+            yield x.result()
+    finally:
+        for x in futures:
+            x.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,270 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Export of bundles to SQLite databases for ad-hoc queries.
+
+The database has the following tables, all keyed by the asset reference (`ref`):
+
+* `assets` - the TOC of the bundle;
+* `relations` - relations between assets (`ref` is related to `rel_ref` with `rel_type`);
+* `epds` - common fields of EPDs: identifier, names, manufacturer, validity dates, declared unit and A1A2A3 GWP;
+* `epd_categories` - product classes of EPDs, one row per classification and category;
+* `epd_geographies` - geographies EPDs are applicable in;
+* `impacts` - flattened impacts of EPDs, one row per LCIA method, indicator and stage.
+
+For example, EPDs of a category ordered by GWP::
+
+    SELECT e.ref, e.name, e.gwp_a1a2a3 FROM epds e JOIN epd_categories c ON c.ref = e.ref
+    WHERE c.category = 'Concrete >> ReadyMix' ORDER BY e.gwp_a1a2a3
+"""
+
+from collections.abc import Iterator, Mapping
+import json
+from os import PathLike
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+from openepd.bundle.base import BaseBundleReader
+from openepd.bundle.model import AssetInfo, AssetType, RelType
+
+__all__ = ("export_to_sqlite",)
+
+_SCHEMA = """
+CREATE TABLE assets (
+    ref TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    name TEXT,
+    lang TEXT,
+    comment TEXT,
+    content_type TEXT,
+    size INTEGER,
+    custom_type TEXT,
+    custom_data TEXT,
+    content_hash TEXT,
+    location TEXT
+);
+CREATE TABLE relations (ref TEXT NOT NULL, rel_ref TEXT NOT NULL, rel_type TEXT);
+CREATE TABLE epds (
+    ref TEXT PRIMARY KEY,
+    id TEXT,
+    name TEXT,
+    product_name TEXT,
+    manufacturer TEXT,
+    manufacturer_web_domain TEXT,
+    date_of_issue TEXT,
+    valid_until TEXT,
+    declared_unit_qty REAL,
+    declared_unit_unit TEXT,
+    gwp_a1a2a3 REAL
+);
+CREATE TABLE epd_categories (ref TEXT NOT NULL, classification TEXT NOT NULL, category TEXT NOT NULL);
+CREATE TABLE epd_geographies (ref TEXT NOT NULL, geography TEXT NOT NULL);
+CREATE TABLE impacts (
+    ref TEXT NOT NULL,
+    method TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    mean REAL,
+    unit TEXT
+);
+"""
+
+# Indexes are created after the data is loaded, which is much faster than maintaining them on every insert
+_INDEXES = """
+CREATE INDEX assets_type ON assets (type);
+CREATE INDEX relations_ref ON relations (ref);
+CREATE INDEX relations_rel_ref ON relations (rel_ref, rel_type);
+CREATE INDEX epds_id ON epds (id);
+CREATE INDEX epds_manufacturer ON epds (manufacturer);
+CREATE INDEX epds_date_of_issue ON epds (date_of_issue);
+CREATE INDEX epds_valid_until ON epds (valid_until);
+CREATE INDEX epds_gwp_a1a2a3 ON epds (gwp_a1a2a3);
+CREATE INDEX epd_categories_ref ON epd_categories (ref);
+CREATE INDEX epd_categories_category ON epd_categories (category, classification);
+CREATE INDEX epd_geographies_ref ON epd_geographies (ref);
+CREATE INDEX epd_geographies_geography ON epd_geographies (geography);
+CREATE INDEX impacts_ref ON impacts (ref);
+CREATE INDEX impacts_indicator ON impacts (indicator, stage, mean);
+"""
+
+_ASSET_COLUMNS = (
+    "ref",
+    "type",
+    "name",
+    "lang",
+    "comment",
+    "content_type",
+    "size",
+    "custom_type",
+    "custom_data",
+    "content_hash",
+    "location",
+)
+
+
+def _execute_script(connection: sqlite3.Connection, script: str) -> None:
+    # Unlike `executescript`, doesn't commit the pending transaction
+    for statement in script.split(";"):
+        if statement.strip():
+            connection.execute(statement)
+
+
+def _insert_sql(table: str, columns_count: int) -> str:
+    return f"INSERT INTO {table} VALUES ({', '.join('?' * columns_count)})"  # noqa: S608
+
+
+class _Batch:
+    """Rows of the tables buffered for `executemany`."""
+
+    def __init__(self, connection: sqlite3.Connection, size: int) -> None:
+        self._connection = connection
+        self._size = size
+        self._rows: dict[str, list[tuple]] = {}
+        self._count = 0
+
+    def add(self, table: str, row: tuple) -> None:
+        self._rows.setdefault(table, []).append(row)
+        self._count += 1
+        if self._count >= self._size:
+            self.flush()
+
+    def flush(self) -> None:
+        for table, rows in self._rows.items():
+            if rows:
+                self._connection.executemany(_insert_sql(table, len(rows[0])), rows)
+        self._rows = {}
+        self._count = 0
+
+
+def _get_dict(value: Any, key: str) -> Mapping[str, Any]:
+    result = value.get(key) if isinstance(value, Mapping) else None
+    return result if isinstance(result, Mapping) else {}
+
+
+def _iter_impacts(epd: Mapping[str, Any]) -> Iterator[tuple[str, str, str, Any, Any]]:
+    for method, indicators in _get_dict(epd, "impacts").items():
+        if not isinstance(indicators, Mapping):
+            continue
+        for indicator, stages in indicators.items():
+            if not isinstance(stages, Mapping):
+                continue
+            for stage, measurement in stages.items():
+                if isinstance(measurement, Mapping) and "mean" in measurement:
+                    yield method, indicator, stage, measurement["mean"], measurement.get("unit")
+
+
+def _export_epd(batch: _Batch, ref: str, epd: Mapping[str, Any], manufacturer: Mapping[str, Any]) -> None:
+    impacts = list(_iter_impacts(epd))
+    gwp = next((mean for _, indicator, stage, mean, _ in impacts if indicator == "gwp" and stage == "A1A2A3"), None)
+    declared_unit = _get_dict(epd, "declared_unit")
+    batch.add(
+        "epds",
+        (
+            ref,
+            epd.get("id"),
+            epd.get("name"),
+            epd.get("product_name"),
+            manufacturer.get("name"),
+            manufacturer.get("web_domain"),
+            epd.get("date_of_issue"),
+            epd.get("valid_until"),
+            declared_unit.get("qty"),
+            declared_unit.get("unit"),
+            gwp,
+        ),
+    )
+    for classification, categories in _get_dict(epd, "product_classes").items():
+        for category in categories if isinstance(categories, list) else [categories]:
+            batch.add("epd_categories", (ref, classification, category))
+    for geography in epd.get("applicable_in") or ():
+        batch.add("epd_geographies", (ref, geography))
+    for row in impacts:
+        batch.add("impacts", (ref, *row))
+
+
+def _get_manufacturer(
+    reader: BaseBundleReader, asset: AssetInfo, epd: Mapping[str, Any], cache: dict[str, Mapping[str, Any]]
+) -> Mapping[str, Any]:
+    manufacturer = _get_dict(epd, "manufacturer")
+    if manufacturer:
+        return manufacturer
+    # The manufacturer of the bundles written with normalized dependencies is a separate asset
+    dependency = next(reader.get_relative_assets_iter(asset, RelType.Manufacturer), None)
+    if dependency is None:
+        return {}
+    key = dependency.location or dependency.ref
+    if key not in cache:
+        cache[key] = json.loads(reader.read_asset_bytes(dependency))
+    return cache[key]
+
+
+def export_to_sqlite(
+    reader: BaseBundleReader,
+    database: PathLike | str | sqlite3.Connection,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Export the bundle to the SQLite database, see the module description for the schema.
+
+    EPDs are read as plain JSON without validation, one by one, so the memory consumption doesn't depend on the size
+    of the bundle. The whole export is done in a single transaction, and indexes are built at the end.
+
+    :param reader: the reader of the bundle
+    :param database: path to the database file, which must not exist, or an open connection to an empty database.
+        The connection is neither committed nor closed in the latter case.
+    :param batch_size: the number of rows inserted at once
+    :return: the number of exported EPDs
+    """
+    database_path: Path | None = None
+    if isinstance(database, sqlite3.Connection):
+        connection = database
+    else:
+        database_path = Path(database)
+        if database_path.exists():
+            msg = "Database file already exists."
+            raise ValueError(msg)
+        connection = sqlite3.connect(database_path)
+        # The database is created from scratch, so there is nothing to protect in case of a crash
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+    try:
+        _execute_script(connection, _SCHEMA)
+        batch = _Batch(connection, batch_size)
+        manufacturers: dict[str, Mapping[str, Any]] = {}
+        epd_count = 0
+        for asset in reader.assets_iter():
+            batch.add("assets", tuple(getattr(asset, x) for x in _ASSET_COLUMNS))
+            for rel_ref in reader.get_rel_asset_list(asset):
+                batch.add("relations", (asset.ref, rel_ref, asset.rel_type))
+            if asset.type != AssetType.Epd:
+                continue
+            epd = json.loads(reader.read_asset_bytes(asset))
+            _export_epd(batch, asset.ref, epd, _get_manufacturer(reader, asset, epd, manufacturers))
+            epd_count += 1
+        batch.flush()
+        _execute_script(connection, _INDEXES)
+        if database_path is not None:
+            connection.commit()
+        return epd_count
+    except BaseException:
+        if database_path is not None:
+            connection.close()
+            database_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if database_path is not None:
+            connection.close()
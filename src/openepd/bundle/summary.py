@@ -0,0 +1,138 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Summary index of the bundle.
+
+Summary index is an optional bundle entry with one JSON line per object asset, holding a few preview fields of the
+object. It allows listing the bundle content without reading and parsing the objects themselves.
+"""
+
+from collections.abc import Mapping, Sequence
+import datetime
+from enum import Enum
+import json
+from typing import Any
+
+from openepd.compat.pydantic import pyd
+from openepd.model.base import BaseOpenEpdSchema
+
+__all__ = ("DEFAULT_SUMMARY_FIELDS", "SUMMARY_ENTRY", "SummaryFieldPath", "extract_summary", "summary_row_to_json")
+
+SUMMARY_ENTRY = "summary.jsonl"
+"""Name of the bundle entry holding the summary index."""
+
+SummaryFieldPath = str | Sequence[str]
+"""
+Path to the value within the object, either a dotted string or a sequence of keys.
+
+Keys are field names or aliases, dictionary keys or list indexes. Use the sequence form for the keys containing dots.
+`*` stands for any dictionary key or list item, the first non-empty value is taken.
+"""
+
+DEFAULT_SUMMARY_FIELDS: Mapping[str, SummaryFieldPath] = {
+    "name": "name",
+    "manufacturer": "manufacturer.name",
+    "product_classes": "product_classes",
+    "declared_unit": "declared_unit",
+    "gwp_a1a2a3": "impacts.*.gwp.A1A2A3",
+}
+"""Preview fields of EPDs: product name, manufacturer, category, declared unit and A1A2A3 GWP."""
+
+_ANY_KEY = "*"
+
+
+def _get_child(value: Any, key: str) -> Any:
+    if isinstance(value, pyd.BaseModel):
+        if "__root__" in value.__fields__:
+            return _get_child(getattr(value, "__root__"), key)  # noqa: B009
+        field = value.__fields__.get(key)
+        if field is None:
+            field = next((x for x in value.__fields__.values() if x.alias == key), None)
+        return getattr(value, field.name) if field is not None else None
+    if isinstance(value, Mapping):
+        if key in value:
+            return value[key]
+        # Keys might be enums, e.g. LCIA methods
+        return next((v for k, v in value.items() if str(k) == key), None)
+    if isinstance(value, Sequence) and not isinstance(value, str) and key.isdigit():
+        index = int(key)
+        return value[index] if index < len(value) else None
+    return None
+
+
+def _children(value: Any) -> list[Any]:
+    if isinstance(value, pyd.BaseModel):
+        if "__root__" in value.__fields__:
+            return _children(getattr(value, "__root__"))  # noqa: B009
+        return [getattr(value, x) for x in value.__fields__]
+    if isinstance(value, Mapping):
+        return list(value.values())
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return list(value)
+    return []
+
+
+def _resolve(value: Any, path: Sequence[str]) -> Any:
+    for i, key in enumerate(path):
+        if value is None:
+            return None
+        if key == _ANY_KEY:
+            for child in _children(value):
+                resolved = _resolve(child, path[i + 1 :])
+                if resolved is not None:
+                    return resolved
+            return None
+        value = _get_child(value, key)
+    return value
+
+
+def extract_summary(obj: BaseOpenEpdSchema, fields: Mapping[str, SummaryFieldPath]) -> dict[str, Any]:
+    """
+    Extract preview fields from the object.
+
+    :param obj: the object to extract fields from
+    :param fields: mapping of the preview field name to the path of the value within the object
+    :return: values of the preview fields, the ones resolved to None are omitted
+    """
+    result: dict[str, Any] = {}
+    for name, path in fields.items():
+        value = _resolve(obj, path.split(".") if isinstance(path, str) else path)
+        if value is not None:
+            result[name] = value
+    return result
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, pyd.BaseModel):
+        return value.dict(by_alias=True, exclude_none=True)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    return str(value)
+
+
+def summary_row_to_json(ref: str, asset_type: str, fields: Mapping[str, Any]) -> str:
+    """Serialize the row of the summary index into a JSON line."""
+    return (
+        json.dumps(
+            {"ref": ref, "type": str(asset_type), "fields": fields},
+            default=_json_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        + "\n"
+    )
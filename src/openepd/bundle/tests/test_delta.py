@@ -0,0 +1,120 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from io import BytesIO
+from pathlib import Path
+import tempfile
+import unittest
+
+from openepd.bundle.delta import DELTA_CUSTOM_TYPE, BundleDiff, apply_delta, diff_bundles, write_delta_bundle
+from openepd.bundle.model import RelType
+from openepd.bundle.reader import DefaultBundleReader
+from openepd.bundle.writer import DefaultBundleWriter
+from openepd.model.pcr import Pcr
+
+SRC_DATA = Path(__file__).parent / "data" / "source"
+
+
+class DeltaBundleTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        with open(SRC_DATA / "test-pcr.json") as pcr_file:
+            self.pcr_obj = Pcr.parse_raw(pcr_file.read())
+        self.base_file = self.__path("base.epb")
+        with DefaultBundleWriter(self.base_file) as writer:
+            pcr = writer.write_object_asset(self.pcr_obj, file_name="kept.json")
+            writer.write_blob_asset(BytesIO(b"old pdf"), "application/pdf", pcr, RelType.Pdf, file_name="kept.pdf")
+            writer.write_blob_asset(BytesIO(b"same"), "text/plain", pcr, "note", file_name="note.txt")
+            writer.write_object_asset(self.pcr_obj, file_name="removed.json")
+        self.target_file = self.__path("target.epb")
+        with DefaultBundleWriter(self.target_file) as writer:
+            pcr = writer.write_object_asset(self.pcr_obj, file_name="kept.json")
+            writer.write_blob_asset(BytesIO(b"new pdf"), "application/pdf", pcr, RelType.Pdf, file_name="kept.pdf")
+            writer.write_blob_asset(BytesIO(b"same"), "text/plain", pcr, "note", file_name="note.txt", name="Renamed")
+            writer.write_object_asset(self.pcr_obj, file_name="added.json")
+
+    def __path(self, name: str) -> Path:
+        return Path(self.tmp_dir.name) / name
+
+    def test_diff_bundles(self):
+        with DefaultBundleReader(self.base_file) as base, DefaultBundleReader(self.target_file) as target:
+            self.assertEqual(
+                BundleDiff(["pcr/added.json"], ["blob/kept.pdf", "blob/note.txt"], ["pcr/removed.json"]),
+                diff_bundles(base, target),
+            )
+            self.assertTrue(diff_bundles(base, base).is_empty())
+
+    def test_write_and_apply_delta(self):
+        delta_file = self.__path("delta.epb")
+        with (
+            DefaultBundleReader(self.base_file) as base,
+            DefaultBundleReader(self.target_file) as target,
+            DefaultBundleWriter(delta_file) as writer,
+        ):
+            diff = write_delta_bundle(base, target, writer)
+        with DefaultBundleReader(delta_file) as delta:
+            refs = [x.ref for x in delta.assets_iter() if x.custom_type != DELTA_CUSTOM_TYPE]
+            self.assertEqual(["blob/kept.pdf", "blob/note.txt", "pcr/added.json"], refs)
+
+        result_file = self.__path("result.epb")
+        with (
+            DefaultBundleReader(self.base_file) as base,
+            DefaultBundleReader(delta_file) as delta,
+            DefaultBundleWriter(result_file) as writer,
+        ):
+            self.assertEqual(diff, apply_delta(base, delta, writer))
+        with DefaultBundleReader(result_file) as result, DefaultBundleReader(self.target_file) as target:
+            self.assertTrue(diff_bundles(target, result).is_empty())
+            self.assertEqual(b"new pdf", result.read_blob_asset("blob/kept.pdf").read())
+            self.assertEqual(self.pcr_obj, result.read_object_asset(Pcr, "pcr/added.json"))
+            self.assertEqual(
+                ["blob/kept.pdf", "blob/note.txt"], [x.ref for x in result.get_relative_assets_iter("pcr/kept.json")]
+            )
+
+    def test_asset_named_as_tombstones(self):
+        with DefaultBundleWriter(self.target_file, append=True) as writer:
+            writer.write_blob_asset(BytesIO(b"asset"), "application/json", file_name="delta.json")
+            writer.write_blob_asset(BytesIO(b"asset"), "application/json", file_name="delta-1.json")
+        delta_file = self.__path("delta.epb")
+        with (
+            DefaultBundleReader(self.base_file) as base,
+            DefaultBundleReader(self.target_file) as target,
+            DefaultBundleWriter(delta_file) as writer,
+        ):
+            diff = write_delta_bundle(base, target, writer)
+        self.assertEqual(["pcr/added.json", "blob/delta.json", "blob/delta-1.json"], diff.added)
+        with DefaultBundleReader(delta_file) as delta:
+            (tombstones,) = [x.ref for x in delta.assets_iter() if x.custom_type == DELTA_CUSTOM_TYPE]
+            self.assertEqual("blob/delta-2.json", tombstones)
+
+        result_file = self.__path("result.epb")
+        with (
+            DefaultBundleReader(self.base_file) as base,
+            DefaultBundleReader(delta_file) as delta,
+            DefaultBundleWriter(result_file) as writer,
+        ):
+            self.assertEqual(diff, apply_delta(base, delta, writer))
+        with DefaultBundleReader(result_file) as result, DefaultBundleReader(self.target_file) as target:
+            self.assertTrue(diff_bundles(target, result).is_empty())
+            self.assertEqual(b"asset", result.read_blob_asset("blob/delta.json").read())
+
+    def test_apply_not_delta(self):
+        with (
+            DefaultBundleReader(self.base_file) as base,
+            DefaultBundleWriter(self.__path("result.epb")) as writer,
+            self.assertRaises(ValueError),
+        ):
+            apply_delta(base, base, writer)
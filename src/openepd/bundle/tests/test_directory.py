@@ -0,0 +1,105 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from io import BytesIO
+from pathlib import Path
+import tempfile
+import unittest
+import zipfile
+
+from openepd.bundle.directory import DirectoryBundleReader, DirectoryBundleWriter, pack_bundle, unpack_bundle
+from openepd.bundle.model import AssetType, RelType
+from openepd.bundle.reader import DefaultBundleReader
+from openepd.model.pcr import Pcr
+
+SRC_DATA = Path(__file__).parent / "data" / "source"
+
+
+class DirectoryBundleTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.bundle_dir = Path(self.tmp_dir.name) / "bundle"
+        with open(SRC_DATA / "test-pcr.json") as pcr_file:
+            self.pcr_obj = Pcr.parse_raw(pcr_file.read())
+        with open(SRC_DATA / "test-pcr.pdf", "rb") as pdf_file:
+            self.pdf_content = pdf_file.read()
+
+    def __write_bundle(self, **kwargs) -> None:
+        with DirectoryBundleWriter(self.bundle_dir, comment="Directory", **kwargs) as writer:
+            self.pcr = writer.write_object_asset(self.pcr_obj)
+            self.pdf = writer.write_blob_asset(BytesIO(self.pdf_content), "application/pdf", self.pcr, RelType.Pdf)
+            self.pdf_copy = writer.write_blob_asset(BytesIO(self.pdf_content), "application/pdf", self.pcr, "copy")
+
+    def test_write_and_read(self):
+        self.__write_bundle(binary_toc=True, deduplicate_blobs=True)
+        self.assertTrue((self.bundle_dir / self.pcr.ref).is_file())
+        self.assertFalse((self.bundle_dir / self.pdf_copy.ref).exists())
+        self.assertEqual([], list(self.bundle_dir.rglob(".*.tmp")))
+
+        with DirectoryBundleReader(self.bundle_dir) as reader:
+            self.assertEqual("Directory", reader.get_manifest().comment)
+            self.assertEqual(3, reader.get_manifest().assets.total_count)
+            pcr = reader.get_first_root_asset(AssetType.Pcr)
+            self.assertEqual(self.pcr_obj, reader.read_object_asset(Pcr, pcr))
+            self.assertEqual(2, len(reader.get_relative_assets(pcr)))
+            with reader.read_blob_asset(self.pdf_copy.ref) as blob:
+                self.assertEqual(self.pdf_content, blob.read())
+            self.assertEqual(self.pdf_content, reader.get_asset_path(self.pdf_copy.ref).read_bytes())
+            view = reader.read_blob_asset_view(self.pdf_copy.ref)
+            self.assertTrue(view.readonly)
+            self.assertEqual(self.pdf_content, bytes(view))
+
+    def test_existing_directory_not_overwritten(self):
+        self.__write_bundle()
+        with self.assertRaises(ValueError):
+            DirectoryBundleWriter(self.bundle_dir)
+
+    def test_append(self):
+        self.__write_bundle()
+        with DirectoryBundleWriter(self.bundle_dir, append=True) as writer:
+            writer.write_blob_asset(BytesIO(b"report"), "text/plain", self.pcr, "report")
+        with DirectoryBundleReader(self.bundle_dir) as reader:
+            self.assertEqual("Directory", reader.get_manifest().comment)
+            self.assertEqual(4, reader.get_manifest().assets.total_count)
+            self.assertEqual(3, len(reader.get_relative_assets(self.pcr)))
+
+    def test_pack_and_unpack(self):
+        self.__write_bundle(deduplicate_blobs=True)
+        bundle_file = Path(self.tmp_dir.name) / "bundle.epb"
+        pack_bundle(self.bundle_dir, bundle_file, compression=zipfile.ZIP_DEFLATED)
+        with zipfile.ZipFile(bundle_file) as archive:
+            self.assertIsNone(archive.testzip())
+        with DefaultBundleReader(bundle_file) as reader:
+            packed_assets = [x.dict() for x in reader.assets_iter()]
+            self.assertEqual(self.pdf_content, reader.read_blob_asset(self.pdf_copy.ref).read())
+
+        unpacked_dir = Path(self.tmp_dir.name) / "unpacked"
+        unpack_bundle(bundle_file, unpacked_dir)
+        with DirectoryBundleReader(unpacked_dir) as reader:
+            self.assertEqual(packed_assets, [x.dict() for x in reader.assets_iter()])
+            self.assertEqual(self.pcr_obj, reader.read_object_asset(Pcr, self.pcr.ref))
+
+    def test_verify_assets(self):
+        self.__write_bundle(deduplicate_blobs=True)
+        with DirectoryBundleReader(self.bundle_dir) as reader:
+            self.assertEqual([], reader.verify_assets())
+        # Same size, different content
+        pdf_path = self.bundle_dir / self.pdf.ref
+        pdf_path.write_bytes(bytes(255 - x for x in self.pdf_content))
+        with DirectoryBundleReader(self.bundle_dir) as reader:
+            errors = reader.verify_assets()
+        self.assertEqual([self.pdf.ref, self.pdf_copy.ref], [x.ref for x in errors])
+        self.assertIn("Content hash mismatch", errors[0].message)
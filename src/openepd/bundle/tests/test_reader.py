@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import unittest
 
@@ -78,3 +79,34 @@ class DefaultBundleReaderTestCase(unittest.TestCase):
         self.assertIsNotNone(pcr)
         pcr_obj = self.reader.read_object_asset(Pcr, pcr)
         self.assertEqual("1.0/1.5/1.1", pcr_obj.version)
+
+    def test_get_asset_by_ref(self):
+        pcr = self.reader.get_first_root_asset(AssetType.Pcr)
+        self.assertIsNotNone(pcr)
+        self.assertEqual(pcr, self.reader.get_asset_by_ref(pcr.ref))
+        self.assertIsNone(self.reader.get_asset_by_ref("pcr/non-existing.json"))
+
+    def test_read_object_assets_many(self):
+        pcr = self.reader.get_first_root_asset(AssetType.Pcr)
+        self.assertIsNotNone(pcr)
+        results = list(self.reader.read_object_assets_many(Pcr, max_workers=2))
+        self.assertEqual(2, len(results))
+        self.assertEqual(pcr.ref, results[0].ref)
+        self.assertIsNone(results[0].error)
+        self.assertEqual("1.0/1.5/1.1", results[0].obj.version)
+
+    def test_read_object_assets_many_reports_errors(self):
+        pcr = self.reader.get_first_root_asset(AssetType.Pcr)
+        pdf = self.reader.get_first_relative_asset(pcr, RelType.Pdf)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(
+                self.reader.read_object_assets_many(
+                    Pcr, [pcr, "pcr/non-existing.json", pdf], ordered=False, executor=executor
+                )
+            )
+        self.assertEqual(3, len(results))
+        by_ref = {x.ref: x for x in results}
+        self.assertIsNotNone(by_ref[pcr.ref].obj)
+        self.assertIsInstance(by_ref["pcr/non-existing.json"].error, ValueError)
+        self.assertIsInstance(by_ref[pdf.ref].error, ValueError)
+        self.assertIsNone(by_ref[pdf.ref].obj)
@@ -0,0 +1,54 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+
+from openepd.bundle.search import DEFAULT_SEARCH_FIELDS, SearchIndex, SearchIndexBuilder, tokenize
+from openepd.model.epd import Epd
+from openepd.model.org import Org
+
+
+class SearchIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        builder = SearchIndexBuilder(DEFAULT_SEARCH_FIELDS)
+        builder.add(
+            "epd/1.json",
+            "epd",
+            Epd(name="Ready-mix Concrete", manufacturer=Org(name="ACME"), product_classes={"io.cqd.ec3": "Concrete"}),
+        )
+        builder.add("epd/2.json", "epd", Epd(name="Concrete block with a very long description of the block"))
+        builder.add("epd/3.json", "epd", Epd(name="Steel rebar", manufacturer=Org(name="Acme Steel")))
+        self.data = builder.to_json()
+        self.index = SearchIndex(self.data)
+
+    def test_tokenize(self):
+        self.assertEqual(["ready", "mix", "béton", "c30"], tokenize("Ready-mix BÉTON, C30!"))
+
+    def test_search(self):
+        self.assertEqual(["epd/1.json", "epd/2.json"], [x.ref for x in self.index.search("concrete")])
+        self.assertEqual(["epd/1.json"], [x.ref for x in self.index.search("acme concrete")])
+        self.assertEqual([], self.index.search("acme concrete block"))
+        self.assertEqual([], self.index.search("conc"))
+        self.assertEqual(["epd/3.json"], [x.ref for x in self.index.search("ste acm", prefix=True)])
+        self.assertEqual(1, len(self.index.search("concrete", limit=1)))
+        self.assertEqual([], self.index.search("concrete", asset_type="pcr"))
+
+    def test_load(self):
+        builder = SearchIndexBuilder(DEFAULT_SEARCH_FIELDS)
+        builder.load(self.data)
+        builder.add("epd/4.json", "epd", Epd(name="Concrete pipe"))
+        index = SearchIndex(builder.to_json())
+        self.assertEqual(4, len(index))
+        self.assertEqual({"epd/1.json", "epd/2.json", "epd/4.json"}, {x.ref for x in index.search("concrete")})
@@ -0,0 +1,111 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+import tempfile
+import unittest
+import warnings
+import zipfile
+
+from openepd.bundle.model import AssetType, RelType
+from openepd.bundle.reader import DefaultBundleReader
+from openepd.bundle.sharded import ShardedBundleReader, ShardedBundleWriter, map_shards
+from openepd.model.pcr import Pcr
+
+SRC_DATA = Path(__file__).parent / "data" / "source"
+
+
+def _count_assets(reader: DefaultBundleReader) -> int:
+    return reader.get_manifest().assets.total_count
+
+
+class ShardedBundleTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.bundle_dir = Path(self.tmp_dir.name) / "bundle"
+        with open(SRC_DATA / "test-pcr.json") as pcr_file:
+            self.pcr_obj = Pcr.parse_raw(pcr_file.read())
+
+    def __write_bundle(self, count: int, **kwargs) -> list[tuple[str, str]]:
+        refs = []
+        with ShardedBundleWriter(self.bundle_dir, comment="Sharded", **kwargs) as writer:
+            for i in range(count):
+                pcr = writer.write_object_asset(self.pcr_obj)
+                pdf = writer.write_blob_asset(BytesIO(f"pdf {i}".encode()), "application/pdf", pcr, RelType.Pdf)
+                refs.append((pcr.ref, pdf.ref))
+        return refs
+
+    def test_write_and_read(self):
+        refs = self.__write_bundle(5, max_shard_assets=4, max_workers=2)
+        with ShardedBundleReader(self.bundle_dir) as reader:
+            manifest = reader.get_sharded_manifest()
+            self.assertEqual(3, len(manifest.shards))
+            self.assertEqual([0, 4, 8], [x.first_asset for x in manifest.shards])
+            self.assertEqual([4, 4, 2], [x.asset_count for x in manifest.shards])
+            self.assertEqual(10, reader.get_manifest().assets.total_count)
+            self.assertEqual({"pcr": 5, "blob": 5}, reader.get_manifest().assets.count_by_type)
+            self.assertEqual("Sharded", reader.get_manifest().comment)
+
+            self.assertEqual(len(set(sum(refs, ()))), len(list(reader.assets_iter())))
+            self.assertEqual([x[0] for x in refs], [x.ref for x in reader.root_assets_iter(AssetType.Pcr)])
+            pcr_ref, pdf_ref = refs[-1]
+            self.assertEqual(self.pcr_obj, reader.read_object_asset(Pcr, pcr_ref))
+            self.assertEqual([pdf_ref], [x.ref for x in reader.get_relative_assets_iter(pcr_ref)])
+            self.assertEqual(b"pdf 4", reader.read_blob_asset(pdf_ref).read())
+            self.assertEqual(b"pdf 4", bytes(reader.read_blob_asset_view(pdf_ref)))
+
+    def test_rollover_by_size(self):
+        self.__write_bundle(3, max_shard_size=1)
+        with ShardedBundleReader(self.bundle_dir) as reader:
+            # Related assets are kept in the part of their parent
+            self.assertEqual([2, 2, 2], [x.asset_count for x in reader.get_sharded_manifest().shards])
+            for path in reader.get_shard_paths():
+                with DefaultBundleReader(path) as part:
+                    pcr = part.get_first_root_asset(AssetType.Pcr)
+                    self.assertIsNotNone(pcr)
+                    self.assertEqual(1, len(part.get_relative_assets(pcr)))
+
+    def test_duplicate_file_name(self):
+        with ShardedBundleWriter(self.bundle_dir, max_shard_assets=1) as writer:
+            writer.write_object_asset(self.pcr_obj, file_name="pcr.json")
+            with self.assertRaises(ValueError):
+                writer.write_object_asset(self.pcr_obj, file_name="pcr.json")
+
+    def test_commit_and_close(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with ShardedBundleWriter(self.bundle_dir, max_shard_assets=10) as writer:
+                pcr = writer.write_object_asset(self.pcr_obj)
+                writer.commit()
+                writer.commit()
+                writer.write_blob_asset(BytesIO(b"pdf"), "application/pdf", pcr, RelType.Pdf)
+                writer.commit()
+        with ShardedBundleReader(self.bundle_dir) as reader:
+            self.assertEqual(2, reader.get_manifest().assets.total_count)
+            (path,) = reader.get_shard_paths()
+        with zipfile.ZipFile(path) as archive:
+            self.assertEqual(1, archive.namelist().count("manifest"))
+            self.assertEqual(1, archive.namelist().count("toc"))
+        with DefaultBundleReader(path) as part:
+            self.assertEqual(2, len(list(part.assets_iter())))
+
+    def test_map_shards(self):
+        self.__write_bundle(5, max_shard_assets=4)
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual([4, 4, 2], list(map_shards(self.bundle_dir, _count_assets, executor=executor)))
+        self.assertEqual([4, 4, 2], list(map_shards(self.bundle_dir, _count_assets, max_workers=2)))
@@ -0,0 +1,110 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from io import BytesIO
+from pathlib import Path
+import sqlite3
+import tempfile
+import unittest
+
+from openepd.bundle.base import BaseBundleWriter
+from openepd.bundle.directory import DirectoryBundleReader, DirectoryBundleWriter
+from openepd.bundle.model import RelType
+from openepd.bundle.reader import DefaultBundleReader
+from openepd.bundle.sqlite import export_to_sqlite
+from openepd.bundle.writer import DefaultBundleWriter
+from openepd.model.epd import EpdWithDeps
+from openepd.model.org import Org
+
+
+class SqliteExportTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.bundle_file = Path(self.tmp_dir.name) / "bundle.epb"
+        self.bundle_dir = Path(self.tmp_dir.name) / "bundle"
+        self.db_file = Path(self.tmp_dir.name) / "bundle.sqlite"
+        for writer in (
+            DefaultBundleWriter(self.bundle_file, normalize_dependencies=True),
+            DirectoryBundleWriter(self.bundle_dir, normalize_dependencies=True),
+        ):
+            with writer:
+                self.__write_epds(writer)
+
+    @staticmethod
+    def __write_epds(writer: BaseBundleWriter) -> None:
+        for i, (category, gwp) in enumerate([("Concrete >> ReadyMix", 300), ("Steel", 1500), ("Concrete", 200)]):
+            epd = writer.write_object_asset(
+                EpdWithDeps.parse_obj(
+                    {
+                        "name": f"Product {i}",
+                        "manufacturer": {"name": "ACME", "web_domain": "acme.com"},
+                        "product_classes": {"io.cqd.ec3": category},
+                        "applicable_in": ["US", "CA"],
+                        "valid_until": f"203{i}-01-01T00:00:00+00:00",
+                        "declared_unit": {"qty": 1, "unit": "m3"},
+                        "impacts": {
+                            "TRACI 2.1": {
+                                "gwp": {
+                                    "A1A2A3": {"mean": gwp, "unit": "kgCO2e"},
+                                    "A4": {"mean": 1, "unit": "kgCO2e"},
+                                }
+                            }
+                        },
+                    }
+                )
+            )
+            writer.write_blob_asset(BytesIO(b"pdf"), "application/pdf", epd, RelType.Pdf)
+        writer.write_object_asset(EpdWithDeps(name="Empty", manufacturer=Org(name="Other")))
+
+    def test_export(self):
+        with DefaultBundleReader(self.bundle_file) as reader:
+            self.assertEqual(4, export_to_sqlite(reader, self.db_file))
+        self.__check_database()
+
+    def test_export_directory_bundle(self):
+        with DirectoryBundleReader(self.bundle_dir) as reader:
+            self.assertEqual(4, export_to_sqlite(reader, self.db_file))
+        self.__check_database()
+
+    def __check_database(self) -> None:
+        with sqlite3.connect(self.db_file) as db:
+            self.assertEqual(
+                [("Product 2", 200.0), ("Product 0", 300.0)],
+                db.execute(
+                    "SELECT e.name, e.gwp_a1a2a3 FROM epds e JOIN epd_categories c ON c.ref = e.ref "
+                    "WHERE c.category LIKE 'Concrete%' ORDER BY e.gwp_a1a2a3"
+                ).fetchall(),
+            )
+            self.assertEqual(
+                [("ACME", "acme.com", 3), ("Other", None, 1)],
+                db.execute(
+                    "SELECT manufacturer, manufacturer_web_domain, count(*) FROM epds GROUP BY manufacturer"
+                ).fetchall(),
+            )
+            self.assertEqual(
+                [("Product 0",)],
+                db.execute("SELECT name FROM epds WHERE valid_until < '2031'").fetchall(),
+            )
+            self.assertEqual(3, db.execute("SELECT count(*) FROM epd_geographies WHERE geography = 'CA'").fetchone()[0])
+            self.assertEqual(6, db.execute("SELECT count(*) FROM impacts WHERE indicator = 'gwp'").fetchone()[0])
+            self.assertEqual(
+                3, db.execute("SELECT count(*) FROM relations WHERE rel_type = ?", (RelType.Pdf,)).fetchone()[0]
+            )
+
+    def test_existing_database_not_overwritten(self):
+        self.db_file.touch()
+        with DefaultBundleReader(self.bundle_file) as reader, self.assertRaises(ValueError):
+            export_to_sqlite(reader, self.db_file)
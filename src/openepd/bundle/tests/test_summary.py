@@ -0,0 +1,66 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import json
+import unittest
+
+from openepd.bundle.summary import DEFAULT_SUMMARY_FIELDS, extract_summary, summary_row_to_json
+from openepd.model.common import Amount
+from openepd.model.epd import Epd
+from openepd.model.lcia import Impacts
+from openepd.model.org import Org
+
+
+class SummaryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.epd = Epd(
+            name="Concrete",
+            manufacturer=Org(name="ACME"),
+            declared_unit=Amount(qty=1, unit="m3"),
+            impacts=Impacts.parse_obj({"TRACI 2.1": {"gwp": {"A1A2A3": {"mean": 10, "unit": "kgCO2e"}}}}),
+        )
+
+    def test_extract_default_fields(self):
+        row = json.loads(
+            summary_row_to_json("epd/000001.json", "epd", extract_summary(self.epd, DEFAULT_SUMMARY_FIELDS))
+        )
+        self.assertEqual(
+            {
+                "ref": "epd/000001.json",
+                "type": "epd",
+                "fields": {
+                    "name": "Concrete",
+                    "manufacturer": "ACME",
+                    "product_classes": {},
+                    "declared_unit": {"qty": 1.0, "unit": "m3"},
+                    "gwp_a1a2a3": {"mean": 10.0, "unit": "kgCO2e"},
+                },
+            },
+            row,
+        )
+
+    def test_extract_paths(self):
+        self.assertEqual(
+            {"gwp": 10.0, "unit": "m3"},
+            extract_summary(
+                self.epd,
+                {
+                    "gwp": ("impacts", "TRACI 2.1", "gwp", "A1A2A3", "mean"),
+                    "unit": "declared_unit.unit",
+                    "missing": "manufacturer.web_domain",
+                    "unknown": "no.such.field",
+                },
+            ),
+        )
@@ -0,0 +1,116 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from io import BytesIO
+import unittest
+
+from openepd.bundle.model import AssetInfo, AssetType, RelType
+from openepd.bundle.toc import BinaryTocReader, BinaryTocWriter, TocIndex
+
+
+def _asset(ref: str, asset_type: AssetType, rel_asset: str | None = None, rel_type: str | None = None) -> AssetInfo:
+    return AssetInfo(ref=ref, type=asset_type, lang=None, rel_type=rel_type, rel_asset=rel_asset)
+
+
+class TocIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = TocIndex(
+            [
+                _asset("epd/000001.json", AssetType.Epd),
+                _asset("pcr/000001.json", AssetType.Pcr),
+                _asset("blob/000001.bin", AssetType.Blob, "epd/000001.json", RelType.Pdf),
+                _asset("epd/000002.json", AssetType.Epd, "epd/000001.json", RelType.Translation),
+                _asset("blob/000002.bin", AssetType.Blob, "epd/000001.json;pcr/000001.json", RelType.Pdf),
+            ]
+        )
+
+    def test_lookup_by_ref(self):
+        self.assertEqual(5, len(self.index))
+        self.assertIn("pcr/000001.json", self.index)
+        self.assertEqual(AssetType.Pcr, self.index.get("pcr/000001.json").type)
+        self.assertIsNone(self.index.get("pcr/000002.json"))
+
+    def test_root_assets(self):
+        self.assertEqual(["epd/000001.json", "pcr/000001.json"], [x.ref for x in self.index.root_assets()])
+        self.assertEqual(["epd/000001.json"], [x.ref for x in self.index.root_assets(AssetType.Epd)])
+        self.assertEqual([], list(self.index.root_assets(AssetType.Org)))
+
+    def test_assets_by_type(self):
+        self.assertEqual(
+            ["epd/000001.json", "epd/000002.json"], [x.ref for x in self.index.assets_by_type(AssetType.Epd)]
+        )
+
+    def test_relatives(self):
+        self.assertEqual(
+            ["blob/000001.bin", "epd/000002.json", "blob/000002.bin"],
+            [x.ref for x in self.index.relatives_iter("epd/000001.json")],
+        )
+        self.assertEqual(
+            ["blob/000001.bin", "blob/000002.bin"],
+            [x.ref for x in self.index.relatives_iter("epd/000001.json", RelType.Pdf)],
+        )
+        self.assertEqual(
+            ["blob/000001.bin", "epd/000002.json", "blob/000002.bin"],
+            [x.ref for x in self.index.relatives_iter("epd/000001.json", [RelType.Pdf, RelType.Translation])],
+        )
+        self.assertEqual(["blob/000002.bin"], [x.ref for x in self.index.relatives_iter("pcr/000001.json")])
+        self.assertEqual([], list(self.index.relatives_iter("blob/000001.bin")))
+
+
+class BinaryTocTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        rows = [
+            {"ref": "epd/000001.json", "name": "Concrete", "type": "epd", "rel_asset": "", "size": 123.0},
+            {
+                "ref": "blob/000001.bin",
+                "name": "",
+                "type": "blob",
+                "rel_asset": "epd/000001.json",
+                "comment": "Ünïcode",
+            },
+        ]
+        stream = BytesIO()
+        with BinaryTocWriter(("ref", "name", "type", "rel_asset", "comment", "size")) as writer:
+            for x in rows:
+                writer.add(x)
+            writer.write_to(stream, toc_crc=42)
+
+        reader = BinaryTocReader(stream.getvalue())
+        self.assertEqual(42, reader.toc_crc)
+        self.assertEqual(2, len(reader))
+        self.assertEqual(
+            [
+                {"ref": "epd/000001.json", "name": "Concrete", "type": "epd", "rel_asset": None, "size": 123},
+                {"ref": "blob/000001.bin", "name": "", "type": "blob", "rel_asset": "epd/000001.json", "size": None},
+            ],
+            list(reader.rows_iter(("ref", "name", "type", "rel_asset", "size"))),
+        )
+        self.assertEqual("Ünïcode", list(reader.rows_iter())[1]["comment"])
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            BinaryTocReader(b"not a binary TOC at all")
+
+    def test_large_string_table(self):
+        stream = BytesIO()
+        with BinaryTocWriter(("ref",)) as writer:
+            writer.add({"ref": "epd/000001.json"})
+            writer.write_to(stream, toc_crc=0)
+        data = stream.getvalue()
+        # String offsets and the size of the string table are 64-bit, so string tables over 4 GiB are addressable
+        self.assertEqual(8 + 4 * 3 + 8 + 12 + 12 + len("ref") + len("epd/000001.json"), len(data))
+        # Version 1 with 32-bit offsets is not read, the CSV TOC is used instead
+        with self.assertRaisesRegex(ValueError, "Unsupported"):
+            BinaryTocReader(b"OEPDTOC1" + data[8:])
@@ -13,24 +13,40 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+from io import BytesIO
+import json
 from pathlib import Path
 import tempfile
 import unittest
+from unittest import mock
+import zipfile
 
+from openepd.bundle import ziputils
 from openepd.bundle.model import AssetType, RelType
 from openepd.bundle.reader import DefaultBundleReader
+from openepd.bundle.search import DEFAULT_SEARCH_FIELDS, tokenize
+from openepd.bundle.summary import DEFAULT_SUMMARY_FIELDS
 from openepd.bundle.writer import DefaultBundleWriter
+from openepd.model.epd import EpdWithDeps
+from openepd.model.org import Org, Plant
 from openepd.model.pcr import Pcr
 
 SRC_DATA = Path(__file__).parent / "data" / "source"
 
 
+class _NonSeekableStream(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
 class DefaultBundleReaderTestCase(unittest.TestCase):
     writer: DefaultBundleWriter
 
-    def __create_writer(self, comment: str | None = None) -> tuple[str, DefaultBundleWriter]:
+    def __create_writer(self, comment: str | None = None, **kwargs) -> tuple[str, DefaultBundleWriter]:
         tmp_file = tempfile.mktemp(suffix=".epb")  # noqa NOSONAR
-        return tmp_file, DefaultBundleWriter(tmp_file, comment=comment)
+        return tmp_file, DefaultBundleWriter(tmp_file, comment=comment, **kwargs)
 
     def __create_reader(self, file_name: str) -> DefaultBundleReader:
         return DefaultBundleReader(Path(file_name))
@@ -39,7 +55,7 @@ class DefaultBundleReaderTestCase(unittest.TestCase):
         bundle_comment = "First empty bundle"
         file_name, writer = self.__create_writer(bundle_comment)
         with writer:
-            pass  # noqa
+            pass
         with self.__create_reader(file_name) as reader:
             manifest = reader.get_manifest()
             self.assertEqual(bundle_comment, manifest.comment)
@@ -89,3 +105,349 @@ class DefaultBundleReaderTestCase(unittest.TestCase):
             self.assertEqual("Original PCR", pcr_asset_from_bundle.name)
             pdf_asset_from_bundle = reader.get_first_relative_asset(pcr_asset_from_bundle, RelType.Pdf)
             self.assertEqual("blob/pcr.pdf", pdf_asset_from_bundle.ref)
+
+    def test_write_compressed_bundle(self):
+        for name, max_workers in (("In calling thread", None), ("In background", 2)):
+            with self.subTest(name):
+                file_name, writer = self.__create_writer(
+                    compression=zipfile.ZIP_DEFLATED, compresslevel=9, compact_json=True, max_workers=max_workers
+                )
+                with writer, open(SRC_DATA / "test-pcr.json") as pcr_file, open(SRC_DATA / "test-pcr.pdf", "rb") as f:
+                    pcr_obj = Pcr.parse_raw(pcr_file.read())
+                    pcr_assets = [writer.write_object_asset(pcr_obj) for _ in range(10)]
+                    writer.write_blob_asset(f, "application/pdf", pcr_assets[0], RelType.Pdf)
+                    pcr_assets.append(writer.write_object_asset(pcr_obj, pcr_assets[0], RelType.Translation))
+                with zipfile.ZipFile(file_name) as archive:
+                    info = archive.getinfo(pcr_assets[0].ref)
+                    self.assertEqual(zipfile.ZIP_DEFLATED, info.compress_type)
+                    self.assertLess(info.compress_size, info.file_size)
+                    self.assertNotIn(b"\n", archive.read(pcr_assets[0].ref))
+                with self.__create_reader(file_name) as reader:
+                    self.assertEqual(
+                        [x.ref for x in pcr_assets[:10]], [x.ref for x in reader.root_assets_iter(AssetType.Pcr)]
+                    )
+                    self.assertEqual(12, reader.get_manifest().assets.total_count)
+                    for x in reader.assets_iter():
+                        self.assertIsNotNone(x.size)
+                    self.assertEqual(pcr_obj, reader.read_object_asset(Pcr, pcr_assets[-1].ref))
+                    self.assertEqual(1, len(reader.get_translations_for_asset(pcr_assets[0])))
+
+    def test_toc_spilled_to_disk(self):
+        class _SmallSpoolWriter(DefaultBundleWriter):
+            TOC_SPOOL_MAX_SIZE = 128
+
+        file_name = tempfile.mktemp(suffix=".epb")  # noqa NOSONAR
+        with _SmallSpoolWriter(file_name) as writer, open(SRC_DATA / "test-pcr.json") as pcr_file:
+            pcr_obj = Pcr.parse_raw(pcr_file.read())
+            refs = [writer.write_object_asset(pcr_obj, name=f"PCR {i}").ref for i in range(20)]
+        with self.__create_reader(file_name) as reader:
+            self.assertEqual(refs, [x.ref for x in reader.assets_iter()])
+            self.assertEqual("PCR 19", reader.get_asset_by_ref(refs[-1]).name)
+
+    def test_duplicate_asset_rejected(self):
+        file_name, writer = self.__create_writer()
+        with writer, open(SRC_DATA / "test-pcr.pdf", "rb") as pcr_pdf_file:
+            writer.write_blob_asset(pcr_pdf_file, "application/pdf", file_name="pcr.pdf")
+            with self.assertRaises(ValueError):
+                writer.write_blob_asset(pcr_pdf_file, "application/pdf", file_name="pcr.pdf")
+        with DefaultBundleWriter(file_name, append=True) as writer:
+            with self.assertRaises(ValueError):
+                writer.write_blob_asset(BytesIO(b"other"), "application/pdf", file_name="pcr.pdf")
+            generated = writer.write_blob_asset(BytesIO(b"other"), "application/pdf")
+        with self.__create_reader(file_name) as reader:
+            self.assertEqual(["blob/pcr.pdf", generated.ref], [x.ref for x in reader.assets_iter()])
+
+    def test_existing_bundle_not_overwritten(self):
+        file_name, writer = self.__create_writer()
+        with writer:
+            pass
+        with self.assertRaises(ValueError):
+            DefaultBundleWriter(file_name)
+
+    def test_append_to_existing_bundle(self):
+        file_name, writer = self.__create_writer("Original")
+        with (
+            writer,
+            open(SRC_DATA / "test-pcr.json") as pcr_file,
+            open(SRC_DATA / "test-pcr.pdf", "rb") as pcr_pdf_file,
+        ):
+            pcr_obj = Pcr.parse_raw(pcr_file.read())
+            first_pcr = writer.write_object_asset(pcr_obj)
+            writer.write_blob_asset(pcr_pdf_file, "application/pdf", first_pcr, RelType.Pdf)
+        with zipfile.ZipFile(file_name) as archive:
+            original_entries = {x.filename: x.header_offset for x in archive.infolist()}
+
+        with (
+            DefaultBundleWriter(file_name, append=True) as writer,
+            open(SRC_DATA / "extraction-report.txt", "rb") as report_file,
+        ):
+            second_pcr = writer.write_object_asset(pcr_obj, name="Second")
+            writer.write_blob_asset(report_file, "text/plain", first_pcr, "report")
+
+        self.assertNotEqual(first_pcr.ref, second_pcr.ref)
+        with zipfile.ZipFile(file_name) as archive:
+            names = archive.namelist()
+            self.assertEqual(1, names.count("toc"))
+            self.assertEqual(1, names.count("manifest"))
+            for x in archive.infolist():
+                if x.filename in original_entries and x.filename not in ("toc", "manifest"):
+                    self.assertEqual(original_entries[x.filename], x.header_offset)
+        with self.__create_reader(file_name) as reader:
+            manifest = reader.get_manifest()
+            self.assertEqual("Original", manifest.comment)
+            self.assertEqual(4, manifest.assets.total_count)
+            self.assertEqual(2, manifest.assets.count_by_type[AssetType.Pcr])
+            self.assertEqual(2, len(list(reader.root_assets_iter(AssetType.Pcr))))
+            self.assertEqual(2, len(reader.get_relative_assets(first_pcr)))
+            self.assertEqual("Second", reader.get_asset_by_ref(second_pcr.ref).name)
+            self.assertEqual(pcr_obj, reader.read_object_asset(Pcr, second_pcr))
+
+    def test_append_to_stream(self):
+        stream = BytesIO()
+        with DefaultBundleWriter(stream, append=True) as writer:
+            writer.write_blob_asset(BytesIO(b"first"), "text/plain")
+        with DefaultBundleWriter(stream, append=True) as writer:
+            writer.write_blob_asset(BytesIO(b"second"), "text/plain")
+        stream.seek(0)
+        with DefaultBundleReader(stream) as reader:
+            self.assertEqual(2, reader.get_manifest().assets.total_count)
+            self.assertEqual([b"first", b"second"], [reader.read_blob_asset(x).read() for x in reader.assets_iter()])
+
+    def test_zipfile_internals_supported(self):
+        """Test that zipfile of the running Python version allows updating bundles in place."""
+        with zipfile.ZipFile(BytesIO(), "w") as archive:
+            self.assertTrue(ziputils.supports_in_place_update(archive))
+
+    def test_zipfile_internals_unsupported(self):
+        with mock.patch.object(ziputils, "_ZIPFILE_INTERNALS", (*ziputils._ZIPFILE_INTERNALS, "_missing")):
+            file_name, writer = self.__create_writer(compression=zipfile.ZIP_DEFLATED, max_workers=2)
+            with writer, open(SRC_DATA / "test-pcr.json") as pcr_file:
+                pcr_obj = Pcr.parse_raw(pcr_file.read())
+                pcr_asset = writer.write_object_asset(pcr_obj)
+            with self.assertRaises(NotImplementedError):
+                DefaultBundleWriter(file_name, append=True)
+        with zipfile.ZipFile(file_name) as archive:
+            self.assertEqual(zipfile.ZIP_DEFLATED, archive.getinfo(pcr_asset.ref).compress_type)
+        with self.__create_reader(file_name) as reader:
+            self.assertEqual(pcr_obj, reader.read_object_asset(Pcr, pcr_asset))
+
+    def test_binary_toc(self):
+        file_name, writer = self.__create_writer(binary_toc=True)
+        with writer, open(SRC_DATA / "test-pcr.json") as pcr_file:
+            pcr = writer.write_object_asset(Pcr.parse_raw(pcr_file.read()), name="PCR")
+            writer.write_blob_asset(BytesIO(b"report"), "text/plain", pcr, "report")
+        with DefaultBundleWriter(file_name, append=True, binary_toc=True) as writer:
+            writer.write_blob_asset(BytesIO(b"second"), "text/plain", pcr, "report", comment="Appended")
+
+        with zipfile.ZipFile(file_name) as archive:
+            self.assertEqual(1, archive.namelist().count("toc.bin"))
+        with (
+            DefaultBundleReader(file_name) as binary_reader,
+            DefaultBundleReader(file_name, use_binary_toc=False) as csv_reader,
+        ):
+            self.assertEqual(
+                [x.dict(exclude_unset=True) for x in csv_reader.assets_iter()],
+                [x.dict(exclude_unset=True) for x in binary_reader.assets_iter()],
+            )
+            self.assertEqual(2, len(binary_reader.get_relative_assets(pcr, "report")))
+
+        # Bundle amended without binary TOC must not keep the stale one
+        with DefaultBundleWriter(file_name, append=True) as writer:
+            writer.write_blob_asset(BytesIO(b"third"), "text/plain")
+        with zipfile.ZipFile(file_name) as archive:
+            self.assertNotIn("toc.bin", archive.namelist())
+
+    def test_deduplicate_blobs(self):
+        file_name, writer = self.__create_writer(deduplicate_blobs=True)
+        with writer, open(SRC_DATA / "test-pcr.pdf", "rb") as pdf_file:
+            pdf_content = pdf_file.read()
+            pdf_file.seek(0)
+            first = writer.write_blob_asset(pdf_file, "application/pdf")
+            second = writer.write_blob_asset(_NonSeekableStream(pdf_content), "application/pdf", name="Copy")
+            other = writer.write_blob_asset(BytesIO(b"other"), "text/plain")
+        with DefaultBundleWriter(file_name, append=True, deduplicate_blobs=True) as writer:
+            third = writer.write_blob_asset(BytesIO(pdf_content), "application/pdf")
+
+        self.assertIsNone(first.location)
+        self.assertEqual(first.ref, second.location)
+        self.assertEqual(first.ref, third.location)
+        self.assertEqual(first.content_hash, third.content_hash)
+        self.assertNotEqual(first.content_hash, other.content_hash)
+        with zipfile.ZipFile(file_name) as archive:
+            self.assertNotIn(second.ref, archive.namelist())
+            self.assertNotIn(third.ref, archive.namelist())
+        with self.__create_reader(file_name) as reader:
+            self.assertEqual(4, reader.get_manifest().assets.total_count)
+            self.assertEqual("Copy", reader.get_asset_by_ref(second.ref).name)
+            for x in (first, second, third):
+                self.assertEqual(pdf_content, reader.read_blob_asset(x.ref).read())
+            self.assertEqual(b"other", reader.read_blob_asset(other.ref).read())
+
+    def test_deduplicated_ref_not_reused(self):
+        file_name, writer = self.__create_writer(deduplicate_blobs=True)
+        with writer:
+            writer.write_blob_asset(BytesIO(b"X"), "application/pdf", file_name="a.pdf")
+            deduplicated = writer.write_blob_asset(BytesIO(b"X"), "application/pdf", file_name="b.pdf")
+            with self.assertRaises(ValueError):
+                writer.write_blob_asset(BytesIO(b"Y"), "application/pdf", file_name="b.pdf")
+        with self.__create_reader(file_name) as reader:
+            self.assertEqual(
+                [("blob/a.pdf", None), ("blob/b.pdf", "blob/a.pdf")],
+                [(x.ref, x.location) for x in reader.assets_iter()],
+            )
+            self.assertEqual(b"X", reader.read_blob_asset(deduplicated.ref).read())
+
+    def test_read_blob_asset_view(self):
+        for compression in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            with self.subTest(compression=compression):
+                file_name, writer = self.__create_writer(compression=compression)
+                with writer:
+                    blob = writer.write_blob_asset(BytesIO(b"blob content"), "text/plain")
+                    empty = writer.write_blob_asset(BytesIO(b""), "text/plain")
+                with self.__create_reader(file_name) as reader:
+                    view = reader.read_blob_asset_view(blob)
+                    if compression == zipfile.ZIP_STORED:
+                        self.assertIsInstance(view, memoryview)
+                        self.assertTrue(view.readonly)
+                        self.assertEqual(b"blob content", view.tobytes())
+                        self.assertEqual(b"", reader.read_blob_asset_view(empty).tobytes())
+                        view.release()
+                    else:
+                        self.assertNotIsInstance(view, memoryview)
+                        self.assertEqual(b"blob content", view.read())
+
+        stream = BytesIO()
+        with DefaultBundleWriter(stream) as writer:
+            blob = writer.write_blob_asset(BytesIO(b"in memory"), "text/plain")
+        stream.seek(0)
+        with DefaultBundleReader(stream) as reader:
+            self.assertEqual(b"in memory", reader.read_blob_asset_view(blob).read())
+
+    def test_summary_index(self):
+        file_name, writer = self.__create_writer(summary_fields=DEFAULT_SUMMARY_FIELDS)
+        with writer, open(SRC_DATA / "test-pcr.json") as pcr_file:
+            pcr_obj = Pcr.parse_raw(pcr_file.read())
+            pcr = writer.write_object_asset(pcr_obj)
+            writer.write_blob_asset(BytesIO(b"report"), "text/plain", pcr, "report")
+        with DefaultBundleWriter(file_name, append=True, summary_fields={"pcr_name": "name"}, max_workers=2) as writer:
+            writer.write_object_asset(pcr_obj)
+
+        with self.__create_reader(file_name) as reader:
+            self.assertTrue(reader.has_summary_index())
+            summaries = list(reader.summaries_iter())
+            self.assertEqual([AssetType.Pcr, AssetType.Pcr], [x.type for x in summaries])
+            self.assertEqual(pcr.ref, summaries[0].ref)
+            self.assertEqual(pcr_obj.name, summaries[0].fields["name"])
+            self.assertEqual({"pcr_name": pcr_obj.name}, summaries[1].fields)
+            self.assertEqual([], list(reader.summaries_iter(AssetType.Epd)))
+            self.assertEqual(1, len(list(reader.summaries_iter(filter=lambda x: "pcr_name" in x.fields))))
+
+        file_name, writer = self.__create_writer()
+        with writer:
+            pass
+        with self.__create_reader(file_name) as reader:
+            self.assertFalse(reader.has_summary_index())
+            with self.assertRaises(ValueError):
+                list(reader.summaries_iter())
+
+    def test_verify_assets(self):
+        file_name, writer = self.__create_writer(compression=zipfile.ZIP_DEFLATED, max_workers=2)
+        with writer, open(SRC_DATA / "test-pcr.json") as pcr_file:
+            pcr_obj = Pcr.parse_raw(pcr_file.read())
+            pcr = writer.write_object_asset(pcr_obj)
+            blob = writer.write_blob_asset(BytesIO(b"blob content"), "text/plain", pcr, "report")
+        self.assertEqual("sha256:" + hashlib.sha256(b"blob content").hexdigest(), blob.content_hash)
+
+        with self.__create_reader(file_name) as reader:
+            self.assertIsNotNone(reader.get_asset_by_ref(pcr.ref).content_hash)
+            self.assertEqual([], reader.verify_assets(max_workers=2))
+            # Hashes of the records are not trusted, the content is always re-hashed
+            tampered = blob.copy(update={"content_hash": "sha256:00", "size": 5})
+            errors = reader.verify_assets([tampered, "blob/missing.bin"])
+            self.assertEqual([blob.ref, "blob/missing.bin"], [x.ref for x in errors])
+            self.assertIn("Size mismatch", errors[0].message)
+
+    def test_search_index(self):
+        file_name, writer = self.__create_writer(search_fields=DEFAULT_SEARCH_FIELDS, max_workers=2)
+        with writer, open(SRC_DATA / "test-pcr.json") as pcr_file:
+            pcr_obj = Pcr.parse_raw(pcr_file.read())
+            pcr = writer.write_object_asset(pcr_obj)
+            writer.write_blob_asset(BytesIO(b"report"), "text/plain", pcr, "report")
+        with DefaultBundleWriter(file_name, append=True, search_fields=DEFAULT_SEARCH_FIELDS) as writer:
+            other = writer.write_object_asset(pcr_obj.copy(update={"name": "Other rules"}))
+
+        with self.__create_reader(file_name) as reader:
+            self.assertTrue(reader.has_search_index())
+            name_term = tokenize(pcr_obj.name)[0]
+            self.assertEqual([pcr.ref], [x.ref for x in reader.search(pcr_obj.name)])
+            self.assertIn(pcr.ref, [x.ref for x in reader.search(name_term[:3], prefix=True)])
+            self.assertEqual([other.ref], [x.ref for x in reader.search("OTHER", asset_type=AssetType.Pcr)])
+            self.assertEqual([], reader.search("other", asset_type=AssetType.Epd))
+
+        file_name, writer = self.__create_writer()
+        with writer:
+            pass
+        with self.__create_reader(file_name) as reader:
+            self.assertFalse(reader.has_search_index())
+            with self.assertRaises(ValueError):
+                reader.search("anything")
+
+    def test_normalize_dependencies(self):
+        with open(SRC_DATA / "test-pcr.json") as pcr_file:
+            pcr_obj = Pcr.parse_raw(pcr_file.read())
+        acme = Org(name="ACME", web_domain="acme.com")
+        plants = [Plant(name="Dalton, GA"), Plant(name="LaGrange, GA")]
+        epds = [
+            EpdWithDeps(name=f"Product {i}", manufacturer=acme.copy(), plants=plants, pcr=pcr_obj) for i in range(3)
+        ]
+        epds.append(EpdWithDeps(name="Other", manufacturer=Org(name="Other")))
+        file_name, writer = self.__create_writer(normalize_dependencies=True, max_workers=2)
+        with writer:
+            refs = [writer.write_object_asset(x).ref for x in epds[:2]]
+        with DefaultBundleWriter(file_name, append=True, normalize_dependencies=True) as writer:
+            refs += [writer.write_object_asset(x).ref for x in epds[2:]]
+
+        with zipfile.ZipFile(file_name) as archive:
+            self.assertNotIn("manufacturer", json.loads(archive.read(refs[0])))
+            # ACME, two plants, PCR and the other org
+            self.assertEqual(
+                5,
+                len(
+                    [x for x in archive.namelist() if x.startswith(("org/", "plant/", "pcr/")) and not x.endswith("/")]
+                ),
+            )
+        with self.__create_reader(file_name) as reader:
+            self.assertEqual(refs, [x.ref for x in reader.root_assets_iter()])
+            # Dependency rows follow their parents, also when objects are serialized in background
+            seen: set[str] = set()
+            for x in reader.assets_iter():
+                if x.rel_asset is not None:
+                    self.assertIn(x.rel_asset, seen)
+                seen.add(x.ref)
+            self.assertIsNone(reader.read_object_asset(EpdWithDeps, refs[0]).manufacturer)
+            # Plants are not mistaken for orgs
+            org_names = set()
+            for x in reader.assets_iter():
+                if x.type == AssetType.Org:
+                    with reader.read_blob_asset(x) as stream:
+                        org_names.add(Org.parse_raw(stream.read()).name)
+            self.assertEqual({"ACME", "Other"}, org_names)
+            plant_refs = [x.ref for x in reader.assets_iter() if x.type == AssetType.Plant]
+            self.assertEqual(6, len(plant_refs))
+            self.assertEqual(
+                {"Dalton, GA", "LaGrange, GA"}, {reader.read_object_asset(Plant, x).name for x in plant_refs}
+            )
+        with DefaultBundleReader(Path(file_name), hydrate_dependencies=True) as reader:
+            hydrated = [reader.read_object_asset(EpdWithDeps, x) for x in refs]
+            self.assertEqual(epds, hydrated)
+            self.assertIs(hydrated[0].manufacturer, hydrated[2].manufacturer)
+            self.assertIs(hydrated[0].pcr, hydrated[1].pcr)
+            self.assertEqual(["Dalton, GA", "LaGrange, GA"], [x.name for x in hydrated[1].plants])
+            many = [x.obj for x in reader.read_object_assets_many(EpdWithDeps, refs, executor=ThreadPoolExecutor(1))]
+            self.assertIs(hydrated[0].manufacturer, many[0].manufacturer)
+        with DefaultBundleReader(Path(file_name), hydrate_dependencies=True) as reader:
+            # Only the recently used dependencies are kept
+            reader._dependency_cache_size = 2
+            hydrated = [reader.read_object_asset(EpdWithDeps, x) for x in refs]
+            self.assertEqual(epds, hydrated)
+            self.assertEqual(2, len(reader._dependency_cache or ()))
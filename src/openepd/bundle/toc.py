@@ -0,0 +1,292 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+import shutil
+import struct
+import tempfile
+from typing import IO, Any
+
+from openepd.bundle.base import BundleMixin
+from openepd.bundle.model import AssetInfo
+
+BINARY_TOC_ENTRY = "toc.bin"
+"""Name of the archive entry holding the binary TOC."""
+
+# The version is the last character of the magic. Version 1 had 32-bit string offsets, limiting the string table to
+# 4 GiB, such binary TOCs are not read and the CSV TOC is used instead.
+_BINARY_TOC_MAGIC = b"OEPDTOC2"
+# magic, CRC32 of the CSV TOC, number of records, number of fields, size of the string table
+_BINARY_TOC_HEADER = struct.Struct("<8sIIIQ")
+# offset in the string table, length of the string
+_STRING_REF = struct.Struct("<QI")
+_NONE_LENGTH = 0xFFFFFFFF
+_NUMERIC_FIELDS = frozenset(("size",))
+# Low cardinality fields, their values are stored once in the string table
+_INTERNED_FIELDS = frozenset(("type", "lang", "rel_type", "content_type", "custom_type"))
+
+
+class TocIndex(BundleMixin):
+    """
+    In-memory index over the table of contents of a bundle.
+
+    The index is built once from the TOC rows and turns the typical lookups (asset by reference, relatives of the
+    asset, assets of a given type) into dictionary lookups instead of re-scanning the TOC.
+    """
+
+    def __init__(self, assets: Iterable[AssetInfo] = ()) -> None:
+        self.__assets: list[AssetInfo] = []
+        self.__by_ref: dict[str, AssetInfo] = {}
+        self.__by_type: dict[str, list[AssetInfo]] = defaultdict(list)
+        self.__roots: list[AssetInfo] = []
+        self.__children: dict[str, list[AssetInfo]] = defaultdict(list)
+        self.__children_by_rel_type: dict[str, dict[str | None, list[AssetInfo]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for x in assets:
+            self.add(x)
+
+    def add(self, asset: AssetInfo) -> None:
+        """Add the asset to the index. Assets are kept in the order they were added."""
+        self.__assets.append(asset)
+        self.__by_ref[asset.ref] = asset
+        self.__by_type[asset.type].append(asset)
+        parent_refs = self.get_rel_asset_list(asset)
+        if not parent_refs:
+            self.__roots.append(asset)
+        # The same parent might be listed twice, the asset must be returned only once though
+        for parent_ref in dict.fromkeys(parent_refs):
+            self.__children[parent_ref].append(asset)
+            self.__children_by_rel_type[parent_ref][asset.rel_type].append(asset)
+
+    @classmethod
+    def get_rel_asset_list(cls, asset_info: AssetInfo) -> list[str]:
+        """Get the list of related asset references from an AssetInfo object."""
+        return cls._get_rel_asset_list(asset_info)
+
+    def __len__(self) -> int:
+        return len(self.__assets)
+
+    def __contains__(self, asset_ref: object) -> bool:
+        return asset_ref in self.__by_ref
+
+    def assets(self) -> Sequence[AssetInfo]:
+        """Return all assets in TOC order."""
+        return self.__assets
+
+    def root_assets(self, asset_type: str | None = None) -> Sequence[AssetInfo]:
+        """Return root assets (assets without relations) in TOC order, optionally of the given type only."""
+        if asset_type is None:
+            return self.__roots
+        return [x for x in self.__by_type.get(asset_type, ()) if x.rel_asset is None]
+
+    def assets_by_type(self, asset_type: str) -> Sequence[AssetInfo]:
+        """Return all assets of the given type in TOC order."""
+        return self.__by_type.get(asset_type, [])
+
+    def get(self, asset_ref: str) -> AssetInfo | None:
+        """Get the asset by its reference or None if not found."""
+        return self.__by_ref.get(asset_ref)
+
+    def relatives_iter(self, asset_ref: str, rel_type: str | Sequence[str] | None = None) -> Iterator[AssetInfo]:
+        """
+        Iterate over assets related to the given one in TOC order.
+
+        :param asset_ref: reference of the parent asset
+        :param rel_type: the type (or types) of the relation. If None, all relations are returned.
+        """
+        if rel_type is None:
+            yield from self.__children.get(asset_ref, ())
+            return
+        by_rel_type = self.__children_by_rel_type.get(asset_ref)
+        if by_rel_type is None:
+            return
+        if isinstance(rel_type, str):
+            yield from by_rel_type.get(rel_type, ())
+            return
+        # Several relation types requested, keep the TOC order across them
+        rel_types = set(rel_type)
+        for x in self.__children.get(asset_ref, ()):
+            if x.rel_type in rel_types:
+                yield x
+
+
+def _record_struct(fields: Sequence[str]) -> struct.Struct:
+    return struct.Struct("<" + "".join("q" if x in _NUMERIC_FIELDS else "QI" for x in fields))
+
+
+class BinaryTocWriter:
+    """
+    Writer of the binary TOC.
+
+    Binary TOC is a compact mirror of the CSV TOC which could be loaded without parsing the CSV. All numbers are
+    little-endian. The layout is:
+
+    * header: magic, CRC32 of the CSV TOC it mirrors, number of records, number of fields, size of the string table;
+    * field names: (offset, length) of every field name in the string table;
+    * records: fixed-width records, (uint64 offset, uint32 length) in the string table for the string fields and int64
+      for the numeric ones. None is encoded as length 0xFFFFFFFF or -1 correspondingly;
+    * string table: UTF-8 encoded strings.
+
+    Unlike the CSV TOC, None and empty string are distinguished, so empty values of the nullable fields are written as
+    None and rows could be used as is.
+
+    Records and strings are spooled to temporary files, so memory consumption doesn't depend on the TOC size.
+    """
+
+    SPOOL_MAX_SIZE: int = 16 * 1024 * 1024
+
+    def __init__(self, fields: Sequence[str] = BundleMixin._TOC_FIELDS) -> None:
+        self.__fields = tuple(fields)
+        self.__record = _record_struct(self.__fields)
+        # Buffers live as long as the writer and are closed by `close`
+        self.__records = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE)  # noqa: SIM115
+        self.__strings = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE)  # noqa: SIM115
+        self.__strings_size = 0
+        self.__count = 0
+        self.__interned: dict[str, tuple[int, int]] = {}
+        self.__field_refs = [self.__add_string(x) for x in self.__fields]
+        self.__nullable_fields = frozenset(BundleMixin._TOC_NULLABLE_FIELDS)
+
+    def __enter__(self) -> "BinaryTocWriter":
+        return self
+
+    def __exit__(self, type, value, traceback):  # noqa: A002
+        self.close()
+
+    def __add_string(self, value: str) -> tuple[int, int]:
+        data = value.encode("utf-8")
+        if len(data) >= _NONE_LENGTH:
+            msg = "TOC value is too long for the binary TOC"
+            raise ValueError(msg)
+        offset = self.__strings_size
+        self.__strings.write(data)
+        self.__strings_size += len(data)
+        return offset, len(data)
+
+    def add(self, row: Mapping[str, Any]) -> None:
+        """Add TOC row. Row is a mapping as produced by csv.DictReader for the CSV TOC."""
+        values: list[int] = []
+        for field in self.__fields:
+            value = row.get(field)
+            if field in _NUMERIC_FIELDS:
+                values.append(-1 if value is None or value == "" else int(value))
+            elif value is None or (value == "" and field in self.__nullable_fields):
+                values.extend((0, _NONE_LENGTH))
+            elif field in _INTERNED_FIELDS:
+                ref = self.__interned.get(value)
+                if ref is None:
+                    ref = self.__interned[value] = self.__add_string(str(value))
+                values.extend(ref)
+            else:
+                values.extend(self.__add_string(str(value)))
+        self.__records.write(self.__record.pack(*values))
+        self.__count += 1
+
+    def write_to(self, stream: IO[bytes], toc_crc: int) -> None:
+        """
+        Write the binary TOC to the given stream.
+
+        :param stream: target stream
+        :param toc_crc: CRC32 of the CSV TOC, used by readers to check that binary TOC is up-to-date
+        """
+        stream.write(
+            _BINARY_TOC_HEADER.pack(_BINARY_TOC_MAGIC, toc_crc, self.__count, len(self.__fields), self.__strings_size)
+        )
+        for x in self.__field_refs:
+            stream.write(_STRING_REF.pack(*x))
+        for buffer in (self.__records, self.__strings):
+            buffer.seek(0)
+            shutil.copyfileobj(buffer, stream)  # type: ignore[misc]
+            buffer.seek(0, 2)
+
+    def close(self) -> None:
+        """Release temporary buffers."""
+        self.__records.close()
+        self.__strings.close()
+
+
+class BinaryTocReader:
+    """Reader of the binary TOC, see BinaryTocWriter for the format description."""
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Construct the reader.
+
+        :param data: the whole content of the binary TOC
+        :raise ValueError: if data is not a valid binary TOC
+        """
+        if len(data) < _BINARY_TOC_HEADER.size:
+            msg = "Binary TOC is too short"
+            raise ValueError(msg)
+        magic, self.toc_crc, self.__count, fields_count, strings_size = _BINARY_TOC_HEADER.unpack_from(data)
+        if magic != _BINARY_TOC_MAGIC:
+            msg = "Unsupported binary TOC format"
+            raise ValueError(msg)
+        self.__data = memoryview(data)
+        fields_offset = _BINARY_TOC_HEADER.size
+        self.__records_offset = fields_offset + fields_count * _STRING_REF.size
+        self.__strings_offset = len(data) - strings_size
+        field_refs = [_STRING_REF.unpack_from(data, fields_offset + i * _STRING_REF.size) for i in range(fields_count)]
+        self.fields: tuple[str, ...] = tuple(self.__get_string(*x) for x in field_refs)
+        self.__record = _record_struct(self.fields)
+        if self.__records_offset + self.__count * self.__record.size != self.__strings_offset:
+            msg = "Binary TOC is corrupted: unexpected size"
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __get_string(self, offset: int, length: int) -> str:
+        start = self.__strings_offset + offset
+        return str(self.__data[start : start + length], "utf-8")
+
+    def rows_iter(self, fields: Collection[str] | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over TOC rows.
+
+        :param fields: fields to include into rows, all by default
+        """
+        interned: dict[int, str] = {}
+        # Pairs of (field name, index of the first value in the record, kind of the field)
+        layout: list[tuple[str, int, int]] = []
+        pos = 0
+        for field in self.fields:
+            if field in _NUMERIC_FIELDS:
+                kind, width = 0, 1
+            else:
+                kind, width = (2 if field in _INTERNED_FIELDS else 1), 2
+            if fields is None or field in fields:
+                layout.append((field, pos, kind))
+            pos += width
+        records = self.__data[self.__records_offset : self.__strings_offset]
+        for values in self.__record.iter_unpack(records):
+            row: dict[str, Any] = {}
+            for field, i, kind in layout:
+                if kind == 0:
+                    row[field] = None if values[i] < 0 else values[i]
+                    continue
+                offset, length = values[i], values[i + 1]
+                if length == _NONE_LENGTH:
+                    row[field] = None
+                elif kind == 2:
+                    value = interned.get(offset)
+                    if value is None:
+                        value = interned[offset] = self.__get_string(offset, length)
+                    row[field] = value
+                else:
+                    row[field] = self.__get_string(offset, length)
+            yield row
@@ -13,38 +13,129 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+import abc
+from collections import deque
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager
 import csv
-from io import BytesIO, StringIO
+import io
 from os import PathLike
 from pathlib import Path
-import shutil
-from typing import IO
+import tempfile
+from typing import IO, Any
 import zipfile
+import zlib
 
 from openepd.__version__ import VERSION
-from openepd.bundle.base import AssetRef, BaseBundleWriter
+from openepd.bundle.base import AssetRef, BaseBundleWriter, DependencyField, get_dependency_fields
 from openepd.bundle.model import AssetInfo, AssetType, BundleManifest, BundleManifestAssetsStats
-from openepd.model.base import TOpenEpdObject
+from openepd.bundle.search import SEARCH_INDEX_ENTRY, SearchIndexBuilder
+from openepd.bundle.summary import SUMMARY_ENTRY, SummaryFieldPath, extract_summary, summary_row_to_json
+from openepd.bundle.toc import BINARY_TOC_ENTRY, BinaryTocWriter
+from openepd.bundle.ziputils import CompressedData, compress_data, remove_entries, write_compressed_entry
+from openepd.model.base import BaseOpenEpdSchema, TOpenEpdObject
 
 
-class DefaultBundleWriter(BaseBundleWriter):
-    """Default bundle writer implementation. Writes the bundle to a ZIP file."""
+class BaseTocBundleWriter(BaseBundleWriter, metaclass=abc.ABCMeta):
+    """
+    Base class for writers of bundles consisting of the manifest, the TOC and the asset entries.
 
-    def __init__(self, bundle_file: str | PathLike | IO[bytes], comment: str | None = None):
-        if isinstance(bundle_file, PathLike | str) and Path(bundle_file).exists():
-            msg = "Amending existing files is not supported yet."
-            raise ValueError(msg)
-        self._bundle_archive = zipfile.ZipFile(bundle_file, mode="w")
+    Subclasses define how the entries are stored and must call the constructor of this class once the storage is
+    opened. See DefaultBundleWriter for the description of the options.
+    """
+
+    _METADATA_ENTRIES: tuple[str, ...] = ("manifest", "toc", BINARY_TOC_ENTRY, SUMMARY_ENTRY, SEARCH_INDEX_ENTRY)
+    """Entries holding the bundle metadata, they are rewritten on every commit."""
+
+    TOC_SPOOL_MAX_SIZE: int = 16 * 1024 * 1024
+    """The size of the TOC (in bytes) after which it is moved from memory to a temporary file."""
+    COPY_BUFFER_SIZE: int = 64 * 1024
+    BLOB_SPOOL_MAX_SIZE: int = 16 * 1024 * 1024
+    """The size of a non-seekable blob (in bytes) after which it is buffered in a temporary file for deduplication."""
+
+    _compression: int = zipfile.ZIP_STORED
+    _compresslevel: int | None = None
+
+    def __init__(
+        self,
+        comment: str | None = None,
+        compact_json: bool = False,
+        max_workers: int | None = None,
+        append: bool = False,
+        binary_toc: bool = False,
+        deduplicate_blobs: bool = False,
+        summary_fields: Mapping[str, SummaryFieldPath] | None = None,
+        search_fields: Mapping[str, SummaryFieldPath] | None = None,
+        normalize_dependencies: bool = False,
+    ):
+        self._compact_json = compact_json
+        self._normalize_dependencies = normalize_dependencies
+        self._binary_toc = binary_toc
+        self._deduplicate_blobs = deduplicate_blobs
         self.__manifest = BundleManifest(
             format="openEPD Bundle/1.0",
             generator=f"openEPD Python SDK/{VERSION}",
             comment=comment,
             assets=BundleManifestAssetsStats(),
         )
-        self.__added_entries: set[str] = set()
-        self.__toc_buffer = StringIO()
+        self.__type_counters: dict[str, int] = {}
+        self.__type_dirs: set[str] = set()
+        self.__blob_locations: dict[str, str] = {}
+        self.__dependency_locations: dict[str, str] = {}
+        # Refs of all the TOC rows, including the ones pointing to the content stored under another ref
+        self.__refs: set[str] = set()
+        # Buffers live as long as the writer and are closed by `close`
+        self.__toc_buffer = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=self.TOC_SPOOL_MAX_SIZE, mode="w+", encoding="utf-8", newline=""
+        )
         self._toc_writer = csv.DictWriter(self.__toc_buffer, fieldnames=self._TOC_FIELDS, dialect="toc")
         self._toc_writer.writeheader()
+        self._summary_fields = summary_fields
+        self.__summary_buffer: IO[str] | None = None
+        if summary_fields is not None:
+            self.__summary_buffer = tempfile.SpooledTemporaryFile(  # type: ignore[assignment]  # noqa: SIM115
+                max_size=self.TOC_SPOOL_MAX_SIZE, mode="w+", encoding="utf-8", newline=""
+            )
+        self.__search_index = SearchIndexBuilder(search_fields) if search_fields is not None else None
+        if append and self._entry_exists("manifest"):
+            self.__load_existing_bundle(comment)
+        self.__executor: ThreadPoolExecutor | None = ThreadPoolExecutor(max_workers) if max_workers else None
+        self.__max_pending = 4 * (max_workers or 0)
+        # Dependencies of pending objects are written right after them, so the TOC rows follow their parents
+        self.__pending: deque[
+            tuple[AssetInfo, Future[tuple[CompressedData, str]], list[tuple[DependencyField, BaseOpenEpdSchema]]]
+        ] = deque()
+        self.__metadata_written = False
+        self.__committed = False
+
+    @abc.abstractmethod
+    def _entry_exists(self, name: str) -> bool:
+        """Check if the bundle contains the entry with the given name."""
+
+    @abc.abstractmethod
+    def _open_entry(self, name: str) -> IO[bytes]:
+        """Open the existing entry for reading."""
+
+    @abc.abstractmethod
+    def _open_entry_for_write(self, name: str) -> AbstractContextManager[IO[bytes]]:
+        """Open the new entry for writing."""
+
+    @abc.abstractmethod
+    def _write_compressed_entry(self, name: str, entry: CompressedData):
+        """Write the entry prepared by `compress_data` with the compression settings of the writer."""
+
+    @abc.abstractmethod
+    def _create_dir(self, name: str):
+        """Create the directory for the assets, it is called once per asset type."""
+
+    @abc.abstractmethod
+    def _remove_entries(self, names: Sequence[str]):
+        """Remove the existing entries, non-existing ones are ignored."""
+
+    @abc.abstractmethod
+    def _close_storage(self):
+        """Close the underlying storage after the final commit."""
 
     def write_blob_asset(
         self,
@@ -64,9 +155,11 @@ class DefaultBundleWriter(BaseBundleWriter):
         rel_ref_converted = self._asset_refs_to_str(rel_asset)
         rel_ref_serialized = self._serialize_rel_asset_for_csv(rel_ref_converted)
 
+        self.__flush_pending()
         ref_str = self.__generate_entry_name(
             AssetType.Blob, self.__get_ext_for_content_type(content_type, "bin"), file_name
         )
+        self.__reserve_ref(ref_str)
         asset_info = AssetInfo(
             ref=ref_str,
             name=name,
@@ -79,7 +172,10 @@ class DefaultBundleWriter(BaseBundleWriter):
             custom_type=custom_type,
             custom_data=custom_data,
         )
-        self.__write_data_stream(asset_info, data)
+        if self._deduplicate_blobs:
+            self.__write_deduplicated_blob(asset_info, data)
+        else:
+            self.__write_data_stream(asset_info, data)
         self.__register_entry(asset_info)
         return asset_info
 
@@ -106,9 +202,12 @@ class DefaultBundleWriter(BaseBundleWriter):
         rel_ref_converted = self._asset_refs_to_str(rel_asset)
         rel_ref_serialized = self._serialize_rel_asset_for_csv(rel_ref_converted)
 
+        dependencies = self.__get_dependencies(obj) if self._normalize_dependencies else []
+        exclude = {x.field_name for x, _ in dependencies}
         ref_str = self.__generate_entry_name(
             asset_type, self.__get_ext_for_content_type("application/json", "json"), file_name
         )
+        self.__reserve_ref(ref_str)
         asset_info = AssetInfo(
             ref=ref_str,
             name=name,
@@ -121,31 +220,190 @@ class DefaultBundleWriter(BaseBundleWriter):
             custom_type=custom_type,
             custom_data=custom_data,
         )
-        self.__write_data_stream(
-            asset_info,
-            BytesIO(obj.json(indent=2, exclude_unset=True, exclude_none=True, by_alias=True).encode("utf-8")),
+        if self.__executor is None:
+            self.__write_data_stream(asset_info, io.BytesIO(self.__serialize_object(obj, exclude)))
+            self.__register_entry(asset_info)
+            self.__write_dependencies(asset_info.ref, dependencies)
+        else:
+            self.__pending.append(
+                (
+                    asset_info,
+                    self.__executor.submit(self.__serialize_and_compress_object, obj, exclude),
+                    dependencies,
+                )
+            )
+        if self.__summary_buffer is not None and self._summary_fields is not None:
+            self.__summary_buffer.write(
+                summary_row_to_json(asset_info.ref, asset_type, extract_summary(obj, self._summary_fields))
+            )
+        if self.__search_index is not None:
+            self.__search_index.add(asset_info.ref, asset_type, obj)
+        while len(self.__pending) > self.__max_pending:
+            self.__write_next_pending()
+        return asset_info
+
+    def copy_asset(self, asset: AssetInfo, data: IO[bytes]) -> AssetInfo:
+        """
+        Write the asset read from another bundle, keeping its reference and metadata.
+
+        The content is copied as is, without parsing, so copied objects are not added to the summary and search indexes.
+        """
+        self.__flush_pending()
+        self.__reserve_ref(asset.ref)
+        asset_info = AssetInfo(
+            ref=asset.ref,
+            name=asset.name,
+            type=asset.type,
+            lang=asset.lang,
+            rel_type=asset.rel_type,
+            rel_asset=asset.rel_asset,
+            content_type=asset.content_type,
+            comment=asset.comment,
+            custom_type=asset.custom_type,
+            custom_data=asset.custom_data,
         )
+        if self._deduplicate_blobs and asset_info.type == AssetType.Blob:
+            self.__write_deduplicated_blob(asset_info, data)
+        else:
+            self.__write_data_stream(asset_info, data)
         self.__register_entry(asset_info)
         return asset_info
 
     def commit(self):
-        """Write the manifest and TOC to the bundle. This will be called automatically when the bundle is closed."""
-        with self._bundle_archive.open("manifest", "w") as manifest_stream:
+        """
+        Write the manifest and TOC to the bundle. This will be called automatically when the bundle is closed.
+
+        Commit does nothing if no assets were added since the previous one, otherwise the metadata written by the
+        previous commit is replaced.
+        """
+        self.__flush_pending()
+        if self.__committed:
+            return
+        if self.__metadata_written:
+            self._remove_entries(self._METADATA_ENTRIES)
+        with self._open_entry_for_write("manifest") as manifest_stream:
             manifest_stream.write(self.__manifest.json(indent=2, exclude_none=True).encode("utf-8"))
-        with self._bundle_archive.open("toc", "w") as toc_stream:
-            toc_stream.write(self.__toc_buffer.getvalue().encode("utf-8"))
+        toc_crc = 0
+        with self._open_entry_for_write("toc") as toc_stream:
+            self.__toc_buffer.seek(0)
+            while chunk := self.__toc_buffer.read(self.COPY_BUFFER_SIZE):
+                encoded = chunk.encode("utf-8")
+                toc_crc = zlib.crc32(encoded, toc_crc)
+                toc_stream.write(encoded)
+            # Keep the buffer ready for more entries
+            self.__toc_buffer.seek(0, io.SEEK_END)
+        if self._binary_toc:
+            self.__write_binary_toc(toc_crc)
+        if self.__summary_buffer is not None:
+            self.__copy_text_buffer(self.__summary_buffer, SUMMARY_ENTRY)
+        if self.__search_index is not None:
+            with self._open_entry_for_write(SEARCH_INDEX_ENTRY) as search_index_stream:
+                search_index_stream.write(self.__search_index.to_json())
+        self.__metadata_written = True
+        self.__committed = True
 
     def close(self):
         """Write the manifest and TOC and close the bundle stream."""
-        self.commit()
-        self._bundle_archive.close()
+        try:
+            self.commit()
+            self._close_storage()
+        finally:
+            self.__toc_buffer.close()
+            if self.__summary_buffer is not None:
+                self.__summary_buffer.close()
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True, cancel_futures=True)
 
-    def __register_entry(self, asset_info: AssetInfo):
-        if asset_info.ref in self.__added_entries:
-            msg = f"Asset {asset_info.ref} already exists in the bundle."
+    def __copy_text_buffer(self, buffer: IO[str], entry_name: str):
+        with self._open_entry_for_write(entry_name) as stream:
+            buffer.seek(0)
+            while chunk := buffer.read(self.COPY_BUFFER_SIZE):
+                stream.write(chunk.encode("utf-8"))
+            # Keep the buffer ready for more entries
+            buffer.seek(0, io.SEEK_END)
+
+    def __write_binary_toc(self, toc_crc: int):
+        # Built from the CSV TOC rather than from the written assets, so the rows copied on append are included too
+        with BinaryTocWriter(self._TOC_FIELDS) as binary_toc:
+            self.__toc_buffer.seek(0)
+            for row in csv.DictReader(self.__toc_buffer, dialect="toc"):
+                binary_toc.add(row)
+            self.__toc_buffer.seek(0, io.SEEK_END)
+            with self._open_entry_for_write(BINARY_TOC_ENTRY) as binary_toc_stream:
+                binary_toc.write_to(binary_toc_stream, toc_crc)
+
+    def __load_existing_bundle(self, comment: str | None):
+        try:
+            with self._open_entry("manifest") as manifest_stream:
+                existing_manifest = BundleManifest.parse_raw(manifest_stream.read())
+        except Exception as e:
+            raise ValueError("The bundle file is not valid. Manifest reading error: " + str(e)) from e
+        self.__manifest.assets = existing_manifest.assets
+        self.__manifest.created_at = existing_manifest.created_at
+        self.__manifest.comment = comment if comment is not None else existing_manifest.comment
+        self.__type_counters = dict(existing_manifest.assets.count_by_type)
+        dependency_rels = {x.rel_type for x in get_dependency_fields()}
+        # Existing rows are copied as is, fields unknown to this version are dropped
+        toc_copier = csv.DictWriter(
+            self.__toc_buffer, fieldnames=self._TOC_FIELDS, dialect="toc", extrasaction="ignore"
+        )
+        with self._open_entry("toc") as toc_stream:
+            for row in csv.DictReader(io.TextIOWrapper(toc_stream, encoding="utf-8"), dialect="toc"):
+                self.__refs.add(row["ref"])
+                if self._deduplicate_blobs and row.get("content_hash") and row["type"] == AssetType.Blob:
+                    self.__blob_locations.setdefault(row["content_hash"], row.get("location") or row["ref"])
+                if self._normalize_dependencies and row.get("content_hash") and row.get("rel_type") in dependency_rels:
+                    self.__dependency_locations.setdefault(row["content_hash"], row.get("location") or row["ref"])
+                # Unquoted (numeric) values are parsed as floats, keep integers as they were
+                toc_copier.writerow(
+                    {k: int(v) if isinstance(v, float) and v.is_integer() else v for k, v in row.items()}
+                )
+        if self.__summary_buffer is not None and self._entry_exists(SUMMARY_ENTRY):
+            with self._open_entry(SUMMARY_ENTRY) as summary_stream:
+                for line in io.TextIOWrapper(summary_stream, encoding="utf-8"):
+                    self.__summary_buffer.write(line)
+        if self.__search_index is not None and self._entry_exists(SEARCH_INDEX_ENTRY):
+            with self._open_entry(SEARCH_INDEX_ENTRY) as search_index_stream:
+                self.__search_index.load(search_index_stream.read())
+        self._remove_entries(self._METADATA_ENTRIES)
+
+    def __serialize_object(self, obj: BaseOpenEpdSchema, exclude: set[str] | None = None) -> bytes:
+        dumps_kwargs: dict[str, Any] = {"separators": (",", ":")} if self._compact_json else {"indent": 2}
+        return obj.json(
+            exclude=exclude or None, exclude_unset=True, exclude_none=True, by_alias=True, **dumps_kwargs
+        ).encode("utf-8")
+
+    def __serialize_and_compress_object(
+        self, obj: BaseOpenEpdSchema, exclude: set[str] | None = None
+    ) -> tuple[CompressedData, str]:
+        data = self.__serialize_object(obj, exclude)
+        return compress_data(data, self._compression, self._compresslevel), self._hash_bytes(data)
+
+    def __write_next_pending(self):
+        asset_info, future, dependencies = self.__pending.popleft()
+        # Errors happened in background are propagated to the caller here
+        compressed, content_hash = future.result()
+        self.__mkdir_for_type(asset_info.type)
+        self._write_compressed_entry(asset_info.ref, compressed)
+        asset_info.size = compressed.file_size
+        asset_info.content_hash = content_hash
+        self.__register_entry(asset_info)
+        self.__write_dependencies(asset_info.ref, dependencies)
+
+    def __flush_pending(self):
+        while self.__pending:
+            self.__write_next_pending()
+
+    def __reserve_ref(self, ref: str):
+        # Refs are reserved before the content is written, so the pending and deduplicated assets are accounted too
+        if ref in self.__refs:
+            msg = f"Asset {ref} already exists in the bundle."
             raise ValueError(msg)
+        self.__refs.add(ref)
+
+    def __register_entry(self, asset_info: AssetInfo):
+        self.__committed = False
         self._toc_writer.writerow(asset_info.dict(exclude_unset=True, exclude_none=True))
-        self.__added_entries.add(asset_info.ref)
         type_counter = self.__manifest.assets.count_by_type.get(asset_info.type, 0) + 1
         self.__manifest.assets.count_by_type[asset_info.type] = type_counter
         self.__manifest.assets.total_count += 1
@@ -155,30 +413,96 @@ class DefaultBundleWriter(BaseBundleWriter):
         self.__manifest.assets.total_size += asset_info.size
 
     def __generate_entry_name(self, asset_type: str, extension: str | None = None, file_name: str | None = None) -> str:
-        current_counter = self.__manifest.assets.count_by_type.get(asset_type, 0)
-        current_counter += 1
+        # Counters are tracked separately from the manifest, since some assets might still be in progress
+        current_counter = self.__type_counters.get(asset_type, 0) + 1
+        self.__type_counters[asset_type] = current_counter
         if file_name is None:
             extension = extension or "bin"
-            return f"{asset_type}/{str(current_counter).rjust(6, '0')}.{extension}"
+            name = f"{asset_type}/{str(current_counter).rjust(6, '0')}.{extension}"
+            # Amended bundles might already have an entry with the same name, e.g. if custom names were used
+            while name in self.__refs:
+                current_counter += 1
+                self.__type_counters[asset_type] = current_counter
+                name = f"{asset_type}/{str(current_counter).rjust(6, '0')}.{extension}"
+            return name
         else:
             return f"{asset_type}/{file_name}"
 
     def __mkdir_for_type(self, asset_type: str):
-        try:
-            info = self._bundle_archive.getinfo(f"{asset_type}/")
-            if info.is_dir():
-                return
-            msg = f"Object with name {asset_type} already exists in the bundle."
-            raise ValueError(msg)
-        except KeyError:
-            self._bundle_archive.mkdir(str(asset_type))
+        if asset_type in self.__type_dirs:
+            return
+        self._create_dir(str(asset_type))
+        self.__type_dirs.add(asset_type)
 
     def __write_data_stream(self, asset_info: AssetInfo, data: IO[bytes]):
         self.__mkdir_for_type(asset_info.type)
-        with self._bundle_archive.open(asset_info.ref, "w") as asset_stream:
-            shutil.copyfileobj(data, asset_stream, 1024 * 8)  # type: ignore
-        added_obj = self._bundle_archive.getinfo(asset_info.ref)
-        asset_info.size = added_obj.file_size
+        with self._open_entry_for_write(asset_info.ref) as asset_stream:
+            # The content is hashed on the fly, so it is read only once
+            asset_info.content_hash, asset_info.size = self._hash_stream(
+                data, asset_stream, buffer_size=self.COPY_BUFFER_SIZE
+            )
+
+    def __write_deduplicated_blob(self, asset_info: AssetInfo, data: IO[bytes]):
+        if data.seekable():
+            start = data.tell()
+            content_hash, size = self._hash_stream(data, buffer_size=self.COPY_BUFFER_SIZE)
+            data.seek(start)
+            self.__write_blob_content(asset_info, data, content_hash, size)
+        else:
+            # The hash must be known before the content is written, so non-seekable streams are buffered
+            with tempfile.SpooledTemporaryFile(max_size=self.BLOB_SPOOL_MAX_SIZE) as spool:
+                content_hash, size = self._hash_stream(data, spool, buffer_size=self.COPY_BUFFER_SIZE)
+                spool.seek(0)
+                self.__write_blob_content(asset_info, spool, content_hash, size)  # type: ignore[arg-type]
+
+    def __write_blob_content(self, asset_info: AssetInfo, data: IO[bytes], content_hash: str, size: int):
+        self.__write_content_once(asset_info, data, content_hash, size, self.__blob_locations)
+
+    def __write_content_once(
+        self, asset_info: AssetInfo, data: IO[bytes], content_hash: str, size: int, locations: dict[str, str]
+    ):
+        location = locations.get(content_hash)
+        if location is None:
+            self.__write_data_stream(asset_info, data)
+            locations[content_hash] = asset_info.ref
+        else:
+            asset_info.location = location
+            asset_info.size = size
+        asset_info.content_hash = content_hash
+
+    def __get_dependencies(self, obj: BaseOpenEpdSchema) -> list[tuple[DependencyField, BaseOpenEpdSchema]]:
+        dependencies: list[tuple[DependencyField, BaseOpenEpdSchema]] = []
+        for dependency_field in get_dependency_fields():
+            if dependency_field.field_name not in obj.__fields__:
+                continue
+            value = getattr(obj, dependency_field.field_name)
+            items = value if isinstance(value, list) else [value]
+            # Fields are either normalized completely or kept in the object as is
+            if items and all(isinstance(x, dependency_field.model) for x in items):
+                dependencies.extend((dependency_field, x) for x in items)
+        return dependencies
+
+    def __write_dependencies(self, parent_ref: str, dependencies: list[tuple[DependencyField, BaseOpenEpdSchema]]):
+        for dependency_field, dependency in dependencies:
+            self.__write_dependency(dependency, parent_ref, dependency_field)
+
+    def __write_dependency(self, dependency: BaseOpenEpdSchema, parent_ref: str, dependency_field: DependencyField):
+        data = self.__serialize_object(dependency)
+        ref = self.__generate_entry_name(dependency_field.asset_type, "json")
+        self.__reserve_ref(ref)
+        asset_info = AssetInfo(
+            ref=ref,
+            type=dependency_field.asset_type,
+            lang=None,
+            rel_asset=parent_ref,
+            rel_type=dependency_field.rel_type,
+            content_type="application/json",
+        )
+        # Every object gets its own TOC row, while the content of the same dependency is stored once
+        self.__write_content_once(
+            asset_info, io.BytesIO(data), self._hash_bytes(data), len(data), self.__dependency_locations
+        )
+        self.__register_entry(asset_info)
 
     def __get_ext_for_content_type(self, content_type: str | None, default: str = "bin") -> str:
         if content_type is not None:
@@ -209,3 +533,133 @@ class DefaultBundleWriter(BaseBundleWriter):
             case "image/bmp":
                 return "bmp"
         return default
+
+
+class DefaultBundleWriter(BaseTocBundleWriter):
+    """
+    Default bundle writer implementation. Writes the bundle to a ZIP file.
+
+    By default, assets are stored without compression and objects are pretty-printed. Use `compression`,
+    `compresslevel` and `compact_json` to produce smaller bundles. With `max_workers` set, objects are serialized and
+    compressed by a pool of background threads while the caller keeps producing them; the archive itself is written
+    by the calling thread only, in the same order assets were added.
+
+    The TOC is spilled to a temporary file once it grows over `TOC_SPOOL_MAX_SIZE` and copied into the archive on
+    commit, so the TOC text doesn't take memory for large bundles. The per-asset state still kept in memory is the set
+    of refs, used to reject duplicate refs, and the central directory of the ZIP archive itself.
+
+    With `append=True` an existing bundle is amended in place: existing assets are kept as is, new ones are added
+    after them, and only the bundle metadata (manifest and TOC) is rewritten. So the cost of the update depends on the
+    number of added assets rather than on the size of the bundle.
+
+    With `binary_toc=True` a binary copy of the TOC is written along with the CSV one. Readers load it without
+    parsing, which makes opening of large bundles much faster. The CSV TOC is always written and remains the source of
+    truth.
+
+    With `deduplicate_blobs=True` the content of blobs is hashed, and blobs identical to the already written ones are
+    not stored again: their TOC rows point to the existing entry via `location` instead. Hashes of the written blobs
+    are kept in memory for the lifetime of the writer.
+
+    With `summary_fields` given, a summary index with the preview fields of every object asset is written, so the
+    bundle content could be listed without parsing the objects (see `BaseTocBundleReader.summaries_iter`).
+
+    With `search_fields` given, a full-text search index over these fields of every object asset is written, so
+    objects could be found by keywords without parsing them (see `BaseTocBundleReader.search`). The index is built in
+    memory and written on commit.
+
+    With `normalize_dependencies=True` the organizations, plants and PCR embedded into objects (e.g. the manufacturer
+    of EpdWithDeps) are written as separate assets related to the object, and every distinct dependency is stored only
+    once. Use `hydrate_dependencies=True` of the reader to restore them.
+    """
+
+    def __init__(
+        self,
+        bundle_file: str | PathLike | IO[bytes],
+        comment: str | None = None,
+        compression: int = zipfile.ZIP_STORED,
+        compresslevel: int | None = None,
+        compact_json: bool = False,
+        max_workers: int | None = None,
+        append: bool = False,
+        binary_toc: bool = False,
+        deduplicate_blobs: bool = False,
+        summary_fields: Mapping[str, SummaryFieldPath] | None = None,
+        search_fields: Mapping[str, SummaryFieldPath] | None = None,
+        normalize_dependencies: bool = False,
+    ):
+        """
+        Construct the writer.
+
+        :param bundle_file: path or a file-like object to write bundle to
+        :param comment: optional comment to put into the manifest. When appending, the existing comment is kept if
+            None is given
+        :param compression: ZIP compression method (e.g. zipfile.ZIP_DEFLATED), assets are stored uncompressed by
+            default
+        :param compresslevel: compression level, see zipfile.ZipFile for allowed values
+        :param compact_json: if True, objects are serialized without indentation and extra whitespaces
+        :param max_workers: number of background threads serializing and compressing objects. If None or 0, this is
+            done in the calling thread. Objects must not be modified after they were passed to the writer.
+        :param append: if True, the existing bundle is amended instead of creating a new one. Given file-like object
+            must be readable and seekable in this case. If the bundle doesn't exist, a new one is created.
+        :param binary_toc: if True, the binary TOC is written in addition to the CSV one
+        :param deduplicate_blobs: if True, blobs with the same content are stored in the bundle only once. Such bundles
+            could be read by the readers supporting `location` field of the TOC only.
+        :param summary_fields: if given, the summary index is written with these preview fields of every object
+            asset, e.g. openepd.bundle.summary.DEFAULT_SUMMARY_FIELDS. Rows of the existing summary index are kept
+            when appending.
+        :param search_fields: if given, the search index is written over these text fields of every object asset,
+            e.g. openepd.bundle.search.DEFAULT_SEARCH_FIELDS. Documents of the existing search index are kept when
+            appending.
+        :param normalize_dependencies: if True, organizations, plants and PCR embedded into objects are written as
+            separate assets with one stored copy per distinct object
+        """
+        if not append and isinstance(bundle_file, PathLike | str) and Path(bundle_file).exists():
+            msg = "Bundle file already exists. Use append mode to amend it."
+            raise ValueError(msg)
+        self._bundle_archive = zipfile.ZipFile(
+            bundle_file, mode="a" if append else "w", compression=compression, compresslevel=compresslevel
+        )
+        self._compression = compression
+        self._compresslevel = compresslevel
+        try:
+            super().__init__(
+                comment=comment,
+                compact_json=compact_json,
+                max_workers=max_workers,
+                append=append,
+                binary_toc=binary_toc,
+                deduplicate_blobs=deduplicate_blobs,
+                summary_fields=summary_fields,
+                search_fields=search_fields,
+                normalize_dependencies=normalize_dependencies,
+            )
+        except BaseException:
+            self._bundle_archive.close()
+            raise
+
+    def _entry_exists(self, name: str) -> bool:
+        return name in self._bundle_archive.NameToInfo
+
+    def _open_entry(self, name: str) -> IO[bytes]:
+        return self._bundle_archive.open(name, "r")
+
+    def _open_entry_for_write(self, name: str) -> IO[bytes]:
+        return self._bundle_archive.open(name, "w")
+
+    def _write_compressed_entry(self, name: str, entry: CompressedData):
+        write_compressed_entry(self._bundle_archive, name, entry)
+
+    def _create_dir(self, name: str):
+        try:
+            info = self._bundle_archive.getinfo(f"{name}/")
+            if not info.is_dir():
+                msg = f"Object with name {name} already exists in the bundle."
+                raise ValueError(msg)
+        except KeyError:
+            self._bundle_archive.mkdir(name)
+
+    def _remove_entries(self, names: Sequence[str]):
+        remove_entries(self._bundle_archive, names)
+
+    def _close_storage(self):
+        self._bundle_archive.close()
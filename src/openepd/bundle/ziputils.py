@@ -0,0 +1,219 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Low level helpers for ZIP archives which are not covered by the public API of zipfile module.
+
+Some of them update the archive in place relying on the internals of zipfile.ZipFile (the same ones
+zipfile.ZipFile.writestr uses). The internals are checked on every call: when they are missing (e.g. on a Python version
+the package is not tested with), precompressed entries are written via the public API and removal of the entries is
+refused instead of corrupting the archive. The supported Python versions are tested in CI.
+"""
+
+import bz2
+from collections.abc import Collection
+import mmap
+import struct
+import time
+from typing import NamedTuple
+import zipfile
+import zlib
+
+__all__ = (
+    "CompressedData",
+    "compress_data",
+    "decompress_data",
+    "remove_entries",
+    "stored_entry_data_offset",
+    "supports_in_place_update",
+    "write_compressed_entry",
+)
+
+# Local file header, the same as zipfile.structFileHeader
+_LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_FILE_HEADER_MAGIC = b"PK\x03\x04"
+# Internals of zipfile.ZipFile the in-place updates rely on
+_ZIPFILE_INTERNALS = ("_lock", "_writing", "_seekable", "_didModify", "_writecheck", "start_dir")
+
+
+class CompressedData(NamedTuple):
+    """Data compressed in advance, ready to be written into ZIP archive as is."""
+
+    data: bytes
+    """Compressed bytes."""
+    compress_type: int
+    """Compression method the data was compressed with."""
+    file_size: int
+    """Size of the uncompressed data."""
+    crc: int
+    """CRC32 of the uncompressed data."""
+
+
+def compress_data(data: bytes, compress_type: int, compresslevel: int | None = None) -> CompressedData:
+    """
+    Compress data the same way zipfile.ZipFile does it.
+
+    This function is thread safe and releases GIL while compressing, so it can be run in a background thread.
+
+    :param data: uncompressed data
+    :param compress_type: one of ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2
+    :param compresslevel: compression level, None for default
+    :return: compressed data with all the information required to write it into archive
+    """
+    crc = zlib.crc32(data)
+    match compress_type:
+        case zipfile.ZIP_STORED:
+            compressed = data
+        case zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel, zlib.DEFLATED, -15
+            )
+            compressed = compressor.compress(data) + compressor.flush()
+        case zipfile.ZIP_BZIP2:
+            compressed = bz2.compress(data, 9 if compresslevel is None else compresslevel)
+        case _:
+            msg = f"Compression method {compress_type} is not supported for precompressed entries"
+            raise ValueError(msg)
+    return CompressedData(compressed, compress_type, len(data), crc)
+
+
+def decompress_data(entry: CompressedData) -> bytes:
+    """
+    Decompress data prepared with `compress_data`.
+
+    :param entry: compressed data
+    :return: uncompressed data
+    """
+    match entry.compress_type:
+        case zipfile.ZIP_STORED:
+            return entry.data
+        case zipfile.ZIP_DEFLATED:
+            return zlib.decompress(entry.data, -15)
+        case zipfile.ZIP_BZIP2:
+            return bz2.decompress(entry.data)
+        case _:
+            msg = f"Compression method {entry.compress_type} is not supported for precompressed entries"
+            raise ValueError(msg)
+
+
+def supports_in_place_update(archive: zipfile.ZipFile) -> bool:
+    """
+    Check if the archive could be updated in place by `write_compressed_entry` and `remove_entries`.
+
+    :param archive: archive opened for writing or in append mode
+    :return: True if zipfile of the running Python version has all the internals the updates rely on
+    """
+    return all(hasattr(archive, x) for x in _ZIPFILE_INTERNALS)
+
+
+def write_compressed_entry(archive: zipfile.ZipFile, name: str, entry: CompressedData) -> zipfile.ZipInfo:
+    """
+    Write precompressed data into the archive without compressing it again.
+
+    If the archive can't be updated in place (see `supports_in_place_update`), the data is decompressed and written with
+    zipfile.ZipFile.writestr, i.e. compressed again with the compression level of the archive.
+
+    :param archive: archive opened for writing
+    :param name: name of the entry
+    :param entry: data prepared with `compress_data`
+    :return: the info of the written entry
+    """
+    zinfo = zipfile.ZipInfo(filename=name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = entry.compress_type
+    zinfo.external_attr = 0o600 << 16  # permissions: ?rw-------
+    zinfo.file_size = entry.file_size
+    zinfo.compress_size = len(entry.data)
+    zinfo.CRC = entry.crc
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+
+    if not archive.fp:
+        msg = "Attempt to write to ZIP archive that was already closed"
+        raise ValueError(msg)
+    if not supports_in_place_update(archive):
+        archive.writestr(zinfo, decompress_data(entry), compresslevel=archive.compresslevel)
+        return zinfo
+    with archive._lock:  # type: ignore[attr-defined]
+        if archive._writing:  # type: ignore[attr-defined]
+            msg = "Can't write to ZIP archive while an open writing handle exists."
+            raise ValueError(msg)
+        if archive._seekable:  # type: ignore[attr-defined]
+            archive.fp.seek(archive.start_dir)  # type: ignore[attr-defined]
+        zinfo.header_offset = archive.fp.tell()
+        archive._writecheck(zinfo)  # type: ignore[attr-defined]
+        archive._didModify = True  # type: ignore[attr-defined]
+        # Sizes and CRC are known in advance, so neither data descriptor nor header rewriting is needed
+        archive.fp.write(zinfo.FileHeader(zip64))
+        archive.fp.write(entry.data)
+        archive.start_dir = archive.fp.tell()  # type: ignore[attr-defined]
+        archive.filelist.append(zinfo)
+        archive.NameToInfo[zinfo.filename] = zinfo
+    return zinfo
+
+
+def remove_entries(archive: zipfile.ZipFile, names: Collection[str]) -> None:
+    """
+    Remove entries from the archive opened for writing or in append mode.
+
+    Entries are removed from the central directory only. If the removed entries are the last ones in the archive,
+    the space they occupy is reused by the entries written afterward (and truncated on close), otherwise it is left
+    unreferenced.
+
+    :param archive: archive opened for writing or in append mode
+    :param names: names of the entries to remove, non-existing ones are ignored
+    :raise NotImplementedError: if the archive can't be updated in place, see `supports_in_place_update`
+    """
+    if archive.mode not in ("a", "w", "x"):
+        msg = "Entries could be removed only from the archive opened for writing or in append mode"
+        raise ValueError(msg)
+    removed = [x for x in archive.filelist if x.filename in names]
+    if not removed:
+        return
+    if not supports_in_place_update(archive):
+        msg = "Removing entries from ZIP archive is not supported by zipfile module of this Python version"
+        raise NotImplementedError(msg)
+    with archive._lock:  # type: ignore[attr-defined]
+        if archive._writing:  # type: ignore[attr-defined]
+            msg = "Can't modify ZIP archive while an open writing handle exists."
+            raise ValueError(msg)
+        remaining = [x for x in archive.filelist if x.filename not in names]
+        archive.filelist[:] = remaining
+        for x in removed:
+            archive.NameToInfo.pop(x.filename, None)
+        archive._didModify = True  # type: ignore[attr-defined]
+        tail_start = min(x.header_offset for x in removed)
+        if archive._seekable and all(x.header_offset < tail_start for x in remaining):  # type: ignore[attr-defined]
+            archive.start_dir = tail_start  # type: ignore[attr-defined]
+
+
+def stored_entry_data_offset(archive_data: mmap.mmap | bytes, zinfo: zipfile.ZipInfo) -> int | None:
+    """
+    Get the offset of the entry content in the archive, if the content is stored as is.
+
+    :param archive_data: the whole archive content, e.g. memory-mapped archive file
+    :param zinfo: the info of the entry
+    :return: offset of the first byte of the content, or None if the entry is compressed or encrypted
+    """
+    if zinfo.compress_type != zipfile.ZIP_STORED or zinfo.flag_bits & 0x1:
+        return None
+    header = _LOCAL_FILE_HEADER.unpack_from(archive_data, zinfo.header_offset)
+    if header[0] != _LOCAL_FILE_HEADER_MAGIC:
+        msg = f"Bad magic number for file header of {zinfo.filename}"
+        raise zipfile.BadZipFile(msg)
+    # The local header has its own file name and extra field, their lengths might differ from the central directory
+    offset = zinfo.header_offset + _LOCAL_FILE_HEADER.size + header[10] + header[11]
+    if offset + zinfo.file_size > len(archive_data):
+        msg = f"Content of {zinfo.filename} is truncated"
+        raise zipfile.BadZipFile(msg)
+    return offset
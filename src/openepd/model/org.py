@@ -159,7 +159,7 @@ class Plant(PlantRef, WithAttachmentsMixin, WithAltIdsMixin):
     @classmethod
     def get_asset_type(cls) -> str | None:
         """Return the asset type of this class (see BaseOpenEpdSchema.get_asset_type for details)."""
-        return "org"
+        return "plant"
 
     @pyd.validator("id")
     def _validate_id(cls, v: str) -> str:
@@ -0,0 +1,290 @@
+#
+#  Copyright 2026 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Generate asynchronous API method groups from the synchronous ones.
+
+Method groups (subclasses of `BaseApiMethodGroup`) of the given ``*sync_api.py`` module are converted as follows:
+
+* Group classes are prefixed with ``Async`` and derived from `AsyncBaseApiMethodGroup`.
+* Calls of the HTTP client (``self._client.*``), of ``self._get_many`` and of the methods of the group which make
+  requests are awaited, and the functions making such calls (methods and nested functions) become coroutines.
+  Methods which don't make requests themselves, e.g. the ones returning a lazy `StreamingListResponse`, stay regular.
+* `StreamingListResponse` is replaced with `AsyncStreamingListResponse`.
+* Other definitions of the module (e.g. response DTOs) are imported from the synchronous module.
+
+The generated code should be formatted afterward, see ``make codegen-async-api``.
+
+Usage:
+
+    python generate_async_api.py src/openepd/api/epd/sync_api.py > src/openepd/api/epd/async_api.py
+"""
+
+import ast
+from collections.abc import Iterable
+from pathlib import Path
+import re
+import sys
+
+BASE_GROUP_CLASS = "BaseApiMethodGroup"
+ASYNC_PREFIX = "Async"
+
+# Names which have asynchronous counterparts
+RENAMED_NAMES = {
+    BASE_GROUP_CLASS: "AsyncBaseApiMethodGroup",
+    "StreamingListResponse": "AsyncStreamingListResponse",
+}
+RENAMED_MODULES = {
+    "openepd.api.base_sync_client": "openepd.api.base_async_client",
+}
+# Coroutine methods of the base classes of the groups
+BASE_ASYNC_METHODS = frozenset({"_get_many"})
+
+GENERATED_NOTE = (
+    "# NB! This is a generated code. Do not edit it manually. Please see tools/openepd/codegen/generate_async_api.py"
+)
+
+
+_SCOPE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+
+
+class _Edit:
+    """Replacement of the source text between the offsets."""
+
+    def __init__(self, start: int, end: int, text: str) -> None:
+        self.start = start
+        self.end = end
+        self.text = text
+
+
+class _Source:
+    """Source code with the means to convert AST positions into offsets."""
+
+    def __init__(self, source: str) -> None:
+        self.text = source
+        self.line_offsets = [0]
+        for line in source.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+
+    def offset(self, lineno: int, col_offset: int) -> int:
+        line_start = self.line_offsets[lineno - 1]
+        # Column offsets of AST are in UTF-8 bytes
+        line = self.text[line_start : self.line_offsets[lineno]]
+        return line_start + len(line.encode("utf-8")[:col_offset].decode("utf-8"))
+
+    def start(self, node: ast.AST) -> int:
+        return self.offset(node.lineno, node.col_offset)  # type: ignore[attr-defined]
+
+    def end(self, node: ast.AST) -> int:
+        return self.offset(node.end_lineno, node.end_col_offset)  # type: ignore[attr-defined]
+
+
+def _is_method_group(node: ast.stmt) -> bool:
+    return isinstance(node, ast.ClassDef) and any(
+        isinstance(base, ast.Name) and base.id == BASE_GROUP_CLASS for base in node.bases
+    )
+
+
+def _iter_own_nodes(func: ast.FunctionDef | ast.AsyncFunctionDef) -> Iterable[ast.AST]:
+    """Iterate over the nodes of the function body, excluding nested functions and classes."""
+    stack: list[ast.AST] = [func]
+    while stack:
+        node = stack.pop()
+        if node is not func:
+            yield node
+        stack.extend(x for x in ast.iter_child_nodes(node) if not isinstance(x, _SCOPE_NODES))
+
+
+def _iter_functions(func: ast.FunctionDef) -> Iterable[ast.FunctionDef]:
+    """Iterate over the function and all the functions nested in it."""
+    yield func
+    for node in ast.walk(func):
+        if node is not func and isinstance(node, ast.FunctionDef):
+            yield node
+
+
+def _get_self_call(node: ast.AST) -> str | None:
+    """Get the name of the method called on ``self``, or ``_client`` for the calls of the HTTP client."""
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+        return None
+    target = node.func.value
+    if isinstance(target, ast.Name) and target.id == "self":
+        return node.func.attr
+    if (
+        isinstance(target, ast.Attribute)
+        and target.attr == "_client"
+        and isinstance(target.value, ast.Name)
+        and target.value.id == "self"
+    ):
+        return "_client"
+    return None
+
+
+def _get_awaited_calls(func: ast.FunctionDef, async_methods: set[str]) -> list[ast.Call]:
+    return [
+        node  # type: ignore[misc]
+        for node in _iter_own_nodes(func)
+        if (name := _get_self_call(node)) is not None and (name == "_client" or name in async_methods)
+    ]
+
+
+def _get_async_methods(group: ast.ClassDef) -> set[str]:
+    """Get the names of the methods of the group which make requests, directly or via other methods."""
+    methods = [x for x in group.body if isinstance(x, ast.FunctionDef)]
+    async_methods = set(BASE_ASYNC_METHODS)
+    while True:
+        found = {x.name for x in methods if _get_awaited_calls(x, async_methods)}
+        if found <= async_methods:
+            return async_methods
+        async_methods |= found
+
+
+def _get_parents(tree: ast.AST) -> dict[ast.AST, ast.AST]:
+    return {child: node for node in ast.walk(tree) for child in ast.iter_child_nodes(node)}
+
+
+def _convert_group(source: _Source, group: ast.ClassDef, parents: dict[ast.AST, ast.AST]) -> str:
+    """Get the source code of the asynchronous counterpart of the method group."""
+    async_methods = _get_async_methods(group)
+    edits: list[_Edit] = []
+
+    functions = [y for x in group.body if isinstance(x, ast.FunctionDef) for y in _iter_functions(x)]
+    for func in functions:
+        awaited = _get_awaited_calls(func, async_methods)
+        is_method = parents.get(func) is group
+        # Overloads of the methods making requests have no requests themselves
+        if not awaited and not (is_method and func.name in async_methods):
+            continue
+        def_offset = source.start(func)
+        edits.append(_Edit(def_offset, def_offset, "async "))
+        for call in awaited:
+            parent = parents.get(call)
+            start, end = source.start(call), source.end(call)
+            if isinstance(parent, ast.Attribute | ast.Subscript) or (
+                isinstance(parent, ast.Call) and parent.func is call
+            ):
+                edits.append(_Edit(start, start, "(await "))
+                edits.append(_Edit(end, end, ")"))
+            else:
+                edits.append(_Edit(start, start, "await "))
+
+    docstring = group.body[0] if group.body else None
+    if isinstance(docstring, ast.Expr) and isinstance(docstring.value, ast.Constant):
+        doc_start = source.start(docstring)
+        match = re.compile(r'[rRuU]?("""|\'\'\'|"|\')\s*').match(source.text, doc_start)
+        if match is not None:
+            first = match.end()
+            word = source.text[first : first + 2]
+            # Acronyms (e.g. API) keep their case
+            replacement = word if word.isupper() else word[0].lower() + word[1:]
+            edits.append(_Edit(first, first + len(word), f"Asynchronous {replacement}"))
+
+    first_line = min([group.lineno, *(x.lineno for x in group.decorator_list)])
+    start = source.line_offsets[first_line - 1]
+    end = source.line_offsets[group.end_lineno]  # type: ignore[index]
+    text = source.text[start:end]
+    for edit in sorted(edits, key=lambda x: x.start, reverse=True):
+        text = text[: edit.start - start] + edit.text + text[edit.end - start :]
+
+    renames = {**RENAMED_NAMES, group.name: ASYNC_PREFIX + group.name}
+    return re.sub(r"\b(" + "|".join(map(re.escape, renames)) + r")\b", lambda m: renames[m.group(1)], text)
+
+
+def _get_defined_names(node: ast.stmt) -> list[str]:
+    if isinstance(node, ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        return [x.id for x in node.targets if isinstance(x, ast.Name)]
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return [node.target.id]
+    return []
+
+
+def _get_used_names(source: str) -> set[str]:
+    return {x.id for x in ast.walk(ast.parse(source)) if isinstance(x, ast.Name)}
+
+
+def _convert_imports(imports: list[ast.Import | ast.ImportFrom], used: set[str]) -> list[ast.stmt]:
+    result: list[ast.stmt] = []
+    for node in imports:
+        aliases = [
+            ast.alias(name=RENAMED_NAMES.get(x.name, x.name), asname=x.asname)
+            for x in node.names
+            if RENAMED_NAMES.get(x.asname or x.name, x.asname or x.name) in used
+        ]
+        if not aliases:
+            continue
+        if isinstance(node, ast.ImportFrom):
+            module = RENAMED_MODULES.get(node.module or "", node.module)
+            result.append(ast.ImportFrom(module=module, names=aliases, level=node.level))
+        else:
+            result.append(ast.Import(names=aliases))
+    return result
+
+
+def generate_async_api(source: str, sync_module: str) -> str:
+    """
+    Generate the module with asynchronous method groups.
+
+    :param source: source code of the module with synchronous method groups
+    :param sync_module: name of the module with synchronous method groups, to import other definitions from
+    :return: source code of the module with asynchronous method groups
+    """
+    src = _Source(source)
+    tree = ast.parse(source)
+    parents = _get_parents(tree)
+    groups = [x for x in tree.body if isinstance(x, ast.ClassDef) and _is_method_group(x)]
+    if not groups:
+        msg = f"No method groups found in {sync_module}"
+        raise ValueError(msg)
+    imports = [x for x in tree.body if isinstance(x, ast.Import | ast.ImportFrom)]
+    other_names = [
+        name for x in tree.body if not _is_method_group(x) and x not in imports for name in _get_defined_names(x)
+    ]
+
+    converted = [_convert_group(src, x, parents) for x in groups]
+    used = _get_used_names("".join(converted))
+    import_nodes = _convert_imports(imports, used)
+    imported_from_sync = sorted(x for x in other_names if x in used)
+    if imported_from_sync:
+        import_nodes.append(
+            ast.ImportFrom(module=sync_module, names=[ast.alias(name=x) for x in imported_from_sync], level=0)
+        )
+
+    header = "".join(
+        line for line in source.splitlines(keepends=True)[: tree.body[0].lineno - 1] if line.startswith("#")
+    )
+    parts = [
+        header + GENERATED_NOTE + "\n",
+        "\n".join(ast.unparse(x) for x in import_nodes) + "\n",
+        *converted,
+    ]
+    return "\n\n".join(x.rstrip("\n") + "\n" for x in parts)
+
+
+def get_module_name(path: Path) -> str:
+    """Get the name of the module by its path within the ``src`` directory."""
+    parts = path.resolve().with_suffix("").parts
+    return ".".join(parts[len(parts) - parts[::-1].index("src") :])
+
+
+def main() -> None:
+    """Generate and print the asynchronous counterpart of the module given as the argument."""
+    path = Path(sys.argv[1])
+    print(generate_async_api(path.read_text(), get_module_name(path)), end="")
+
+
+if __name__ == "__main__":
+    main()